@@ -67,10 +67,11 @@ setup(
                 "reldata",
                 "reldata.data",
                 "reldata.io",
+                "reldata.ml",
                 "reldata.util",
                 "reldata.vocab"
         ],
-        python_requires=">=3",
+        python_requires=">=3.7",
         url="https://github.com/phohenecker/rel-data",
         version="2017.1"
 )
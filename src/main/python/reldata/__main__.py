@@ -13,6 +13,7 @@ import argmagic
 from argmagic import decorators
 
 from reldata import io
+from reldata.data import status as st
 from reldata.io import kg_reader
 
 
@@ -243,28 +244,18 @@ def main(args: _Config) -> None:
             if l.name not in literals:
                 literals[l.name] = 0
         
-        # iterate over all individuals
-        for ind in kg.individuals:
-            
-            # register all of the individuals class memberships
-            for cls_mem in ind.classes:
-                if cls_mem.inferred:
-                    if cls_mem.is_member:
-                        classes[cls_mem.cls.name].inf_pos += 1
-                    else:
-                        classes[cls_mem.cls.name].inf_neg += 1
-                elif cls_mem.prediction:
-                    if cls_mem.is_member:
-                        classes[cls_mem.cls.name].pred_pos += 1
-                    else:
-                        classes[cls_mem.cls.name].pred_neg += 1
-                else:
-                    if cls_mem.is_member:
-                        classes[cls_mem.cls.name].spec_pos += 1
-                    else:
-                        classes[cls_mem.cls.name].spec_neg += 1
+        # register all class memberships by reading the counts from the graph's class index
+        for c in kg.classes:
+            stats = classes[c.name]
+            stats.spec_pos += kg.class_index.count(c, is_member=True, status=st.FACT)
+            stats.spec_neg += kg.class_index.count(c, is_member=False, status=st.FACT)
+            stats.inf_pos += kg.class_index.count(c, is_member=True, status=st.INFERRED)
+            stats.inf_neg += kg.class_index.count(c, is_member=False, status=st.INFERRED)
+            stats.pred_pos += kg.class_index.count(c, is_member=True, status=st.PREDICTION)
+            stats.pred_neg += kg.class_index.count(c, is_member=False, status=st.PREDICTION)
         
-            # register all of the individuals literals
+        # register all of the individuals' literals
+        for ind in kg.individuals:
             for lit in ind.literals:
                 literals[lit.literal.name] += 1
         
@@ -3,15 +3,29 @@
 """This package provides classes for specifying the actual data, both factual and inferred, in a knowledge graph."""
 
 
+from reldata.data.adjacency_cache import AdjacencyCache
 from reldata.data.base_individual import BaseIndividual
+from reldata.data.class_index import ClassIndex
 from reldata.data.class_membership import ClassMembership
 from reldata.data.data_context import DataContext
 from reldata.data.data_context import new_context
 from reldata.data.individual import Individual
 from reldata.data.individual_factory import IndividualFactory
+from reldata.data.kg_arrays import KgArrays
+from reldata.data.kg_diff import KgDiff
+from reldata.data.kg_query import KgQuery
+from reldata.data.kg_view import KgView
 from reldata.data.knowledge_graph import KnowledgeGraph
+from reldata.data.literal_store import LiteralColumn
+from reldata.data.literal_store import LiteralStore
 from reldata.data.literal_value import LiteralValue
+from reldata.data.membership_store import MembershipStore
+from reldata.data.subgraph_extractor import SubgraphExtractor
+from reldata.data.temporal_knowledge_graph import TemporalKnowledgeGraph
 from reldata.data.triple import Triple
+from reldata.data.triple_index import TripleIndex
+from reldata.data.triple_store import TripleStore
+from reldata.data.vocab_alignment import VocabAlignment
 
 
 __author__ = "Patrick Hohenecker"
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import status as st
+from reldata.data import triple
+from reldata.data import triple_store
+from reldata.util import set_observer
+from reldata.vocab import relation_type
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class AdjacencyCache(set_observer.SetObserver):
+    """Provides the adjacency matrices of the relations of a knowledge graph as sparse index arrays.
+    
+    There is one adjacency matrix of shape individuals x individuals for every relation, status code, and polarity,
+    i.e., positive and negative triples are kept apart. Each matrix is available both in coordinate format (COO), as
+    rows and columns of its nonzero entries, and in compressed sparse row format (CSR), as index pointers and column
+    indices. Both of these are compatible with ``scipy.sparse``, which is not required, though:
+        
+        indptr, indices = kg.adjacency.csr(some_relation)
+        matrix = scipy.sparse.csr_matrix((np.ones(len(indices)), indices, indptr), shape=kg.adjacency.shape)
+    
+    An ``AdjacencyCache`` observes the triples of the :class:`knowledge_graph.KnowledgeGraph` that it belongs to. The
+    first request builds all of the matrices at once, and all of them are cached subsequently. Whenever triples are
+    added or removed, the observer hooks splice their entries into the COO encodings of the affected matrices, which
+    takes time linear in the sizes of these matrices rather than in the number of triples of the graph, and only the
+    CSR encodings of the affected matrices are rebuilt on demand.
+    """
+    
+    _EMPTY = np.zeros(0, dtype=np.int64)
+    """``numpy.ndarray``: An empty index vector."""
+    
+    def __init__(self, kg):
+        """Creates a new ``AdjacencyCache``.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The graph whose adjacency matrices are provided.
+        """
+        self._built = False  # indicates whether all matrices have been built since the last clear
+        self._coo = {}       # maps keys of matrices to their COO encodings
+        self._csr = {}       # maps keys of matrices to their CSR encodings and the number of rows they were built for
+        self._kg = kg
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def shape(self) -> typing.Tuple[int, int]:
+        """tuple[int, int]: The shape of every adjacency matrix, which is determined by the largest index of any
+        individual in the graph."""
+        num_individuals = self._kg.memberships.shape[0]
+        return num_individuals, num_individuals
+    
+    #  METHODS  ########################################################################################################
+    
+    def _build_all(self) -> None:
+        """Builds the COO encodings of all adjacency matrices at once."""
+        # sort all triples by the keys of their matrices, subjects, and objects
+        key_columns = [
+                triple_store.TripleStore.PREDICATE,
+                triple_store.TripleStore.STATUS,
+                triple_store.TripleStore.POSITIVE
+        ]
+        data = self._kg.triple_store.array()
+        sort_columns = key_columns + [triple_store.TripleStore.SUBJECT, triple_store.TripleStore.OBJECT]
+        data = data[np.lexsort(data[:, sort_columns[::-1]].T)]
+        
+        # split the sorted triples into the groups that belong to the same matrices
+        self._coo.clear()
+        self._csr.clear()
+        if len(data) > 0:
+            keys = data[:, key_columns]
+            boundaries = np.flatnonzero(np.any(keys[1:] != keys[:-1], axis=1)) + 1
+            for start, end in zip(np.concatenate([[0], boundaries]), np.concatenate([boundaries, [len(data)]])):
+                self._coo[tuple(keys[start].tolist())] = self._read_only(
+                        data[start:end, triple_store.TripleStore.SUBJECT],
+                        data[start:end, triple_store.TripleStore.OBJECT]
+                )
+        self._built = True
+    
+    @staticmethod
+    def _key(
+            relation: typing.Union[relation_type.RelationType, int],
+            status: int,
+            positive: bool
+    ) -> typing.Tuple[int, int, int]:
+        """Computes the key of an adjacency matrix."""
+        if isinstance(relation, relation_type.RelationType):
+            relation = relation.index
+        return int(relation), int(status), int(positive)
+    
+    @staticmethod
+    def _read_only(*arrays: np.ndarray) -> typing.Tuple[np.ndarray, ...]:
+        """Creates read-only copies of the provided arrays."""
+        results = []
+        for a in arrays:
+            a = np.ascontiguousarray(a)
+            a.flags.writeable = False
+            results.append(a)
+        return tuple(results)
+    
+    def _splice(self, key: typing.Tuple[int, int, int], rows: np.ndarray, cols: np.ndarray, add: bool) -> None:
+        """Inserts entries into or removes them from the COO encoding of a single adjacency matrix."""
+        old_rows, old_cols = self._coo.get(key, (self._EMPTY, self._EMPTY))
+        
+        # compute keys of all entries that preserve the order by rows and columns
+        num_cols = max(int(old_cols.max()) if len(old_cols) > 0 else 0, int(cols.max())) + 1
+        old_keys = old_rows * num_cols + old_cols
+        new_keys = rows * num_cols + cols
+        order = np.argsort(new_keys)
+        rows, cols, new_keys = rows[order], cols[order], new_keys[order]
+        
+        # locate the new entries among the existing ones, and splice them in or out
+        positions = np.searchsorted(old_keys, new_keys)
+        if add:
+            self._coo[key] = self._read_only(np.insert(old_rows, positions, rows), np.insert(old_cols, positions, cols))
+        else:
+            found = positions < len(old_keys)
+            found[found] = old_keys[positions[found]] == new_keys[found]
+            positions = positions[found]
+            self._coo[key] = self._read_only(np.delete(old_rows, positions), np.delete(old_cols, positions))
+    
+    def _update(self, triples: typing.Iterable[triple.Triple], add: bool) -> None:
+        """Splices a batch of triples that have been added or removed into the cached matrices."""
+        # group the subjects and objects of the triples by the keys of their matrices
+        entries = {}
+        for t in triples:
+            key = (t.predicate.index, st.of(t), int(t.positive))
+            entries.setdefault(key, []).append((t.subject.index, t.object.index))
+            self._csr.pop(key, None)
+        
+        if self._built:  # -> otherwise, all matrices are built on demand anyway
+            for key, pairs in entries.items():
+                pairs = np.array(pairs, dtype=np.int64)
+                self._splice(key, pairs[:, 0], pairs[:, 1], add)
+    
+    def clear(self) -> None:
+        """Drops all adjacency matrices from the cache."""
+        self._built = False
+        self._coo.clear()
+        self._csr.clear()
+    
+    def coo(
+            self,
+            relation: typing.Union[relation_type.RelationType, int],
+            status: int = st.FACT,
+            positive: bool = True
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Retrieves an adjacency matrix in COO format.
+        
+        Args:
+            relation (:class:`relation_type.RelationType` or int): The relation (or its index) to retrieve the matrix
+                for.
+            status (int, optional): The status code of the considered triples. This defaults to facts.
+            positive (bool, optional): Indicates whether the matrix of positive or negative triples is retrieved. This
+                defaults to ``True``.
+        
+        Returns:
+            tuple[``numpy.ndarray``, ``numpy.ndarray``]: The read-only ``int64`` row and column indices of the nonzero
+                entries, i.e., the subjects and objects of the according triples, sorted by rows and columns.
+        """
+        key = self._key(relation, status, positive)
+        if not self._built:
+            self._build_all()
+        coo = self._coo.get(key)
+        if coo is None:  # -> there are no such triples
+            coo = self._read_only(self._EMPTY, self._EMPTY)
+            self._coo[key] = coo
+        return coo
+    
+    def csr(
+            self,
+            relation: typing.Union[relation_type.RelationType, int],
+            status: int = st.FACT,
+            positive: bool = True
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Retrieves an adjacency matrix in CSR format.
+        
+        Args:
+            relation (:class:`relation_type.RelationType` or int): The relation (or its index) to retrieve the matrix
+                for.
+            status (int, optional): The status code of the considered triples. This defaults to facts.
+            positive (bool, optional): Indicates whether the matrix of positive or negative triples is retrieved. This
+                defaults to ``True``.
+        
+        Returns:
+            tuple[``numpy.ndarray``, ``numpy.ndarray``]: The read-only ``int64`` index pointers, a vector of length
+                individuals + 1, and column indices of the matrix. The objects of all triples with subject i are
+                ``indices[indptr[i]:indptr[i + 1]]``.
+        """
+        key = self._key(relation, status, positive)
+        num_rows = self.shape[0]
+        entry = self._csr.get(key)
+        if entry is None or entry[0] != num_rows:
+            rows, cols = self.coo(relation, status=status, positive=positive)
+            indptr = np.zeros(num_rows + 1, dtype=np.int64)
+            np.cumsum(np.bincount(rows, minlength=num_rows), out=indptr[1:])
+            entry = (num_rows, *self._read_only(indptr, cols))
+            self._csr[key] = entry
+        return entry[1], entry[2]
+    
+    def element_added(self, elem) -> None:
+        self._update([elem], True)
+    
+    def element_removed(self, elem) -> None:
+        self._update([elem], False)
+    
+    def elements_added(self, elements: typing.Sequence) -> None:
+        self._update(elements, True)
+    
+    def elements_removed(self, elements: typing.Sequence) -> None:
+        self._update(elements, False)
@@ -61,12 +61,20 @@ class BaseIndividual(individual.Individual, set_observer.SetObserver):
         self._index = None
         self._literals = observable_set.ObservableSet(literal_value.LiteralValue)
         self._name = None
-        self._observers = []
+        self._observers = {}  # all registered observers by their ids
         
         # make BaseIndividual an observer of the class/literal set
         self._classes.add_observer(self)
         self._literals.add_observer(self)
     
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        
+        # observers are stored by their ids, which change when they are unpickled
+        self._observers = {id(obs): obs for obs in self._observers.values()}
+    
     #  PROPERTIES  #####################################################################################################
 
     @property
@@ -89,25 +97,49 @@ class BaseIndividual(individual.Individual, set_observer.SetObserver):
     
     def add_observer(self, obs: individual_observer.IndividualObserver) -> None:
         insanity.sanitize_type("obs", obs, individual_observer.IndividualObserver)
-        if obs not in self._observers:
-            self._observers.append(obs)
+        self._observers.setdefault(id(obs), obs)
     
     def element_added(self, elem):
         if isinstance(elem, class_membership.ClassMembership):
-            for obs in self._observers:
+            for obs in self._observers.values():
                 obs.class_added(self, elem)
         elif isinstance(elem, literal_value.LiteralValue):
-            for obs in self._observers:
+            for obs in self._observers.values():
                 obs.literal_added(self, elem)
 
     def element_removed(self, elem):
         if isinstance(elem, class_membership.ClassMembership):
-            for obs in self._observers:
+            for obs in self._observers.values():
                 obs.class_removed(self, elem)
         elif isinstance(elem, literal_value.LiteralValue):
-            for obs in self._observers:
+            for obs in self._observers.values():
                 obs.literal_removed(self, elem)
     
+    def elements_added(self, elements):
+        # all elements of a batch stem from the same set, and are thus of the same type
+        if not elements:
+            return
+        if isinstance(elements[0], class_membership.ClassMembership):
+            for obs in self._observers.values():
+                for elem in elements:
+                    obs.class_added(self, elem)
+        elif isinstance(elements[0], literal_value.LiteralValue):
+            for obs in self._observers.values():
+                for elem in elements:
+                    obs.literal_added(self, elem)
+    
+    def elements_removed(self, elements):
+        # all elements of a batch stem from the same set, and are thus of the same type
+        if not elements:
+            return
+        if isinstance(elements[0], class_membership.ClassMembership):
+            for obs in self._observers.values():
+                for elem in elements:
+                    obs.class_removed(self, elem)
+        elif isinstance(elements[0], literal_value.LiteralValue):
+            for obs in self._observers.values():
+                for elem in elements:
+                    obs.literal_removed(self, elem)
+    
     def remove_observer(self, obs: individual_observer.IndividualObserver) -> None:
-        if obs in self._observers:
-            self._observers.remove(obs)
+        self._observers.pop(id(obs), None)
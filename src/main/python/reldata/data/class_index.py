@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import membership_store
+from reldata.data import status as st
+from reldata.vocab import class_type
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ClassIndex(object):
+    """An inverted index that maps classes to the individuals that are specified as members or non-members of them.
+    
+    A ``ClassIndex`` does not store any data of its own, but is derived from the membership matrices of a
+    :class:`membership_store.MembershipStore`: the members (or non-members) of a class are given by the cells of the
+    according column that are ``1`` (or ``-1``). For every class, polarity, and status, the index thus provides a
+    boolean mask over all individuals, which allows for computing unions, intersections, and differences of such sets
+    by means of vectorized operations without iterating over any individuals. As the masks are computed from the
+    matrices on demand, the index is always up to date, and updating memberships costs O(1). Counts for a single status
+    code are read from the counters of the membership store, and thus cost O(1) as well.
+    """
+    
+    def __init__(self, memberships: membership_store.MembershipStore):
+        """Creates a new ``ClassIndex``.
+        
+        Args:
+            memberships (:class:`membership_store.MembershipStore`): The membership store that the index is derived
+                from.
+        """
+        self._memberships = memberships
+    
+    #  METHODS  ########################################################################################################
+    
+    def count(
+            self,
+            cls: typing.Union[class_type.ClassType, int],
+            is_member: bool = True,
+            status: int = None
+    ) -> int:
+        """Counts the individuals that have the specified kind of membership of a class.
+        
+        Args:
+            cls (:class:`class_type.ClassType` or int): The class (or its index) to count individuals for.
+            is_member (bool, optional): Indicates whether to count members (the default) or non-members.
+            status (int, optional): The status code (cf. :mod:`reldata.data.status`) of the considered memberships. If
+                this is not provided, then the individuals are counted irrespective of the status of their memberships.
+        
+        Returns:
+            int: The number of individuals.
+        """
+        if status is not None:  # -> the counts are maintained by the membership store
+            return self._memberships.count(cls, is_member=is_member, status=status)
+        return int(np.count_nonzero(self.mask(cls, is_member=is_member, status=status)))
+    
+    def difference(
+            self,
+            cls: typing.Union[class_type.ClassType, int],
+            others: typing.Iterable[typing.Union[class_type.ClassType, int]],
+            is_member: bool = True,
+            status: int = None
+    ) -> np.ndarray:
+        """Retrieves all individuals that have the specified kind of membership of one class but not of any other of the
+        provided ones, e.g., all members of class A that are not members of class B.
+        
+        Args:
+            cls (:class:`class_type.ClassType` or int): The class whose individuals are retrieved.
+            others (iterable): The classes whose individuals are excluded.
+            is_member (bool, optional): Indicates whether to consider memberships (the default) or non-memberships.
+            status (int, optional): The status code of the considered memberships, or ``None`` for any status.
+        
+        Returns:
+            ``numpy.ndarray``: The sorted indices of the retrieved individuals.
+        """
+        mask = self.mask(cls, is_member=is_member, status=status)
+        for c in others:
+            mask &= ~self.mask(c, is_member=is_member, status=status)
+        return self.to_indices(mask)
+    
+    def individuals(
+            self,
+            cls: typing.Union[class_type.ClassType, int],
+            is_member: bool = True,
+            status: int = None
+    ) -> np.ndarray:
+        """Retrieves the individuals that have the specified kind of membership of a class.
+        
+        Args:
+            cls (:class:`class_type.ClassType` or int): The class (or its index) to retrieve individuals for.
+            is_member (bool, optional): Indicates whether to retrieve members (the default) or non-members.
+            status (int, optional): The status code of the considered memberships, or ``None`` for any status.
+        
+        Returns:
+            ``numpy.ndarray``: The sorted indices of the retrieved individuals.
+        """
+        return self.to_indices(self.mask(cls, is_member=is_member, status=status))
+    
+    def intersection(
+            self,
+            classes: typing.Iterable[typing.Union[class_type.ClassType, int]],
+            is_member: bool = True,
+            status: int = None
+    ) -> np.ndarray:
+        """Retrieves the individuals that have the specified kind of membership of all of the provided classes.
+        
+        Args:
+            classes (iterable): The classes (or their indices) to consider.
+            is_member (bool, optional): Indicates whether to consider memberships (the default) or non-memberships.
+            status (int, optional): The status code of the considered memberships, or ``None`` for any status.
+        
+        Returns:
+            ``numpy.ndarray``: The sorted indices of the retrieved individuals.
+        """
+        mask = None
+        for c in classes:
+            if mask is None:
+                mask = self.mask(c, is_member=is_member, status=status)
+            else:
+                mask &= self.mask(c, is_member=is_member, status=status)
+        return self.to_indices(np.zeros(0, dtype=bool) if mask is None else mask)
+    
+    def mask(
+            self,
+            cls: typing.Union[class_type.ClassType, int],
+            is_member: bool = True,
+            status: typing.Union[int, typing.Iterable[int]] = None
+    ) -> np.ndarray:
+        """Retrieves a mask of all individuals that have the specified kind of membership of a class.
+        
+        Args:
+            cls (:class:`class_type.ClassType` or int): The class (or its index) to retrieve the mask for.
+            is_member (bool, optional): Indicates whether to consider memberships (the default) or non-memberships.
+            status (int or iterable[int], optional): The status code(s) (cf. :mod:`reldata.data.status`) of the
+                considered memberships. If this is not provided, then memberships of any status are considered.
+        
+        Returns:
+            ``numpy.ndarray``: A new boolean vector whose i-th element is ``True`` if the individual with index i
+                satisfies the specified criteria.
+        """
+        value = 1 if is_member else -1
+        if status is None:
+            status = st.ALL
+        elif isinstance(status, int):
+            status = [status]
+        
+        mask = np.zeros(self._memberships.shape[0], dtype=bool)
+        for s in status:
+            mask |= self._memberships.column(cls, status=s) == value
+        return mask
+    
+    @staticmethod
+    def to_indices(mask: np.ndarray) -> np.ndarray:
+        """Converts a mask of individuals into their indices.
+        
+        Args:
+            mask (``numpy.ndarray``): The boolean mask to convert.
+        
+        Returns:
+            ``numpy.ndarray``: The indices of all elements of ``mask`` that are ``True`` in ascending order.
+        """
+        return np.flatnonzero(mask).astype(np.int64)
+    
+    def union(
+            self,
+            classes: typing.Iterable[typing.Union[class_type.ClassType, int]],
+            is_member: bool = True,
+            status: int = None
+    ) -> np.ndarray:
+        """Retrieves the individuals that have the specified kind of membership of at least one of the provided classes.
+        
+        Args:
+            classes (iterable): The classes (or their indices) to consider.
+            is_member (bool, optional): Indicates whether to consider memberships (the default) or non-memberships.
+            status (int, optional): The status code of the considered memberships, or ``None`` for any status.
+        
+        Returns:
+            ``numpy.ndarray``: The sorted indices of the retrieved individuals.
+        """
+        mask = np.zeros(self._memberships.shape[0], dtype=bool)
+        for c in classes:
+            mask |= self.mask(c, is_member=is_member, status=status)
+        return self.to_indices(mask)
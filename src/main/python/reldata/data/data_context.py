@@ -1,12 +1,10 @@
 # -*- coding: utf-8 -*-
 
 
+import contextvars
 import functools
-import threading
 import typing
 
-from reldata.util import sync
-
 
 __author__ = "Patrick Hohenecker"
 __copyright__ = (
@@ -62,10 +60,10 @@ class DataContext(object):
     as a current state in the creation of a knowledge graph, and may be used to store according data, which is what all
     of the factories in ``reldata`` do.
     
-    At any time, there is exactly one active ``DataContext``, which is accessible via the class method
-    :meth:``DataContext.get_context``. If you want to make use of a different than the default context, then you can
-    create a new instance of ``DataContext``, and wrap the code that is supposed to run in this fresh context with a
-    ``with`` block:
+    At any time, there is exactly one active ``DataContext`` per thread (and per ``asyncio`` task), which is accessible
+    via the class method :meth:``DataContext.get_context``. If you want to make use of a different than the default
+    context, then you can create a new instance of ``DataContext``, and wrap the code that is supposed to run in this
+    fresh context with a ``with`` block:
     
         from reldata.data import data_context as dc
         
@@ -81,63 +79,44 @@ class DataContext(object):
             # this parts is executed in a fresh context
             ...
     
+    Active contexts are tracked by means of a ``contextvars.ContextVar``. Therefore, retrieving the active context does
+    not require any locking, each thread starts out with a default context of its own, and ``asyncio`` tasks inherit the
+    context that was active when they were created, while contexts entered inside a task do not leak into other tasks.
+    
     Finally, notice that you can always reset a ``DataContext`` by means of the provided :meth:`clear` method. For the
     currently active context, this is invoked as ``DataContext.get_context().clear()``.
     """
     
-    _current_context = dict()
-    """dict[int, DataContext]: The currently active contexts for all threads identifiers."""
+    _current_context = contextvars.ContextVar("reldata.data.data_context.DataContext")
+    """contextvars.ContextVar: Stores the currently active context."""
     
     #  CONSTRUCTOR  ####################################################################################################
         
     def __init__(self):
         """Creates a new empty ``DataContext``."""
-        self._data = dict()                      # stores the data in the context
-        self._last_context = None                # stores previous context if the current one is used in a with block
-        self._thread_id = self._get_thread_id()  # the ID of the thread that context lives in
+        self._data = dict()  # stores the data in the context
+        self._tokens = []    # tokens for reinstating the previously active contexts when with blocks are left
     
     #  MAGIC FUNCTIONS  ################################################################################################
     
     def __enter__(self):
-        # store active context
-        if self._thread_id in DataContext._current_context:
-            self._last_context = DataContext._current_context[self._thread_id]
-        # make self the active context
-        DataContext._current_context[self._thread_id] = self
+        # make self the active context, and remember how to reinstate the previous one
+        self._tokens.append(DataContext._current_context.set(self))
         
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         # reinstate previously active context
-        if self._last_context is not None:
-            DataContext._current_context[self._thread_id] = self._last_context
-        else:
-            del DataContext._current_context[self._thread_id]
-        
-        self._last_context = None
+        DataContext._current_context.reset(self._tokens.pop())
     
     def __getitem__(self, item):
-        if item in self._data:
-            return self._data[item]
-        else:
-            return None
+        return self._data.get(item)
     
     def __setitem__(self, key, value):
         self._data[key] = value
     
     #  METHODS  ########################################################################################################
     
-    @staticmethod
-    def _get_thread_id() -> int:
-        """Retrieves a unique identifier for the thread that the object that invokes this method lives in.
-        
-        Returns:
-            int: The ID.
-        """
-        # NOTICE:
-        # we do not use threading.get_ident() to identify a thread, as Python recycles these identifiers
-        return id(threading.current_thread())
-
     def clear(self):
         """Resets a ``DataContext`` to its initial state.
 
@@ -146,17 +125,17 @@ class DataContext(object):
         self._data.clear()
     
     @classmethod
-    @sync.synchronized
     def get_context(cls):
-        """Retrieves the currently active context for the Thread that invoked this method.
+        """Retrieves the currently active context for the thread or ``asyncio`` task that invoked this method.
         
         Returns:
             DataContext: The context.
         """
-        # create context for current thread if there is none yet
-        thread_id = cls._get_thread_id()
-        if thread_id not in cls._current_context:
-            cls._current_context[thread_id] = DataContext()
+        ctx = cls._current_context.get(None)
+        
+        # create a default context if there is none yet
+        if ctx is None:
+            ctx = DataContext()
+            cls._current_context.set(ctx)
         
-        # return the requested DataContext
-        return cls._current_context[thread_id]
+        return ctx
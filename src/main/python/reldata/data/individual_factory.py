@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 
+import sys
 import typing
 
 import insanity
@@ -80,10 +81,32 @@ class IndividualFactory(object):
     #  METHODS  ########################################################################################################
     
     @classmethod
-    def _prepare_context(cls):
-        if dc.DataContext.get_context()[cls._LAST_INDEX] is None:
+    def _prepare_context(cls) -> dc.DataContext:
+        """Retrieves the currently active context, and initializes it for the factory if necessary.
+        
+        Returns:
+            :class:`dc.DataContext`: The context.
+        """
+        ctx = dc.DataContext.get_context()
+        if ctx[cls._LAST_INDEX] is None:
             cls.reset()
+        return ctx
 
+    @staticmethod
+    def _sanitize_target_type(target_type: typing.Optional[type]) -> None:
+        """Ensures that the provided ``target_type`` is either ``None`` or a subclass of :class:`individual.Individual`.
+        
+        Raises:
+            ValueError: If ``target_type`` is not a subclass of :class:`individual.Individual`.
+        """
+        insanity.sanitize_type("target_type", target_type, type, none_allowed=True)
+        if target_type is not None and not issubclass(target_type, individual.Individual):
+            raise ValueError(
+                    "The provided <target_type> is not a subclass of reldata.individual.Individual: {}!".format(
+                            target_type
+                    )
+            )
+    
     @classmethod
     def create_individual(
             cls,
@@ -121,22 +144,13 @@ class IndividualFactory(object):
                 a provided ``target_type`` is not a subclass of :class:`individual.Individual`.
         """
         # sanitize target type
-        insanity.sanitize_type("target_type", target_type, type, none_allowed=True)
-        if target_type is not None and not issubclass(target_type, individual.Individual):
-            raise ValueError(
-                    "The provided <target_type> is not a subclass of reldata.individual.Individual: {}!".format(
-                            target_type
-                    )
-            )
-        
-        # ensure that the name is a string
-        name = str(name)
+        cls._sanitize_target_type(target_type)
         
-        # prepare context if necessary
-        cls._prepare_context()
+        # ensure that the name is an interned string
+        name = sys.intern(str(name))
         
-        # fetch current context
-        ctx = dc.DataContext.get_context()
+        # fetch current context, and prepare it if necessary
+        ctx = cls._prepare_context()
         
         # sanitize name if configured to do so
         if cls.check_names:
@@ -153,6 +167,69 @@ class IndividualFactory(object):
             kwargs = {} if kwargs is None else kwargs
             return target_type(ctx[cls._LAST_INDEX], name, *args, **kwargs)
     
+    @classmethod
+    def create_individuals(
+            cls,
+            names: typing.Iterable[str],
+            target_type: typing.Type[T]=None,
+            args: typing.Iterable=None,
+            kwargs: typing.Dict[str, typing.Any]=None
+    ) -> typing.List[T]:
+        """Constructs instances of :class:`individual.Individual` for all of the provided names at once.
+        
+        This has the same effect as invoking :meth:`create_individual` for each of the names in turn, but reserves the
+        according range of indices in a single step, and checks the uniqueness of all names by means of set operations.
+        If any of the names is invalid, then no individual is created at all.
+        
+        Args:
+            names (iterable[str]): The names to assign to the created individuals, which are converted and interned like
+                the arg ``name`` of :meth:`create_individual`.
+            target_type (type, optional): The type of the instances to create (cf. :meth:`create_individual`).
+            args (iterable, optional): The positional args to pass to the constructor of ``target_type``.
+            kwargs (dict, optional): The keyword args to pass to the constructor of ``target_type``.
+        
+        Returns:
+            list[:class:`individual.Individual`]: The newly constructed instances in the same order as ``names``.
+        
+        Raises:
+            ValueError: If :attr:`check_names` is ``True`` and any of the provided ``names`` has been used before or
+                appears more than once, or if a provided ``target_type`` is not a subclass of
+                :class:`individual.Individual`.
+        """
+        # sanitize target type
+        cls._sanitize_target_type(target_type)
+        
+        # ensure that all names are interned strings
+        names = [sys.intern(str(n)) for n in names]
+        
+        # fetch current context, and prepare it if necessary
+        ctx = cls._prepare_context()
+        
+        # sanitize names if configured to do so
+        if cls.check_names:
+            used_names = ctx[cls._USED_NAMES]
+            new_names = set(names)
+            if len(new_names) != len(names) or not used_names.isdisjoint(new_names):
+                # find the first name that is not unique in order to provide a meaningful error message
+                seen = set()
+                for n in names:
+                    if n in used_names or n in seen:
+                        raise ValueError("An individual with name '{}' exists already!".format(n))
+                    seen.add(n)
+            used_names |= new_names
+        
+        # reserve the needed indices
+        first_index = ctx[cls._LAST_INDEX] + 1
+        ctx[cls._LAST_INDEX] += len(names)
+        
+        # create individuals
+        if target_type is None:
+            return [_Individual(index, name) for index, name in enumerate(names, start=first_index)]
+        else:
+            args = [] if args is None else args
+            kwargs = {} if kwargs is None else kwargs
+            return [target_type(index, name, *args, **kwargs) for index, name in enumerate(names, start=first_index)]
+    
     @classmethod
     def reset(cls) -> None:
         """Resets the ``IndividualFactory`` to its initial state."""
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import kg_encoding
+from reldata.data import knowledge_graph
+from reldata.vocab import vocab_registry as vr
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class KgArrays(object):
+    """A compact representation of a knowledge graph that consists of name lists and integer arrays only.
+    
+    Vocabulary and individuals are described by lists of names in the order of their indices, and all data is stored
+    by means of the integer encodings that are defined in :mod:`kg_encoding`. Unlike a
+    :class:`knowledge_graph.KnowledgeGraph`, a ``KgArrays`` is cheap to pickle, and can thus be passed between
+    processes efficiently. It is created from a graph by means of :meth:`from_kg`, and turned back into one by means of
+    :meth:`to_kg`.
+    
+    Notice that the indices of the vocabulary and the individuals of an encoded graph are expected to be consecutive
+    and to start at ``0``, which is the case for all graphs that are loaded with :class:`reldata.io.kg_reader.KgReader`.
+    """
+    
+    MEMBERSHIP_INDIVIDUAL = 0
+    """int: The column of the encoded class memberships that contains the indices of the individuals."""
+    
+    MEMBERSHIP_CLASS = 1
+    """int: The column of the encoded class memberships that contains the indices of the classes."""
+    
+    MEMBERSHIP_VALUE = 2
+    """int: The column of the encoded class memberships that indicates memberships (``1``) and non-memberships
+    (``-1``)."""
+    
+    MEMBERSHIP_STATUS = 3
+    """int: The column of the encoded class memberships that contains the status codes."""
+    
+    MEMBERSHIP_COLUMNS = 4
+    """int: The total number of columns of the encoded class memberships."""
+    
+    def __init__(
+            self,
+            classes: typing.Sequence[str],
+            relations: typing.Sequence[str],
+            literals: typing.Sequence[str],
+            individuals: typing.Sequence[str],
+            triples: np.ndarray,
+            memberships: np.ndarray,
+            literal_values: typing.Sequence[typing.Tuple[int, int, typing.Any, int]]
+    ):
+        """Creates a new ``KgArrays``.
+        
+        Args:
+            classes (sequence[str]): The names of the classes in the order of their indices.
+            relations (sequence[str]): The names of the relations in the order of their indices.
+            literals (sequence[str]): The names of the literals in the order of their indices.
+            individuals (sequence[str]): The names of the individuals in the order of their indices.
+            triples (``numpy.ndarray``): The encoded triples.
+            memberships (``numpy.ndarray``): The encoded class memberships.
+            literal_values (sequence[tuple]): The encoded literal values.
+        """
+        self._classes = list(classes)
+        self._individuals = list(individuals)
+        self._literal_values = list(literal_values)
+        self._literals = list(literals)
+        self._memberships = np.asarray(memberships, dtype=np.int64).reshape(-1, self.MEMBERSHIP_COLUMNS)
+        self._relations = list(relations)
+        self._triples = np.asarray(triples, dtype=np.int64).reshape(-1, 5)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def classes(self) -> typing.List[str]:
+        """list[str]: The names of the classes in the order of their indices."""
+        return self._classes
+    
+    @property
+    def individuals(self) -> typing.List[str]:
+        """list[str]: The names of the individuals in the order of their indices."""
+        return self._individuals
+    
+    @property
+    def literal_values(self) -> typing.List[typing.Tuple[int, int, typing.Any, int]]:
+        """list[tuple]: The encoded literal values, i.e., tuples of individual, literal, value, and status code."""
+        return self._literal_values
+    
+    @property
+    def literals(self) -> typing.List[str]:
+        """list[str]: The names of the literals in the order of their indices."""
+        return self._literals
+    
+    @property
+    def memberships(self) -> np.ndarray:
+        """``numpy.ndarray``: The encoded class memberships, i.e., rows of individual, class, membership, and status
+        code."""
+        return self._memberships
+    
+    @property
+    def relations(self) -> typing.List[str]:
+        """list[str]: The names of the relations in the order of their indices."""
+        return self._relations
+    
+    @property
+    def triples(self) -> np.ndarray:
+        """``numpy.ndarray``: The encoded triples, i.e., rows of subject, predicate, object, polarity, and status code.
+        """
+        return self._triples
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def from_kg(cls, kg: knowledge_graph.KnowledgeGraph) -> "KgArrays":
+        """Encodes a knowledge graph.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The graph to encode.
+        
+        Returns:
+            :class:`KgArrays`: The encoded graph.
+        """
+        return cls(
+                [c.name for c in kg.classes],
+                [r.name for r in kg.relations],
+                [l.name for l in kg.literals],
+                [i.name for i in kg.individuals],
+                kg.triple_store.array().copy(),
+                kg_encoding.encode_memberships(kg),
+                kg_encoding.encode_literal_values(kg)
+        )
+    
+    def to_kg(self, vocab_registry: vr.VocabRegistry = None) -> knowledge_graph.KnowledgeGraph:
+        """Decodes a ``KgArrays`` into a knowledge graph.
+        
+        Args:
+            vocab_registry (:class:`vr.VocabRegistry`, optional): An optional registry that the vocabulary of the
+                created graph is retrieved from.
+        
+        Returns:
+            :class:`knowledge_graph.KnowledgeGraph`: The decoded graph.
+        """
+        if vocab_registry is None:
+            vocab_registry = vr.VocabRegistry()
+        return kg_encoding.decode(
+                vocab_registry.get_classes(self._classes),
+                vocab_registry.get_relations(self._relations),
+                vocab_registry.get_literals(self._literals),
+                self._individuals,
+                self._triples.tolist(),
+                self._memberships.tolist(),
+                self._literal_values
+        )
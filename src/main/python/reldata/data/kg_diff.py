@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import class_membership
+from reldata.data import kg_encoding
+from reldata.data import knowledge_graph
+from reldata.data import literal_value
+from reldata.data import status as st
+from reldata.data import triple
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class KgDiff(object):
+    """The differences between two knowledge graphs that share the same vocabulary and individuals.
+    
+    A ``KgDiff`` describes which triples, class memberships, and literal values have to be removed from and added to an
+    old graph in order to obtain a new one. All of these are represented by means of the integer encodings that are
+    defined in :mod:`kg_encoding`, which allows for computing the differences with vectorized set operations rather
+    than by comparing the data objects of both graphs one by one:
+        
+        diff = KgDiff(reference_kg, predicted_kg)
+        num_missing = len(diff.removed_triples)
+    
+    Furthermore, a ``KgDiff`` can be applied as a patch to any graph that shares the vocabulary and individuals of the
+    graphs that it was computed from (cf. :meth:`apply`). All rows of the provided arrays are sorted lexicographically.
+    """
+    
+    def __init__(self, old_kg: knowledge_graph.KnowledgeGraph, new_kg: knowledge_graph.KnowledgeGraph):
+        """Computes the differences between two knowledge graphs.
+        
+        Args:
+            old_kg (:class:`knowledge_graph.KnowledgeGraph`): The graph that the diff starts from.
+            new_kg (:class:`knowledge_graph.KnowledgeGraph`): The graph that the diff leads to.
+        
+        Raises:
+            ValueError: If the graphs do not share the same vocabulary and individuals, i.e., there are elements with
+                the same index but different names.
+        """
+        for part in ["classes", "relations", "literals", "individuals"]:
+            if self._index_names(getattr(old_kg, part)) != self._index_names(getattr(new_kg, part)):
+                raise ValueError("The knowledge graphs do not share the same {}!".format(part))
+        
+        # compare triples and class memberships
+        self._removed_triples, self._added_triples = self._diff_rows(
+                old_kg.triple_store.array(),
+                new_kg.triple_store.array()
+        )
+        self._removed_memberships, self._added_memberships = self._diff_rows(
+                kg_encoding.encode_memberships(old_kg),
+                kg_encoding.encode_memberships(new_kg)
+        )
+        
+        # literal values are compared after replacing the values with integer ids, which distinguish the types of the
+        # values as well, as, e.g., 1 == 1.0 == True
+        old_literals = kg_encoding.encode_literal_values(old_kg)
+        new_literals = kg_encoding.encode_literal_values(new_kg)
+        values = {}  # maps pairs of type and value to ids
+        for _, _, value, _ in old_literals + new_literals:
+            values.setdefault((type(value), value), len(values))
+        value_list = [value for _, value in values]
+        old_rows = [(i, l, values[type(v), v], s) for i, l, v, s in old_literals]
+        new_rows = [(i, l, values[type(v), v], s) for i, l, v, s in new_literals]
+        removed_literals, added_literals = self._diff_rows(
+                np.array(old_rows, dtype=np.int64).reshape(-1, 4),
+                np.array(new_rows, dtype=np.int64).reshape(-1, 4)
+        )
+        self._removed_literal_values = [(i, l, value_list[v], s) for i, l, v, s in removed_literals.tolist()]
+        self._added_literal_values = [(i, l, value_list[v], s) for i, l, v, s in added_literals.tolist()]
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __len__(self) -> int:
+        return (
+                len(self._added_triples) + len(self._removed_triples) +
+                len(self._added_memberships) + len(self._removed_memberships) +
+                len(self._added_literal_values) + len(self._removed_literal_values)
+        )
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def added_literal_values(self) -> typing.List[typing.Tuple[int, int, typing.Any, int]]:
+        """list[tuple]: The encoded literal values that are present in the new graph only."""
+        return self._added_literal_values
+    
+    @property
+    def added_memberships(self) -> np.ndarray:
+        """``numpy.ndarray``: The encoded class memberships that are present in the new graph only."""
+        return self._added_memberships
+    
+    @property
+    def added_triples(self) -> np.ndarray:
+        """``numpy.ndarray``: The encoded triples that are present in the new graph only."""
+        return self._added_triples
+    
+    @property
+    def removed_literal_values(self) -> typing.List[typing.Tuple[int, int, typing.Any, int]]:
+        """list[tuple]: The encoded literal values that are present in the old graph only."""
+        return self._removed_literal_values
+    
+    @property
+    def removed_memberships(self) -> np.ndarray:
+        """``numpy.ndarray``: The encoded class memberships that are present in the old graph only."""
+        return self._removed_memberships
+    
+    @property
+    def removed_triples(self) -> np.ndarray:
+        """``numpy.ndarray``: The encoded triples that are present in the old graph only."""
+        return self._removed_triples
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def _diff_rows(old: np.ndarray, new: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Computes the rows of two integer matrices with unique rows each that appear in one of them only.
+        
+        To that end, every row is packed into a single integer key, such that the order of the keys is the same as the
+        lexicographical order of the rows, and the keys are compared with vectorized set operations.
+        
+        Returns:
+            tuple[``numpy.ndarray``, ``numpy.ndarray``]: The rows of ``old`` that are missing in ``new``, and the rows
+                of ``new`` that are missing in ``old``, both sorted lexicographically and marked as read-only.
+        """
+        all_rows = np.concatenate([old, new])
+        if len(all_rows) == 0:
+            old_only, new_only = old.copy(), new.copy()
+        else:
+            # pack every row into a single key
+            offsets = all_rows.min(axis=0)
+            dims = all_rows.max(axis=0) - offsets + 1
+            try:
+                keys = np.ravel_multi_index((all_rows - offsets).T, dims)
+            except ValueError:  # -> the keys would exceed the range of int64
+                keys = np.unique(all_rows, axis=0, return_inverse=True)[1].reshape(-1)
+            old_keys, new_keys = keys[:len(old)], keys[len(old):]
+            
+            # compare keys
+            old_mask = ~np.isin(old_keys, new_keys, assume_unique=True)
+            new_mask = ~np.isin(new_keys, old_keys, assume_unique=True)
+            old_only = old[old_mask][np.argsort(old_keys[old_mask])]
+            new_only = new[new_mask][np.argsort(new_keys[new_mask])]
+        
+        old_only.flags.writeable = False
+        new_only.flags.writeable = False
+        return old_only, new_only
+    
+    @staticmethod
+    def _index_names(elements: typing.Iterable) -> typing.List[typing.Tuple[int, str]]:
+        """Retrieves the indices and names of the provided elements."""
+        return [(e.index, e.name) for e in elements]
+    
+    def apply(self, kg: knowledge_graph.KnowledgeGraph) -> None:
+        """Applies a ``KgDiff`` as a patch to a knowledge graph, i.e., removes and adds the according data in place.
+        
+        Notice that ``kg`` has to share the vocabulary and individuals of the graphs that the diff was computed from.
+        Removing data that is not present in ``kg`` or adding data that is present already does not have any effect.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The graph to patch.
+        
+        Raises:
+            KeyError: If any of the changes refers to an element that ``kg`` does not contain.
+        """
+        with kg.bulk_update():
+            for removed, triples, memberships, literals in [
+                    (True, self._removed_triples, self._removed_memberships, self._removed_literal_values),
+                    (False, self._added_triples, self._added_memberships, self._added_literal_values)
+            ]:
+                for s, p, o, positive, status in triples.tolist():
+                    inferred, prediction = st.to_flags(status)
+                    t = triple.Triple(
+                            kg.individuals[s],
+                            kg.relations[p],
+                            kg.individuals[o],
+                            positive == 1,
+                            inferred=inferred,
+                            prediction=prediction
+                    )
+                    if removed:
+                        kg.triples.discard(t)
+                    else:
+                        kg.triples.add(t)
+                
+                for ind, cls, mem, status in memberships.tolist():
+                    inferred, prediction = st.to_flags(status)
+                    cls_mem = class_membership.ClassMembership(
+                            kg.classes[cls],
+                            mem == 1,
+                            inferred=inferred,
+                            prediction=prediction
+                    )
+                    if removed:
+                        kg.individuals[ind].classes.discard(cls_mem)
+                    else:
+                        kg.individuals[ind].classes.add(cls_mem)
+                
+                for ind, lit, value, status in literals:
+                    inferred, prediction = st.to_flags(status)
+                    lit_value = literal_value.LiteralValue(
+                            kg.literals[lit],
+                            value,
+                            inferred=inferred,
+                            prediction=prediction
+                    )
+                    if removed:
+                        kg.individuals[ind].literals.discard(lit_value)
+                    else:
+                        kg.individuals[ind].literals.add(lit_value)
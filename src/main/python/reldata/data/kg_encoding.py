@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides functions for converting the data of a knowledge graph to and from integer encodings.
+
+The following encodings are used:
+
+- triples are encoded as rows of subject, predicate, object, polarity (``1`` or ``0``), and status code, which is the
+  encoding that is used by :class:`triple_store.TripleStore`,
+- class memberships are encoded as rows of individual, class, membership (``1`` or ``-1``), and status code, and
+- literal values are encoded as tuples of individual, literal, value, and status code.
+
+All status codes are the ones defined in :mod:`reldata.data.status`.
+"""
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import class_membership
+from reldata.data import data_context as dc
+from reldata.data import individual_factory
+from reldata.data import knowledge_graph
+from reldata.data import literal_value
+from reldata.data import status as st
+from reldata.data import triple
+from reldata.vocab import class_type
+from reldata.vocab import literal_type
+from reldata.vocab import relation_type
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+def decode(
+        classes: typing.Sequence[class_type.ClassType],
+        relations: typing.Sequence[relation_type.RelationType],
+        literals: typing.Sequence[literal_type.LiteralType],
+        individuals: typing.Sequence[str],
+        triples: typing.Iterable[typing.Sequence[int]],
+        memberships: typing.Iterable[typing.Sequence[int]],
+        literal_values: typing.Iterable[tuple]
+) -> knowledge_graph.KnowledgeGraph:
+    """Creates a knowledge graph from encoded data.
+    
+    The provided vocabulary objects are used as they are, since these are immutable, while the individuals are created
+    in a fresh :class:`dc.DataContext`.
+    
+    Args:
+        classes (sequence[:class:`class_type.ClassType`]): The classes of the graph in the order of their indices.
+        relations (sequence[:class:`relation_type.RelationType`]): The relations of the graph in the order of their
+            indices.
+        literals (sequence[:class:`literal_type.LiteralType`]): The literals of the graph in the order of their indices.
+        individuals (sequence[str]): The names of the individuals of the graph in the order of their indices.
+        triples (iterable): The encoded triples.
+        memberships (iterable): The encoded class memberships.
+        literal_values (iterable): The encoded literal values.
+    
+    Returns:
+        :class:`knowledge_graph.KnowledgeGraph`: The created graph.
+    """
+    with dc.DataContext():
+        kg = knowledge_graph.KnowledgeGraph()
+        
+        # add vocabulary and individuals
+        kg.classes.add_all(classes)
+        kg.relations.add_all(relations)
+        kg.literals.add_all(literals)
+        inds = individual_factory.IndividualFactory.create_individuals(individuals)
+        
+        # add class memberships and literal values
+        for ind, cls, mem, status in memberships:
+            inferred, prediction = st.to_flags(status)
+            inds[ind].classes.add(
+                    class_membership.ClassMembership(
+                            classes[cls],
+                            mem == 1,
+                            inferred=inferred,
+                            prediction=prediction
+                    )
+            )
+        for ind, lit, value, status in literal_values:
+            inferred, prediction = st.to_flags(status)
+            inds[ind].literals.add(
+                    literal_value.LiteralValue(
+                            literals[lit],
+                            value,
+                            inferred=inferred,
+                            prediction=prediction
+                    )
+            )
+        kg.individuals.add_all(inds)
+        
+        # add triples
+        all_triples = []
+        for s, p, o, positive, status in triples:
+            inferred, prediction = st.to_flags(status)
+            all_triples.append(
+                    triple.Triple(
+                            inds[s],
+                            relations[p],
+                            inds[o],
+                            positive == 1,
+                            inferred=inferred,
+                            prediction=prediction
+                    )
+            )
+        kg.triples.add_all(all_triples)
+    
+    return kg
+
+
+def encode_literal_values(kg: knowledge_graph.KnowledgeGraph) -> typing.List[typing.Tuple[int, int, typing.Any, int]]:
+    """Encodes the literal values of all individuals in a knowledge graph.
+    
+    Args:
+        kg (:class:`knowledge_graph.KnowledgeGraph`): The knowledge graph to encode.
+    
+    Returns:
+        list[tuple]: The encoded literal values.
+    """
+    return [(ind.index, lit.literal.index, lit.value, st.of(lit)) for ind in kg.individuals for lit in ind.literals]
+
+
+def encode_memberships(kg: knowledge_graph.KnowledgeGraph) -> np.ndarray:
+    """Encodes the class memberships of all individuals in a knowledge graph.
+    
+    Args:
+        kg (:class:`knowledge_graph.KnowledgeGraph`): The knowledge graph to encode.
+    
+    Returns:
+        ``numpy.ndarray``: The encoded class memberships as ``int64`` matrix with four columns.
+    """
+    matrices = kg.memberships.matrices()
+    status, ind, cls = np.nonzero(matrices)
+    return np.stack([ind, cls, matrices[status, ind, cls], status], axis=1).astype(np.int64)
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import typing
+
+import numpy as np
+
+from reldata.data import individual
+from reldata.data import literal_store
+from reldata.data import status as st
+from reldata.vocab import vocab_element
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+_Pattern = collections.namedtuple("_Pattern", ["description", "variables", "fetch"])
+"""A single pattern of a query, which is described by its variables and a function that retrieves all bindings of
+these, as an ``int64`` matrix with one column per variable, from the indexes of a graph."""
+
+
+class KgQuery(object):
+    """A conjunctive query over the triples, class memberships, and literal values of a knowledge graph.
+    
+    A ``KgQuery`` is a basic graph pattern, i.e., a conjunction of triple, membership, and literal patterns, which are
+    added one at a time. Variables are strings that start with ``"?"``, and all other terms refer to individuals,
+    relations, classes, and literals either by name, by index, or as objects:
+        
+        results = (
+                KgQuery(kg)
+                .triple("?x", "worksFor", "?y")
+                .triple("?y", "locatedIn", "?z")
+                .member("?z", "City")
+                .execute()
+        )
+        for x, z in zip(results["?x"], results["?z"]):
+            ...
+    
+    When a query is executed, the bindings of every single pattern are retrieved from the indexes of the graph, i.e.,
+    its :class:`adjacency_cache.AdjacencyCache`, :class:`class_index.ClassIndex`, and
+    :class:`literal_store.LiteralStore`. The number of bindings of each pattern serves as its selectivity, and the
+    patterns are joined greedily, starting with the most selective one, and continuing with the most selective one that
+    shares a variable with those that have been joined already. Every join is a vectorized sort-merge join over the
+    indices of the individuals.
+    """
+    
+    def __init__(self, kg, status: typing.Iterable[int] = (st.FACT,)):
+        """Creates a new empty ``KgQuery``.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The graph to query.
+            status (iterable[int], optional): The status codes of the data that is considered. This defaults to facts
+                only.
+        """
+        self._kg = kg
+        self._patterns = []
+        self._status = tuple(sorted(set(int(s) for s in status)))
+    
+    #  METHODS  ########################################################################################################
+    
+    def _add(self, description: str, terms: typing.Sequence, fetch: typing.Callable[[], np.ndarray]) -> "KgQuery":
+        """Adds a pattern whose bindings are retrieved by ``fetch`` as a matrix with one column per term.
+        
+        Columns that belong to individuals rather than variables are used as filters, and columns of the same variable
+        are required to be equal.
+        
+        Raises:
+            KeyError: If any of the terms refers to an individual that does not exist.
+        """
+        terms = [t if self._is_variable(t) else self._to_index(t, self._kg.individuals) for t in terms]
+        variables = []
+        for term in terms:
+            if self._is_variable(term) and term not in variables:
+                variables.append(term)
+        
+        def fetch_bindings() -> np.ndarray:
+            data = fetch()
+            mask = np.ones(len(data), dtype=bool)
+            for col, term in enumerate(terms):
+                if self._is_variable(term):
+                    mask &= data[:, col] == data[:, terms.index(term)]
+                else:
+                    mask &= data[:, col] == term
+            data = data[mask][:, [terms.index(v) for v in variables]]
+            if not variables:  # -> a pattern without variables is a filter that either holds or not
+                return np.zeros((1 if len(data) > 0 else 0, 0), dtype=np.int64)
+            return np.unique(data, axis=0)
+        
+        self._patterns.append(_Pattern(description, tuple(variables), fetch_bindings))
+        return self
+    
+    def _evaluate_patterns(self) -> typing.Tuple[typing.List[int], typing.List[np.ndarray]]:
+        """Retrieves the bindings of all patterns, and determines the order that they are joined in.
+        
+        Raises:
+            ValueError: If the query does not contain any patterns.
+        """
+        if not self._patterns:
+            raise ValueError("The query does not contain any patterns!")
+        bindings = [p.fetch() for p in self._patterns]
+        return self._plan(self._patterns, [len(b) for b in bindings]), bindings
+    
+    @staticmethod
+    def _is_variable(term) -> bool:
+        """Checks whether a term of a pattern is a variable."""
+        return isinstance(term, str) and term.startswith("?")
+    
+    @staticmethod
+    def _join(
+            left_vars: typing.List[str],
+            left: np.ndarray,
+            right_vars: typing.Sequence[str],
+            right: np.ndarray
+    ) -> typing.Tuple[typing.List[str], np.ndarray]:
+        """Joins two tables of bindings on their shared variables (a cross product if there are none)."""
+        shared = [v for v in right_vars if v in left_vars]
+        new = [i for i, v in enumerate(right_vars) if v not in left_vars]
+        
+        # compute join keys, which are equal if and only if the bindings of the shared variables are
+        left_cols = left[:, [left_vars.index(v) for v in shared]]
+        right_cols = right[:, [right_vars.index(v) for v in shared]]
+        if len(shared) == 0:
+            left_keys = np.zeros(len(left), dtype=np.int64)
+            right_keys = np.zeros(len(right), dtype=np.int64)
+        elif len(shared) == 1:
+            left_keys = left_cols[:, 0]
+            right_keys = right_cols[:, 0]
+        else:
+            _, keys = np.unique(np.concatenate([left_cols, right_cols]), axis=0, return_inverse=True)
+            keys = keys.reshape(-1)
+            left_keys = keys[:len(left)]
+            right_keys = keys[len(left):]
+        
+        # find the range of matching rows of the sorted right table for every row of the left one
+        order = np.argsort(right_keys, kind="mergesort")
+        sorted_keys = right_keys[order]
+        starts = np.searchsorted(sorted_keys, left_keys, side="left")
+        counts = np.searchsorted(sorted_keys, left_keys, side="right") - starts
+        
+        # combine all pairs of matching rows
+        total = int(counts.sum())
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        left_rows = np.repeat(np.arange(len(left)), counts)
+        right_rows = order[np.repeat(starts, counts) + offsets]
+        return (
+                left_vars + [right_vars[i] for i in new],
+                np.concatenate([left[left_rows], right[right_rows][:, new]], axis=1)
+        )
+    
+    @staticmethod
+    def _plan(patterns: typing.Sequence[_Pattern], sizes: typing.Sequence[int]) -> typing.List[int]:
+        """Determines the order that patterns are joined in based on the numbers of their bindings."""
+        remaining = list(range(len(patterns)))
+        bound = set()
+        order = []
+        while remaining:
+            connected = [i for i in remaining if bound & set(patterns[i].variables)]
+            best = min(connected or remaining, key=lambda i: sizes[i])
+            order.append(best)
+            remaining.remove(best)
+            bound |= set(patterns[best].variables)
+        return order
+    
+    @staticmethod
+    def _to_index(term, elements) -> int:
+        """Retrieves the index of an element of the graph that is provided by name, by index, or as object.
+        
+        Raises:
+            KeyError: If there is no element with the provided name.
+        """
+        if isinstance(term, (vocab_element.VocabElement, individual.Individual)):
+            return term.index
+        if isinstance(term, str):
+            return elements.index_of(term)
+        return int(term)
+    
+    def execute(self) -> typing.Dict[str, np.ndarray]:
+        """Evaluates the query.
+        
+        Returns:
+            dict[str, ``numpy.ndarray``]: A vector of indices of individuals for every variable of the query, in the
+                order that the variables appear in. The i-th elements of these vectors constitute the i-th distinct
+                solution of the query.
+        
+        Raises:
+            ValueError: If the query does not contain any patterns.
+        """
+        order, bindings = self._evaluate_patterns()
+        variables, table = [], np.zeros((1, 0), dtype=np.int64)
+        for i in order:
+            variables, table = self._join(variables, table, self._patterns[i].variables, bindings[i])
+        
+        all_vars = []
+        for p in self._patterns:
+            all_vars.extend(v for v in p.variables if v not in all_vars)
+        return {v: table[:, variables.index(v)] for v in all_vars}
+    
+    def explain(self) -> typing.List[typing.Tuple[str, int]]:
+        """Describes the plan that is used for evaluating the query.
+        
+        Returns:
+            list[tuple[str, int]]: The description and the number of bindings of every pattern in the order that the
+                patterns are joined in.
+        
+        Raises:
+            ValueError: If the query does not contain any patterns.
+        """
+        order, bindings = self._evaluate_patterns()
+        return [(self._patterns[i].description, len(bindings[i])) for i in order]
+    
+    def literal(self, subject, literal, value=None, low=None, high=None) -> "KgQuery":
+        """Adds a pattern that requires an individual to have a certain literal value.
+        
+        Values are compared by means of the typed columns of :class:`literal_store.LiteralStore`, i.e., the provided
+        value and bounds are converted like literal values (cf. :meth:`literal_store.LiteralColumn.convert`).
+        
+        Args:
+            subject: The individual or variable that the pattern applies to.
+            literal: The literal (or its name or index) that the individual has a value of.
+            value (optional): The required value. If this is ``None``, then any value is accepted.
+            low (optional): An inclusive lower bound of the value.
+            high (optional): An inclusive upper bound of the value.
+        
+        Returns:
+            :class:`KgQuery`: The query itself.
+        
+        Raises:
+            KeyError: If the literal or the individual does not exist.
+        """
+        lit_index = self._to_index(literal, self._kg.literals)
+        if value is not None:
+            low = high = value
+        low = None if low is None else literal_store.LiteralColumn.convert([low])[0]
+        high = None if high is None else literal_store.LiteralColumn.convert([high])[0]
+        
+        def fetch() -> np.ndarray:
+            individuals = [
+                    self._kg.literal_store.column(lit_index, status=s).range(low=low, high=high)
+                    for s in self._status
+            ]
+            return np.concatenate(individuals).reshape(-1, 1)
+        
+        return self._add("{} {} [{}, {}]".format(subject, literal, low, high), [subject], fetch)
+    
+    def member(self, subject, cls, is_member: bool = True) -> "KgQuery":
+        """Adds a pattern that requires an individual to be a (non-)member of a class.
+        
+        Args:
+            subject: The individual or variable that the pattern applies to.
+            cls: The class (or its name or index).
+            is_member (bool, optional): Indicates whether membership (the default) or non-membership is required.
+        
+        Returns:
+            :class:`KgQuery`: The query itself.
+        
+        Raises:
+            KeyError: If the class or the individual does not exist.
+        """
+        cls_index = self._to_index(cls, self._kg.classes)
+        
+        def fetch() -> np.ndarray:
+            index = self._kg.class_index
+            return index.to_indices(index.mask(cls_index, is_member=is_member, status=self._status)).reshape(-1, 1)
+        
+        return self._add("{} {} {}".format(subject, "a" if is_member else "not a", cls), [subject], fetch)
+    
+    def triple(self, subject, relation, obj, positive: bool = True) -> "KgQuery":
+        """Adds a triple pattern.
+        
+        Args:
+            subject: The individual or variable in the subject position.
+            relation: The relation (or its name or index) of the triple.
+            obj: The individual or variable in the object position.
+            positive (bool, optional): Indicates whether the triple has to be positive (the default) or negative.
+        
+        Returns:
+            :class:`KgQuery`: The query itself.
+        
+        Raises:
+            KeyError: If the relation or any of the individuals does not exist.
+        """
+        rel_index = self._to_index(relation, self._kg.relations)
+        
+        def fetch() -> np.ndarray:
+            pairs = [
+                    np.stack(self._kg.adjacency.coo(rel_index, status=s, positive=positive), axis=1)
+                    for s in self._status
+            ]
+            return np.concatenate(pairs).reshape(-1, 2)
+        
+        return self._add("{} {} {}".format(subject, relation, obj), [subject, obj], fetch)
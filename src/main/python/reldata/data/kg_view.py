@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+import weakref
+
+import numpy as np
+
+from reldata.data import status as st
+from reldata.data import triple
+from reldata.data import literal_store
+from reldata.util import set_observer
+from reldata.vocab import class_type
+from reldata.vocab import literal_type
+from reldata.vocab import relation_type
+from reldata.vocab import vocab_element
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class KgView(set_observer.SetObserver):
+    """A read-only view of those parts of a knowledge graph that have certain status codes, polarities, and types.
+    
+    A ``KgView`` is created by means of :meth:`knowledge_graph.KnowledgeGraph.view`, and exposes the triples, class
+    memberships, and literal values of a graph that satisfy its filters, e.g., all positive facts of two relations:
+        
+        with kg.view(status=[status.FACT], positive=True, relations=[r1, r2]) as view:
+            for t in view.triples:
+                ...
+    
+    The view observes the triples of the graph, and keeps track of those that match its filters. Therefore, iterating
+    over them takes time proportional to the number of matches, and any changes of the graph are reflected right away.
+    Class memberships and literal values are retrieved from the indexes of the graph, i.e., its
+    :class:`class_index.ClassIndex`, :class:`membership_store.MembershipStore`, and
+    :class:`literal_store.LiteralStore`, on demand.
+    
+    A ``KgView`` stays attached to its graph until :meth:`close` is invoked, which happens automatically if it is used
+    as a context manager. The graph only holds a weak reference to the view, though, which means that a view that is
+    not closed explicitly is detached as soon as it is garbage collected, and that views are never pickled together
+    with their graphs.
+    """
+    
+    def __init__(
+            self,
+            kg,
+            status: typing.Iterable[int] = st.ALL,
+            positive: bool = None,
+            relations: typing.Iterable[typing.Union[relation_type.RelationType, int]] = None,
+            classes: typing.Iterable[typing.Union[class_type.ClassType, int]] = None,
+            literals: typing.Iterable[typing.Union[literal_type.LiteralType, int]] = None
+    ):
+        """Creates a new ``KgView``.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The graph to create a view of.
+            status (iterable[int], optional): The status codes of the data that is part of the view. By default, all
+                status codes are considered.
+            positive (bool, optional): If this is provided, then only positive triples and memberships, or negative
+                triples and non-memberships, respectively, are part of the view.
+            relations (iterable, optional): The relations (or their indices) of the triples that are part of the view.
+                By default, all relations are considered.
+            classes (iterable, optional): The classes (or their indices) of the memberships that are part of the view.
+                By default, all classes are considered.
+            literals (iterable, optional): The literals (or their indices) of the literal values that are part of the
+                view. By default, all literals are considered.
+        """
+        self._array = None  # the cached encodings of the matching triples, or None if these have to be recomputed
+        self._classes = self._to_indices(classes)
+        self._kg = kg
+        self._literals = self._to_indices(literals)
+        self._positive = None if positive is None else bool(positive)
+        self._relations = self._to_indices(relations)
+        self._status = frozenset(int(s) for s in status)
+        self._triples = {t: None for t in kg.triples if self._matches(t)}  # -> ordered set of the matching triples
+        
+        # register a weak observer, which is detached from the graph when the view is closed or garbage collected
+        observer = _WeakObserver(self)
+        kg.triples.add_observer(observer)
+        self._detach = weakref.finalize(self, kg.triples.remove_observer, observer)
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __contains__(self, item: triple.Triple) -> bool:
+        return item in self._triples
+    
+    def __enter__(self) -> "KgView":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def __iter__(self) -> typing.Iterator[triple.Triple]:
+        return iter(self._triples)
+    
+    def __len__(self) -> int:
+        return len(self._triples)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def status(self) -> typing.FrozenSet[int]:
+        """frozenset[int]: The status codes of the data that is part of the view."""
+        return self._status
+    
+    @property
+    def triples(self) -> typing.KeysView[triple.Triple]:
+        """keys view: A live, read-only, set-like collection of all triples that are part of the view."""
+        return self._triples.keys()
+    
+    #  METHODS  ########################################################################################################
+    
+    def _check_status(self, status: int) -> None:
+        """Ensures that the provided status code is part of the view.
+        
+        Raises:
+            ValueError: If ``status`` is not part of the view.
+        """
+        if status not in self._status:
+            raise ValueError("The status {} is not part of the view!".format(status))
+    
+    def _matches(self, t: triple.Triple) -> bool:
+        """Checks whether a triple satisfies the filters of the view."""
+        return (
+                st.of(t) in self._status and
+                (self._positive is None or t.positive == self._positive) and
+                (self._relations is None or t.predicate.index in self._relations)
+        )
+    
+    @staticmethod
+    def _to_index(item: typing.Union[vocab_element.VocabElement, int]) -> int:
+        """Retrieves the index of a vocabulary object that is provided either as such or as index."""
+        return item.index if isinstance(item, vocab_element.VocabElement) else int(item)
+    
+    @classmethod
+    def _to_indices(cls, items: typing.Optional[typing.Iterable]) -> typing.Optional[typing.FrozenSet[int]]:
+        """Turns the provided vocabulary objects or indices into a set of indices."""
+        if items is None:
+            return None
+        return frozenset(cls._to_index(i) for i in items)
+    
+    def close(self) -> None:
+        """Detaches a ``KgView`` from its graph, i.e., it is not updated anymore."""
+        self._detach()
+    
+    def element_added(self, elem) -> None:
+        if self._matches(elem):
+            self._triples[elem] = None
+            self._array = None
+    
+    def element_removed(self, elem) -> None:
+        if elem in self._triples:
+            del self._triples[elem]
+            self._array = None
+    
+    def individuals(
+            self,
+            cls: typing.Union[class_type.ClassType, int],
+            is_member: bool = True
+    ) -> np.ndarray:
+        """Retrieves the individuals that have the specified kind of membership of a class with any status of the view.
+        
+        Args:
+            cls (:class:`class_type.ClassType` or int): The class (or its index) to retrieve individuals for.
+            is_member (bool, optional): Indicates whether to retrieve members (the default) or non-members.
+        
+        Returns:
+            ``numpy.ndarray``: The sorted indices of the retrieved individuals, which is empty if the class or the kind
+                of membership is not part of the view.
+        """
+        index = self._kg.class_index
+        cls = self._to_index(cls)
+        if (
+                (self._classes is not None and cls not in self._classes) or
+                (self._positive is not None and bool(is_member) != self._positive)
+        ):
+            return np.zeros(0, dtype=np.int64)
+        return index.to_indices(index.mask(cls, is_member=is_member, status=self._status))
+    
+    def literal_column(
+            self,
+            literal: typing.Union[literal_type.LiteralType, int],
+            status: int = st.FACT
+    ) -> literal_store.LiteralColumn:
+        """Retrieves the values of a literal as typed column (cf. :meth:`literal_store.LiteralStore.column`).
+        
+        Args:
+            literal (:class:`literal_type.LiteralType` or int): The literal (or its index) to retrieve the values of.
+            status (int, optional): The status code of the retrieved values. This defaults to facts.
+        
+        Returns:
+            :class:`literal_store.LiteralColumn`: The requested column.
+        
+        Raises:
+            ValueError: If the literal or the status is not part of the view.
+        """
+        self._check_status(status)
+        if self._literals is not None and self._to_index(literal) not in self._literals:
+            raise ValueError("The literal {} is not part of the view!".format(literal))
+        return self._kg.literal_store.column(literal, status=status)
+    
+    def membership_matrix(self, status: int = st.FACT) -> np.ndarray:
+        """Retrieves the membership matrix of the graph for one status code (cf.
+        :meth:`membership_store.MembershipStore.matrix`).
+        
+        If the view is restricted to certain classes or polarities, then all entries that are not part of the view are
+        ``0``.
+        
+        Args:
+            status (int, optional): The status code of the retrieved memberships. This defaults to facts.
+        
+        Returns:
+            ``numpy.ndarray``: An ``int8`` matrix of shape individuals x classes.
+        
+        Raises:
+            ValueError: If ``status`` is not part of the view.
+        """
+        self._check_status(status)
+        matrix = self._kg.memberships.matrix(status=status)
+        if self._classes is None and self._positive is None:
+            return matrix
+        
+        result = np.zeros_like(matrix)
+        columns = np.arange(matrix.shape[1])
+        if self._classes is not None:
+            columns = columns[np.isin(columns, list(self._classes))]
+        result[:, columns] = matrix[:, columns]
+        if self._positive is not None:
+            result[result != (1 if self._positive else -1)] = 0
+        return result
+    
+    def triple_array(self) -> np.ndarray:
+        """Retrieves the encodings of all triples that are part of the view (cf.
+        :meth:`triple_store.TripleStore.array`).
+        
+        The encodings are cached until the triples of the view change.
+        
+        Returns:
+            ``numpy.ndarray``: A read-only ``int64`` matrix of shape triples x
+                :attr:`triple_store.TripleStore.NUM_COLUMNS`.
+        """
+        if self._array is None:
+            store = self._kg.triple_store
+            mask = np.isin(store.status, list(self._status))
+            if self._positive is not None:
+                mask &= store.positive == int(self._positive)
+            if self._relations is not None:
+                mask &= np.isin(store.predicates, list(self._relations))
+            self._array = store.array()[mask]
+            self._array.flags.writeable = False
+        return self._array
+
+
+class _WeakObserver(set_observer.SetObserver):
+    """An observer that forwards all notifications to a :class:`KgView` without keeping it alive.
+    
+    A ``_WeakObserver`` is transient, i.e., it is not pickled together with the observed set.
+    """
+    
+    transient = True
+    
+    def __init__(self, view: KgView):
+        """Creates a new ``_WeakObserver``.
+        
+        Args:
+            view (:class:`KgView`): The view to forward notifications to.
+        """
+        self._view = weakref.ref(view)
+    
+    #  METHODS  ########################################################################################################
+    
+    def _get_view(self) -> typing.Optional[KgView]:
+        """Retrieves the observed view, or ``None`` if it does not exist anymore."""
+        return self._view()
+    
+    def element_added(self, elem) -> None:
+        view = self._get_view()
+        if view is not None:
+            view.element_added(elem)
+    
+    def element_removed(self, elem) -> None:
+        view = self._get_view()
+        if view is not None:
+            view.element_removed(elem)
+    
+    def elements_added(self, elements: typing.Sequence) -> None:
+        view = self._get_view()
+        if view is not None:
+            view.elements_added(elements)
+    
+    def elements_removed(self, elements: typing.Sequence) -> None:
+        view = self._get_view()
+        if view is not None:
+            view.elements_removed(elements)
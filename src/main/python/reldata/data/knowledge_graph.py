@@ -1,13 +1,21 @@
 # -*- coding: utf-8 -*-
 
 
+import contextlib
 import typing
 
+from reldata.data import adjacency_cache
+from reldata.data import class_index
 from reldata.data import class_membership
 from reldata.data import individual
 from reldata.data import individual_observer
+from reldata.data import kg_view
+from reldata.data import literal_store
 from reldata.data import literal_value
+from reldata.data import membership_store
+from reldata.data import status as st
 from reldata.data import triple
+from reldata.data import triple_store
 from reldata.util import observable_set
 from reldata.util import ordered_set
 from reldata.util import set_observer
@@ -54,17 +62,40 @@ class KnowledgeGraph(set_observer.SetObserver, individual_observer.IndividualObs
 
     def __init__(self):
         """Creates a new empty ``KnowledgeGraph``."""
-        self._classes = ordered_set.OrderedSet(class_type.ClassType, self._index_func)
+        self._adjacency = adjacency_cache.AdjacencyCache(self)
+        self._literal_store = literal_store.LiteralStore()
+        self._memberships = membership_store.MembershipStore()
+        self._class_index = class_index.ClassIndex(self._memberships)
+        self._triple_store = triple_store.TripleStore()
+        
+        self._classes = ordered_set.OrderedSet(
+                class_type.ClassType,
+                self._index_func,
+                name_func=self._name_func
+        )
         self._classes.add_observer(self)
-        self._relations = ordered_set.OrderedSet(relation_type.RelationType, self._index_func)
+        self._relations = ordered_set.OrderedSet(
+                relation_type.RelationType,
+                self._index_func,
+                name_func=self._name_func
+        )
         self._relations.add_observer(self)
-        self._literals = ordered_set.OrderedSet(literal_type.LiteralType, self._index_func)
+        self._literals = ordered_set.OrderedSet(
+                literal_type.LiteralType,
+                self._index_func,
+                name_func=self._name_func
+        )
         self._literals.add_observer(self)
         
-        self._individuals = ordered_set.OrderedSet(individual.Individual, self._index_func)
+        self._individuals = ordered_set.OrderedSet(
+                individual.Individual,
+                self._index_func,
+                name_func=self._name_func
+        )
         self._individuals.add_observer(self)
         self._triples = observable_set.ObservableSet(triple.Triple)
         self._triples.add_observer(self)
+        self._triples.add_observer(self._adjacency)
     
     #  MAGIC FUNCTIONS  ################################################################################################
     
@@ -103,6 +134,20 @@ class KnowledgeGraph(set_observer.SetObserver, individual_observer.IndividualObs
     
     #  PROPERTIES  #####################################################################################################
     
+    @property
+    def adjacency(self) -> adjacency_cache.AdjacencyCache:
+        """:class:`adjacency_cache.AdjacencyCache`: The adjacency matrices of all relations in the ``KnowledgeGraph`` as
+        sparse index arrays.
+        """
+        return self._adjacency
+    
+    @property
+    def class_index(self) -> class_index.ClassIndex:
+        """:class:`class_index.ClassIndex`: An index that maps the classes of the ``KnowledgeGraph`` to the individuals
+        that are (non-)members of them.
+        """
+        return self._class_index
+    
     @property
     def classes(self) -> ordered_set.OrderedSet[class_type.ClassType]:
         """:class:`ordered_set.OrderedSet`: The classes that appear in the ``KnowledgeGraph``."""
@@ -113,16 +158,35 @@ class KnowledgeGraph(set_observer.SetObserver, individual_observer.IndividualObs
         """:class:`ordered_set.OrderedSet`: The individuals that appear in the ``KnowledgeGraph``."""
         return self._individuals
 
+    @property
+    def literal_store(self) -> literal_store.LiteralStore:
+        """:class:`literal_store.LiteralStore`: The literal values of all individuals in the ``KnowledgeGraph`` as typed
+        columns.
+        """
+        return self._literal_store
+
     @property
     def literals(self) -> ordered_set.OrderedSet[literal_type.LiteralType]:
         """:class:`ordered_set.OrderedSet`: The literals that appear in the ``KnowledgeGraph``."""
         return self._literals
 
+    @property
+    def memberships(self) -> membership_store.MembershipStore:
+        """:class:`membership_store.MembershipStore`: The class memberships of all individuals in the ``KnowledgeGraph``
+        as matrices of shape individuals x classes.
+        """
+        return self._memberships
+
     @property
     def relations(self) -> ordered_set.OrderedSet[relation_type.RelationType]:
         """:class:`ordered_set.OrderedSet`: The relations that appear in the ``KnowledgeGraph``."""
         return self._relations
     
+    @property
+    def triple_store(self) -> triple_store.TripleStore:
+        """:class:`triple_store.TripleStore`: The triples of the ``KnowledgeGraph`` encoded as an integer array."""
+        return self._triple_store
+    
     @property
     def triples(self) -> observable_set.ObservableSet[triple.Triple]:
         """:class:`observable_set.ObservableSet`: The triples that appear in the ``KnowledgeGraph``."""
@@ -142,26 +206,41 @@ class KnowledgeGraph(set_observer.SetObserver, individual_observer.IndividualObs
         """
         return obj.index
     
+    @staticmethod
+    def _name_func(obj) -> str:
+        """This function is passed as arg ``name_func`` to all created instances of :class:`ordered_set.OrderedSet`.
+        
+        Args:
+            obj: The object whose name should be retrieved.
+        
+        Returns:
+            str: The name of ``obj``.
+        """
+        return obj.name
+    
     def _register_individual(self, i: individual.Individual) -> None:
         """Registers an individual that was added to the ``KnowledgeGraph``.
         
-        If the new triple contains class types or literal types that are not part the ``KnowledgeGraph`` yet, then they
-        are added automatically.
+        This method is invoked exactly once for every individual, namely when it is added to :attr:`individuals`. If the
+        new individual has class types or literal types that are not part the ``KnowledgeGraph`` yet, then they are
+        added automatically.
         
         Args:
-            i (:class:`individual.Individual`): The individual to add.
+            i (:class:`individual.Individual`): The individual that was added.
         """
-        # store individual
-        self._individuals.add(i)
+        # observe the individual in order to be notified about any changes
         i.add_observer(self)
         
-        # add any missing classes
-        for cls in map(lambda cls_mem: cls_mem.cls, i.classes):
-            self._classes.add(cls)
+        # add any missing classes, and store the individual's memberships
+        self._memberships.extend(num_individuals=i.index + 1)
+        for cls_mem in i.classes:
+            self._classes.add(cls_mem.cls)
+            self._memberships.add(i.index, cls_mem)
         
-        # add any missing labels
-        for lit in map(lambda lit_value: lit_value.literal, i.literals):
-            self._literals.add(lit)
+        # add any missing labels, and store the individual's literal values
+        for lit_value in i.literals:
+            self._literals.add(lit_value.literal)
+            self._literal_store.add(i.index, lit_value)
     
     def _register_triple(self, t: triple.Triple) -> None:
         """Registers a triple that was added to the ``KnowledgeGraph``.
@@ -176,26 +255,143 @@ class KnowledgeGraph(set_observer.SetObserver, individual_observer.IndividualObs
         self._relations.add(t.predicate)
         
         # add any missing individuals
-        self._register_individual(t.subject)
-        self._register_individual(t.object)
+        # (individuals that are part of the graph already are skipped, and new ones are registered by the callback that
+        # is triggered by adding them to self._individuals)
+        if t.subject not in self._individuals:
+            self._individuals.add(t.subject)
+        if t.object not in self._individuals:
+            self._individuals.add(t.object)
+    
+    def _register_triples(self, triples: typing.Sequence[triple.Triple]) -> None:
+        """Registers a batch of triples that were added to the ``KnowledgeGraph``.
+        
+        This has the same effect as invoking :meth:`_register_triple` for each of the provided triples, but adds all
+        missing relations and individuals at once.
+        
+        Args:
+            triples (sequence[:class:`triple.Triple`]): The triples that were added.
+        """
+        # gather all relations and individuals that appear in the triples
+        relations = {}
+        individuals = {}
+        for t in triples:
+            relations.setdefault(t.predicate.index, t.predicate)
+            individuals.setdefault(t.subject.index, t.subject)
+            individuals.setdefault(t.object.index, t.object)
+        
+        # add those that are missing
+        self._relations.add_all(r for r in relations.values() if r not in self._relations)
+        self._individuals.add_all(i for i in individuals.values() if i not in self._individuals)
+    
+    def _unregister_individual(self, i: individual.Individual) -> None:
+        """Unregisters an individual that was removed from the ``KnowledgeGraph``.
+        
+        Args:
+            i (:class:`individual.Individual`): The individual that was removed.
+        """
+        i.remove_observer(self)
+        self._memberships.discard_individual(i.index)
+        for lit_value in i.literals:
+            self._literal_store.discard(i.index, lit_value)
+    
+    @contextlib.contextmanager
+    def bulk_update(self) -> typing.Iterator["KnowledgeGraph"]:
+        """Creates a context for making many changes to a ``KnowledgeGraph`` at once.
+        
+        Within this context, all of the sets of the graph, i.e., :attr:`classes`, :attr:`relations`, :attr:`literals`,
+        :attr:`individuals`, and :attr:`triples`, defer the notifications of their observers (cf.
+        :meth:`ordered_set.OrderedSet.bulk_update`). When the context is left, the changes are registered in batches,
+        which is considerably faster than registering them one by one when a large number of elements is added:
+        
+            with kg.bulk_update():
+                for t in many_triples:
+                    kg.triples.add(t)
+        
+        Notice that, within the context, the graph might not be consistent yet. For example, the individuals of a triple
+        that has just been added might not be contained in :attr:`individuals` until the context is left.
+        
+        Yields:
+            :class:`KnowledgeGraph`: The graph itself.
+        """
+        with contextlib.ExitStack() as stack:
+            # the triples are entered last, and thus flushed first, as registering them may cause further changes
+            stack.enter_context(self._individuals.bulk_update())
+            stack.enter_context(self._classes.bulk_update())
+            stack.enter_context(self._relations.bulk_update())
+            stack.enter_context(self._literals.bulk_update())
+            stack.enter_context(self._triples.bulk_update())
+            yield self
     
     def class_added(self, ind, cls: class_membership.ClassMembership) -> None:
         self._classes.add(cls.cls)
+        self._memberships.add(ind.index, cls)
     
     def class_removed(self, ind, cls: class_membership.ClassMembership) -> None:
-        pass  # nothing
+        self._memberships.discard(ind.index, cls)
 
     def element_added(self, elem) -> None:
         if isinstance(elem, individual.Individual):
             self._register_individual(elem)
         elif isinstance(elem, triple.Triple):
             self._register_triple(elem)
+            self._triple_store.add(elem)
+        elif isinstance(elem, class_type.ClassType):
+            self._memberships.extend(num_classes=elem.index + 1)
 
-    def element_removed(self, elem: typing.Union[individual.Individual, triple.Triple]) -> None:
-        pass  # nothing to do
+    def element_removed(self, elem) -> None:
+        if isinstance(elem, individual.Individual):
+            self._unregister_individual(elem)
+        elif isinstance(elem, triple.Triple):
+            self._triple_store.discard(elem)
+    
+    def elements_added(self, elements: typing.Sequence) -> None:
+        # all elements of a batch stem from the same set, and are thus of the same type
+        if not elements:
+            return
+        if isinstance(elements[0], individual.Individual):
+            self._memberships.extend(num_individuals=max(i.index for i in elements) + 1)
+            for i in elements:
+                self._register_individual(i)
+        elif isinstance(elements[0], triple.Triple):
+            self._register_triples(elements)
+            self._triple_store.add_all(elements)
+        elif isinstance(elements[0], class_type.ClassType):
+            self._memberships.extend(num_classes=max(c.index for c in elements) + 1)
 
     def literal_added(self, ind, lit: literal_value.LiteralValue) -> None:
         self._literals.add(lit.literal)
+        self._literal_store.add(ind.index, lit)
     
     def literal_removed(self, ind, lit: literal_value.LiteralValue) -> None:
-        pass  # nothing to do
+        self._literal_store.discard(ind.index, lit)
+    
+    def view(
+            self,
+            status: typing.Iterable[int] = st.ALL,
+            positive: bool = None,
+            relations: typing.Iterable[typing.Union[relation_type.RelationType, int]] = None,
+            classes: typing.Iterable[typing.Union[class_type.ClassType, int]] = None,
+            literals: typing.Iterable[typing.Union[literal_type.LiteralType, int]] = None
+    ) -> kg_view.KgView:
+        """Creates a live, read-only view of those parts of the ``KnowledgeGraph`` that satisfy the provided filters.
+        
+        Args:
+            status (iterable[int], optional): The status codes of the data that is part of the view. By default, all
+                status codes are considered.
+            positive (bool, optional): If this is provided, then only positive or negative data is part of the view.
+            relations (iterable, optional): The relations (or their indices) of the triples that are part of the view.
+            classes (iterable, optional): The classes (or their indices) of the memberships that are part of the view.
+            literals (iterable, optional): The literals (or their indices) of the literal values that are part of the
+                view.
+        
+        Returns:
+            :class:`kg_view.KgView`: The created view (cf. :class:`kg_view.KgView` for details).
+        """
+        return kg_view.KgView(
+                self,
+                status=status,
+                positive=positive,
+                relations=relations,
+                classes=classes,
+                literals=literals
+        )
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import literal_value
+from reldata.data import status as st
+from reldata.vocab import literal_type
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+# ==================================================================================================================== #
+#  CLASS  L I T E R A L  S T O R E                                                                                     #
+# ==================================================================================================================== #
+
+
+class LiteralStore(object):
+    """Stores the literal values of all individuals in a knowledge graph in a columnar manner.
+    
+    For every literal and status code, a ``LiteralStore`` provides a :class:`LiteralColumn`, i.e., a pair of arrays that
+    contain the indices of all individuals that have a value for the literal as well as the values themselves. The
+    values of a column are converted to the most specific of the types ``bool``, ``int``, ``float``, and ``str`` that
+    all of them are compatible with, which allows for processing numeric literals in a vectorized manner:
+        
+        ages = kg.literal_store.column(age_literal)
+        adults = ages.individuals[ages.values >= 18]
+        thirties = ages.range(30, 40)
+    
+    Columns are created on first request, and are cached until any of their values changes. Notice that a
+    ``LiteralStore`` is not populated by itself, but is maintained by the :class:`knowledge_graph.KnowledgeGraph` that
+    it belongs to.
+    """
+    
+    def __init__(self):
+        """Creates a new empty ``LiteralStore``."""
+        self._columns = {}  # maps pairs of literal index and status code to the created columns
+        self._values = {}   # maps pairs of literal index and status code to dicts with pairs of individual and value
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._values.values())
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def _key(literal: typing.Union[literal_type.LiteralType, int], status: int) -> typing.Tuple[int, int]:
+        """Computes the key of a column."""
+        if isinstance(literal, literal_type.LiteralType):
+            literal = literal.index
+        return int(literal), int(status)
+    
+    def add(self, ind_index: int, value: literal_value.LiteralValue) -> None:
+        """Stores a literal value of an individual.
+        
+        Args:
+            ind_index (int): The index of the individual that the value belongs to.
+            value (:class:`literal_value.LiteralValue`): The value to store.
+        """
+        key = self._key(value.literal, st.of(value))
+        self._values.setdefault(key, {})[(ind_index, value)] = None
+        self._columns.pop(key, None)
+    
+    def clear(self) -> None:
+        """Removes all values from a ``LiteralStore``."""
+        self._columns.clear()
+        self._values.clear()
+    
+    def column(self, literal: typing.Union[literal_type.LiteralType, int], status: int = st.FACT) -> "LiteralColumn":
+        """Retrieves the values of one literal.
+        
+        Args:
+            literal (:class:`literal_type.LiteralType` or int): The literal (or its index) to retrieve values for.
+            status (int, optional): The status code of the considered values. This defaults to facts.
+        
+        Returns:
+            :class:`LiteralColumn`: The values of the literal in the order that they were added in.
+        """
+        key = self._key(literal, status)
+        column = self._columns.get(key)
+        if column is None:
+            values = self._values.get(key, {})
+            column = LiteralColumn(
+                    np.fromiter((ind for ind, _ in values), dtype=np.int64, count=len(values)),
+                    LiteralColumn.convert([v.value for _, v in values])
+            )
+            self._columns[key] = column
+        return column
+    
+    def discard(self, ind_index: int, value: literal_value.LiteralValue) -> None:
+        """Removes a literal value of an individual if it is stored.
+        
+        Args:
+            ind_index (int): The index of the individual that the value belongs to.
+            value (:class:`literal_value.LiteralValue`): The value to remove.
+        """
+        key = self._key(value.literal, st.of(value))
+        values = self._values.get(key)
+        if values is not None and (ind_index, value) in values:
+            del values[(ind_index, value)]
+            self._columns.pop(key, None)
+
+
+# ==================================================================================================================== #
+#  CLASS  L I T E R A L  C O L U M N                                                                                   #
+# ==================================================================================================================== #
+
+
+class LiteralColumn(object):
+    """The values of one literal of all individuals in a knowledge graph (cf. :class:`LiteralStore`).
+    
+    Besides the arrays of individuals and values, a ``LiteralColumn`` provides range queries, which are answered by
+    means of binary search. To that end, the values are sorted on the first query.
+    """
+    
+    BOOL_TOKENS = {"true": True, "false": False}
+    """dict: The (lowercase) tokens that are recognized as boolean values."""
+    
+    def __init__(self, individuals: np.ndarray, values: np.ndarray):
+        """Creates a new ``LiteralColumn``.
+        
+        Args:
+            individuals (``numpy.ndarray``): The indices of the individuals that the values belong to.
+            values (``numpy.ndarray``): The values, which are of the same length as ``individuals``.
+        """
+        self._individuals = individuals
+        self._order = None          # the order that sorts the values, which is computed on demand
+        self._sorted_values = None  # the sorted values, which are computed on demand
+        self._values = values
+        self._individuals.flags.writeable = False
+        self._values.flags.writeable = False
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __len__(self) -> int:
+        return len(self._individuals)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def dtype(self) -> np.dtype:
+        """``numpy.dtype``: The type of the values, which is either ``bool``, ``int64``, ``float64``, or a string type.
+        """
+        return self._values.dtype
+    
+    @property
+    def individuals(self) -> np.ndarray:
+        """``numpy.ndarray``: The read-only indices of the individuals that the values belong to."""
+        return self._individuals
+    
+    @property
+    def is_numeric(self) -> bool:
+        """bool: Indicates whether the values are numbers, i.e., ``int`` or ``float``."""
+        return np.issubdtype(self._values.dtype, np.number)
+    
+    @property
+    def values(self) -> np.ndarray:
+        """``numpy.ndarray``: The read-only values, where the i-th value belongs to the i-th individual."""
+        return self._values
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def convert(cls, values: typing.Sequence) -> np.ndarray:
+        """Converts a sequence of raw literal values to an array of the most specific type possible.
+        
+        Values are converted to ``bool`` if all of them are either booleans or one of the :attr:`BOOL_TOKENS`, to
+        ``int64`` or ``float64`` if all of them are numbers or can be parsed as such, and to ``str`` otherwise.
+        
+        Args:
+            values (sequence): The values to convert.
+        
+        Returns:
+            ``numpy.ndarray``: The converted values.
+        """
+        values = list(values)
+        if not values:
+            return np.zeros(0, dtype=np.int64)
+        
+        # check for booleans
+        if all(isinstance(v, (bool, np.bool_)) for v in values):
+            return np.array(values, dtype=np.bool_)
+        if all(isinstance(v, str) and v.lower() in cls.BOOL_TOKENS for v in values):
+            return np.array([cls.BOOL_TOKENS[v.lower()] for v in values], dtype=np.bool_)
+        
+        # check for numbers
+        array = np.array(values)
+        if array.dtype.kind in "iu":
+            return array.astype(np.int64)
+        elif array.dtype.kind == "f":
+            return array.astype(np.float64)
+        array = array.astype(str)  # -> values of mixed types are parsed from their string representations
+        for dtype in [np.int64, np.float64]:
+            try:
+                return array.astype(dtype)
+            except (ValueError, OverflowError):
+                pass  # -> try the next type
+        
+        return array
+    
+    def range(self, low=None, high=None) -> np.ndarray:
+        """Retrieves all individuals whose values lie within the specified range (inclusively).
+        
+        Args:
+            low (optional): The lower bound of the range. If this is ``None``, then the range is unbounded below.
+            high (optional): The upper bound of the range. If this is ``None``, then the range is unbounded above.
+        
+        Returns:
+            ``numpy.ndarray``: The indices of the individuals whose values lie within the range, sorted by values.
+        """
+        if self._order is None:
+            self._order = np.argsort(self._values, kind="stable")
+            self._sorted_values = self._values[self._order]
+        
+        start = 0 if low is None else np.searchsorted(self._sorted_values, low, side="left")
+        end = len(self._order) if high is None else np.searchsorted(self._sorted_values, high, side="right")
+        return self._individuals[self._order[start:end]]
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import class_membership
+from reldata.data import status as st
+from reldata.vocab import class_type
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class MembershipStore(object):
+    """Stores all class memberships of the individuals in a knowledge graph as bit-packed three-valued matrices.
+    
+    For each of the status codes defined in :mod:`reldata.data.status`, a ``MembershipStore`` maintains one matrix of
+    shape individuals x classes, whose cells are ``1`` if an individual is specified to be a member of a class, ``-1``
+    if it is specified to not be a member, and ``0`` otherwise. This is the same format that is used by the files that
+    store class memberships on disk.
+    
+    Each matrix is stored in bit-packed form (cf. :meth:`packed_matrix`), i.e., as two binary matrices that indicate
+    memberships and non-memberships, respectively, which requires just two bits per cell. The packed matrices grow as
+    needed, and allow for probing memberships in O(1) as well as for reading entire rows (the memberships of one
+    individual) and columns (the individuals of one class) as ``numpy.ndarray``s. Dense ``int8`` matrices are only
+    created on request (cf. :meth:`matrix`), and are not kept by the store. Furthermore, a ``MembershipStore`` keeps
+    track of the numbers of members and non-members of every class, which are thus available in O(1) (cf.
+    :meth:`count`).
+    
+    Notice that a ``MembershipStore`` is not populated by itself, but is maintained by the
+    :class:`knowledge_graph.KnowledgeGraph` that it belongs to. Furthermore, a cell can only hold one of the values
+    above, which is why contradictory statements about the same individual, class, and status cannot be represented.
+    """
+    
+    MIN_CAPACITY = 16
+    """int: The minimum number of rows and columns, respectively, that is allocated for the matrices."""
+    
+    def __init__(self):
+        """Creates a new empty ``MembershipStore``."""
+        # the packed matrices of shape status codes x 2 x individuals x bytes, where the second axis distinguishes
+        # memberships (0) from non-memberships (1)
+        self._bits = np.zeros(
+                (len(st.ALL), 2, self.MIN_CAPACITY, self._num_bytes(self.MIN_CAPACITY)),
+                dtype=np.uint8
+        )
+        self._counts = np.zeros((len(st.ALL), 2, 8 * self._bits.shape[3]), dtype=np.int64)  # the column sums
+        self._num_classes = 0      # the number of columns of the matrices that are in use
+        self._num_individuals = 0  # the number of rows of the matrices that are in use
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def nbytes(self) -> int:
+        """int: The number of bytes that are allocated for the matrices."""
+        return self._bits.nbytes
+    
+    @property
+    def shape(self) -> typing.Tuple[int, int]:
+        """tuple[int, int]: The shape of each of the matrices, i.e., the number of individuals and classes."""
+        return self._num_individuals, self._num_classes
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def _cell(cls_index: int) -> typing.Tuple[int, np.uint8]:
+        """Computes the byte that the cells of a class are stored in and the bit mask that selects them."""
+        byte, bit = divmod(cls_index, 8)
+        return byte, np.uint8(0x80 >> bit)  # -> np.packbits uses big-endian bit order
+    
+    @staticmethod
+    def _cls_index(cls: typing.Union[class_type.ClassType, int]) -> int:
+        """Retrieves the index of a class that is provided either as :class:`class_type.ClassType` or as index."""
+        return cls.index if isinstance(cls, class_type.ClassType) else int(cls)
+    
+    @staticmethod
+    def _num_bytes(num_classes: int) -> int:
+        """Computes the number of bytes that the packed cells of one row of a matrix occupy."""
+        return (num_classes + 7) // 8
+    
+    @staticmethod
+    def _read_only(array: np.ndarray) -> np.ndarray:
+        """Marks a view of the data of a ``MembershipStore`` as read-only, and returns it."""
+        array.flags.writeable = False
+        return array
+    
+    def _set(self, status: int, ind_index: int, cls_index: int, value: int) -> None:
+        """Sets a single cell of a matrix to the provided value (-1, 0, or 1)."""
+        byte, mask = self._cell(cls_index)
+        cells = self._bits[status, :, ind_index]
+        for polarity in [0, 1]:
+            if cells[polarity, byte] & mask:
+                self._counts[status, polarity, cls_index] -= 1
+        cells[:, byte] &= ~mask
+        if value != 0:
+            polarity = 0 if value == 1 else 1
+            cells[polarity, byte] |= mask
+            self._counts[status, polarity, cls_index] += 1
+    
+    def add(self, ind_index: int, membership: class_membership.ClassMembership) -> None:
+        """Stores a class membership of an individual.
+        
+        Args:
+            ind_index (int): The index of the individual that the membership belongs to.
+            membership (:class:`class_membership.ClassMembership`): The membership to store.
+        """
+        cls_index = membership.cls.index
+        self.extend(num_individuals=ind_index + 1, num_classes=cls_index + 1)
+        self._set(st.of(membership), ind_index, cls_index, 1 if membership.is_member else -1)
+    
+    def clear(self) -> None:
+        """Removes all memberships from a ``MembershipStore``."""
+        self._bits[...] = 0
+        self._counts[...] = 0
+    
+    def column(self, cls: typing.Union[class_type.ClassType, int], status: int = st.FACT) -> np.ndarray:
+        """Retrieves the memberships of all individuals of one class.
+        
+        Args:
+            cls (:class:`class_type.ClassType` or int): The class (or its index) to retrieve memberships for.
+            status (int, optional): The status code of the considered memberships. This defaults to facts.
+        
+        Returns:
+            ``numpy.ndarray``: A read-only ``int8`` vector that contains one value (-1, 0, or 1) for each individual.
+        """
+        cls = self._cls_index(cls)
+        if cls >= self._num_classes:
+            return np.zeros(self._num_individuals, dtype=np.int8)
+        byte, mask = self._cell(cls)
+        cells = self._bits[status, :, :self._num_individuals, byte] & mask
+        return self._read_only((cells[0] != 0).astype(np.int8) - (cells[1] != 0).astype(np.int8))
+    
+    def count(self, cls: typing.Union[class_type.ClassType, int], is_member: bool = True, status: int = st.FACT) -> int:
+        """Counts the individuals that are specified as members or non-members of a class.
+        
+        Args:
+            cls (:class:`class_type.ClassType` or int): The class (or its index) to count individuals for.
+            is_member (bool, optional): Indicates whether to count members (the default) or non-members.
+            status (int, optional): The status code of the considered memberships. This defaults to facts.
+        
+        Returns:
+            int: The number of individuals, i.e., the number of cells of the according column that are ``1`` (or
+                ``-1``).
+        """
+        cls = self._cls_index(cls)
+        if cls >= self._num_classes:
+            return 0
+        return int(self._counts[status, 0 if is_member else 1, cls])
+    
+    def discard(self, ind_index: int, membership: class_membership.ClassMembership) -> None:
+        """Removes a class membership of an individual if it is stored.
+        
+        Args:
+            ind_index (int): The index of the individual that the membership belongs to.
+            membership (:class:`class_membership.ClassMembership`): The membership to remove.
+        """
+        status = st.of(membership)
+        cls_index = membership.cls.index
+        if self.get(ind_index, cls_index, status=status) == (1 if membership.is_member else -1):
+            self._set(status, ind_index, cls_index, 0)
+    
+    def discard_individual(self, ind_index: int) -> None:
+        """Removes all memberships of one individual.
+        
+        Args:
+            ind_index (int): The index of the individual whose memberships are removed.
+        """
+        if ind_index < self._num_individuals:
+            cells = np.unpackbits(self._bits[:, :, ind_index], axis=-1)
+            self._counts[:, :, :cells.shape[-1]] -= cells
+            self._bits[:, :, ind_index] = 0
+    
+    def extend(self, num_individuals: int = 0, num_classes: int = 0) -> None:
+        """Ensures that the matrices of a ``MembershipStore`` have at least the specified shape.
+        
+        Args:
+            num_individuals (int, optional): The minimum number of rows.
+            num_classes (int, optional): The minimum number of columns.
+        """
+        num_individuals = max(num_individuals, self._num_individuals)
+        num_classes = max(num_classes, self._num_classes)
+        
+        # allocate more memory if necessary (the capacity is doubled in order to obtain amortized constant costs)
+        _, _, cap_individuals, cap_bytes = self._bits.shape
+        num_bytes = self._num_bytes(num_classes)
+        if num_individuals > cap_individuals or num_bytes > cap_bytes:
+            if num_individuals > cap_individuals:
+                cap_individuals = max(num_individuals, 2 * cap_individuals)
+            if num_bytes > cap_bytes:
+                cap_bytes = max(num_bytes, 2 * cap_bytes)
+            new_bits = np.zeros((len(st.ALL), 2, cap_individuals, cap_bytes), dtype=np.uint8)
+            used_bytes = self._num_bytes(self._num_classes)
+            new_bits[:, :, :self._num_individuals, :used_bytes] = self._bits[:, :, :self._num_individuals, :used_bytes]
+            new_counts = np.zeros((len(st.ALL), 2, 8 * cap_bytes), dtype=np.int64)
+            new_counts[:, :, :self._num_classes] = self._counts[:, :, :self._num_classes]
+            self._bits = new_bits
+            self._counts = new_counts
+        
+        self._num_individuals = num_individuals
+        self._num_classes = num_classes
+    
+    def get(self, ind_index: int, cls: typing.Union[class_type.ClassType, int], status: int = st.FACT) -> int:
+        """Retrieves the membership of one individual of one class.
+        
+        Args:
+            ind_index (int): The index of the individual.
+            cls (:class:`class_type.ClassType` or int): The class (or its index).
+            status (int, optional): The status code of the considered membership. This defaults to facts.
+        
+        Returns:
+            int: ``1`` if the individual is a member of the class, ``-1`` if it is not a member, and ``0`` if this is
+                not specified.
+        """
+        cls = self._cls_index(cls)
+        if ind_index >= self._num_individuals or cls >= self._num_classes:
+            return 0
+        byte, mask = self._cell(cls)
+        if self._bits[status, 0, ind_index, byte] & mask:
+            return 1
+        if self._bits[status, 1, ind_index, byte] & mask:
+            return -1
+        return 0
+    
+    def matrices(self) -> np.ndarray:
+        """Retrieves the membership matrices for all status codes at once.
+        
+        Returns:
+            ``numpy.ndarray``: A newly created, read-only ``int8`` array of shape status codes x individuals x classes,
+                which is indexed by the status codes defined in :mod:`reldata.data.status`.
+        """
+        return self._read_only(np.stack([self.matrix(status) for status in st.ALL]))
+    
+    def matrix(self, status: int = st.FACT) -> np.ndarray:
+        """Retrieves the membership matrix for one status code.
+        
+        The matrix is unpacked on every call, which is why it should be stored rather than requested repeatedly, if
+        necessary, and :meth:`get`, :meth:`row`, and :meth:`column` should be preferred for reading parts of it.
+        
+        Args:
+            status (int, optional): The status code of the memberships to retrieve. This defaults to facts.
+        
+        Returns:
+            ``numpy.ndarray``: A newly created, read-only ``int8`` matrix of shape individuals x classes.
+        """
+        return self._read_only(self.unpack_matrix(*self.packed_matrix(status), self._num_classes))
+    
+    def packed_matrix(self, status: int = st.FACT) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Retrieves the membership matrix for one status code in bit-packed form.
+        
+        The matrix is split into two binary matrices that indicate memberships and non-memberships, respectively, and
+        each of these is packed along the class axis like ``numpy.packbits`` does. These are the matrices that the
+        memberships are stored in, and thus retrieving them does not copy any data.
+        
+        Args:
+            status (int, optional): The status code of the memberships to retrieve. This defaults to facts.
+        
+        Returns:
+            tuple[``numpy.ndarray``, ``numpy.ndarray``]: Two read-only ``uint8`` matrices of shape individuals x
+                ceil(classes / 8), which specify the cells that are ``1`` and ``-1``, respectively (cf.
+                :meth:`unpack_matrix`).
+        """
+        num_bytes = self._num_bytes(self._num_classes)
+        return (
+                self._read_only(self._bits[status, 0, :self._num_individuals, :num_bytes]),
+                self._read_only(self._bits[status, 1, :self._num_individuals, :num_bytes])
+        )
+    
+    def row(self, ind_index: int, status: int = st.FACT) -> np.ndarray:
+        """Retrieves all memberships of one individual.
+        
+        Args:
+            ind_index (int): The index of the individual to retrieve memberships for.
+            status (int, optional): The status code of the considered memberships. This defaults to facts.
+        
+        Returns:
+            ``numpy.ndarray``: A read-only ``int8`` vector that contains one value (-1, 0, or 1) for each class.
+        """
+        if ind_index >= self._num_individuals:
+            return np.zeros(self._num_classes, dtype=np.int8)
+        num_bytes = self._num_bytes(self._num_classes)
+        cells = self._bits[status, :, ind_index:ind_index + 1, :num_bytes]
+        return self._read_only(self.unpack_matrix(cells[0], cells[1], self._num_classes)[0])
+    
+    @staticmethod
+    def unpack_matrix(positive: np.ndarray, negative: np.ndarray, num_classes: int) -> np.ndarray:
+        """Restores a three-valued membership matrix from its bit-packed form (cf. :meth:`packed_matrix`).
+        
+        Args:
+            positive (``numpy.ndarray``): The packed matrix that specifies memberships.
+            negative (``numpy.ndarray``): The packed matrix that specifies non-memberships.
+            num_classes (int): The number of classes, i.e., columns, of the original matrix.
+        
+        Returns:
+            ``numpy.ndarray``: The ``int8`` membership matrix.
+        """
+        positive = np.unpackbits(positive, axis=1)[:, :num_classes].astype(np.int8)
+        negative = np.unpackbits(negative, axis=1)[:, :num_classes].astype(np.int8)
+        return positive - negative
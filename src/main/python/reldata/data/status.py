@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""This module defines integer codes for the status of the data in a knowledge graph.
+
+Every triple, class membership, and literal value in a knowledge graph is either a fact, an inference, or a prediction
+target. Index structures and array encodings of knowledge graphs use the codes defined in this module to refer to these.
+"""
+
+
+import typing
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+FACT = 0
+"""int: The code that is used for data that is specified as fact."""
+
+INFERRED = 1
+"""int: The code that is used for data that is inferable."""
+
+PREDICTION = 2
+"""int: The code that is used for data that are prediction targets, i.e., neither facts nor inferable."""
+
+ALL = (FACT, INFERRED, PREDICTION)
+"""tuple[int]: All of the available status codes."""
+
+
+def of(obj) -> int:
+    """Determines the status code of a triple, a class membership, or a literal value.
+    
+    Args:
+        obj: The object whose status is determined, which has to provide the attributes ``inferred`` and
+            ``prediction``.
+    
+    Returns:
+        int: The status code of ``obj``.
+    """
+    if obj.inferred:
+        return INFERRED
+    elif obj.prediction:
+        return PREDICTION
+    else:
+        return FACT
+
+
+def to_flags(status: int) -> typing.Tuple[bool, bool]:
+    """Converts a status code into the flags ``inferred`` and ``prediction`` that are used by the data classes.
+    
+    Args:
+        status (int): The status code to convert.
+    
+    Returns:
+        tuple[bool, bool]: The values of ``inferred`` and ``prediction`` that correspond with ``status``.
+    
+    Raises:
+        ValueError: If ``status`` is not a valid status code.
+    """
+    if status == FACT:
+        return False, False
+    elif status == INFERRED:
+        return True, False
+    elif status == PREDICTION:
+        return False, True
+    else:
+        raise ValueError("Invalid status code: {}!".format(status))
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import kg_arrays
+from reldata.data import knowledge_graph
+from reldata.data import status as st
+from reldata.data import triple_store
+from reldata.vocab import vocab_registry as vr
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SubgraphExtractor(object):
+    """Extracts the k-hop neighborhoods of individuals of a knowledge graph as standalone graphs.
+    
+    A ``SubgraphExtractor`` encodes a graph once, and builds index arrays in compressed sparse row format (CSR) for
+    traversing its triples as well as for looking up the triples, class memberships, and literal values of individuals.
+    Based on these, :meth:`extract` determines the individuals that are reachable from a set of seeds within a number of
+    hops, and gathers the subgraph that is induced by them without touching any other data:
+        
+        extractor = SubgraphExtractor(kg)
+        subgraph, individual_ids = extractor.extract([seed], num_hops=2)
+    
+    The individuals of an extracted subgraph are indexed densely, starting with the seeds, followed by the individuals
+    that are reached after one hop, and so forth. ``individual_ids`` maps these indices back to the indices of the
+    individuals in the original graph. Only triples with one of the considered status codes and polarities are
+    traversed, but the induced subgraph contains all triples among the extracted individuals.
+    
+    Notice that a ``SubgraphExtractor`` works on a snapshot of the graph that it was created for, i.e., it does not
+    reflect any changes that are applied to the graph later on.
+    """
+    
+    def __init__(
+            self,
+            kg: typing.Union[knowledge_graph.KnowledgeGraph, kg_arrays.KgArrays],
+            status: typing.Iterable[int] = (st.FACT,),
+            positive: bool = True,
+            directed: bool = False
+    ):
+        """Creates a new ``SubgraphExtractor``.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph` or :class:`kg_arrays.KgArrays`): The graph to extract subgraphs
+                from.
+            status (iterable[int], optional): The status codes of the triples that are traversed. This defaults to
+                facts only.
+            positive (bool, optional): Indicates whether positive or negative triples are traversed. This defaults to
+                ``True``.
+            directed (bool, optional): Indicates whether triples are traversed from subjects to objects only, rather
+                than in both directions. This defaults to ``False``.
+        """
+        if isinstance(kg, knowledge_graph.KnowledgeGraph):
+            kg = kg_arrays.KgArrays.from_kg(kg)
+        self._arrays = kg
+        num_individuals = len(kg.individuals)
+        triples = kg.triples
+        
+        # build the CSR arrays that are used for traversing the considered triples
+        mask = (
+                np.isin(triples[:, triple_store.TripleStore.STATUS], list(status)) &
+                (triples[:, triple_store.TripleStore.POSITIVE] == int(positive))
+        )
+        sources = triples[mask, triple_store.TripleStore.SUBJECT]
+        targets = triples[mask, triple_store.TripleStore.OBJECT]
+        if not directed:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+        self._neighbor_ptr, order = self._index(sources, num_individuals)
+        self._neighbors = targets[order]
+        
+        # build the CSR arrays that are used for looking up the data of individuals
+        self._triple_ptr, self._triple_rows = self._index(triples[:, triple_store.TripleStore.SUBJECT], num_individuals)
+        self._membership_ptr, self._membership_rows = self._index(kg.memberships[:, 0], num_individuals)
+        self._literal_ptr, self._literal_rows = self._index(
+                np.array([value[0] for value in kg.literal_values], dtype=np.int64),
+                num_individuals
+        )
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def _gather(indptr: np.ndarray, values: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Retrieves the concatenation of the entries of the specified rows of a matrix in CSR format."""
+        starts = indptr[rows]
+        lengths = indptr[rows + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return values[:0]
+        
+        # compute the position of every entry as start of its row plus its offset within the row
+        offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return values[np.repeat(starts, lengths) + offsets]
+    
+    @staticmethod
+    def _index(keys: np.ndarray, num_rows: int) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Computes the index pointers and the order of entries that sort the provided row keys in CSR format."""
+        order = np.argsort(keys, kind="mergesort")
+        indptr = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=num_rows), out=indptr[1:])
+        return indptr, order
+    
+    def extract(
+            self,
+            seeds: typing.Iterable[int],
+            num_hops: int = 1,
+            as_kg: bool = False,
+            vocab_registry: vr.VocabRegistry = None
+    ) -> typing.Tuple[typing.Union[kg_arrays.KgArrays, knowledge_graph.KnowledgeGraph], np.ndarray]:
+        """Extracts the subgraph that is induced by the k-hop neighborhood of the provided seeds.
+        
+        Args:
+            seeds (iterable[int]): The indices of the individuals to start from.
+            num_hops (int, optional): The maximum number of hops, i.e., k. This defaults to ``1``.
+            as_kg (bool, optional): Indicates whether the subgraph is returned as
+                :class:`knowledge_graph.KnowledgeGraph` rather than :class:`kg_arrays.KgArrays`. This defaults to
+                ``False``.
+            vocab_registry (:class:`vr.VocabRegistry`, optional): The registry that the vocabulary of the subgraph is
+                retrieved from if ``as_kg`` is ``True``.
+        
+        Returns:
+            tuple: The extracted subgraph, and an ``int64`` vector whose i-th element is the index in the original graph
+                of the individual with index i in the subgraph.
+        
+        Raises:
+            ValueError: If ``num_hops`` is negative, or any of the seeds is not the index of an individual.
+        """
+        # sanitize args
+        if num_hops < 0:
+            raise ValueError("<num_hops> has to be non-negative, but is {}!".format(num_hops))
+        num_individuals = len(self._arrays.individuals)
+        seeds = np.asarray(list(seeds), dtype=np.int64)
+        if np.any((seeds < 0) | (seeds >= num_individuals)):
+            raise ValueError("<seeds> contains indices of individuals that do not exist!")
+        
+        # determine the reachable individuals in a breadth-first manner, one hop at a time
+        _, first = np.unique(seeds, return_index=True)
+        frontier = seeds[np.sort(first)]
+        local_ids = np.full(num_individuals, -1, dtype=np.int64)
+        local_ids[frontier] = np.arange(len(frontier))
+        layers = [frontier]
+        num_nodes = len(frontier)
+        for _ in range(num_hops):
+            neighbors = self._gather(self._neighbor_ptr, self._neighbors, frontier)
+            frontier = np.unique(neighbors[local_ids[neighbors] < 0])
+            if len(frontier) == 0:
+                break
+            local_ids[frontier] = np.arange(num_nodes, num_nodes + len(frontier))
+            layers.append(frontier)
+            num_nodes += len(frontier)
+        individual_ids = np.concatenate(layers)
+        
+        # gather the induced triples, and re-index their subjects and objects
+        triples = self._arrays.triples[self._gather(self._triple_ptr, self._triple_rows, individual_ids)]
+        triples = triples[local_ids[triples[:, triple_store.TripleStore.OBJECT]] >= 0]
+        triples[:, triple_store.TripleStore.SUBJECT] = local_ids[triples[:, triple_store.TripleStore.SUBJECT]]
+        triples[:, triple_store.TripleStore.OBJECT] = local_ids[triples[:, triple_store.TripleStore.OBJECT]]
+        
+        # gather the class memberships and literal values of the extracted individuals
+        memberships = self._arrays.memberships[
+                self._gather(self._membership_ptr, self._membership_rows, individual_ids)
+        ]
+        memberships[:, 0] = local_ids[memberships[:, 0]]
+        literal_values = [
+                (int(local_ids[ind]), lit, value, status)
+                for ind, lit, value, status in (
+                        self._arrays.literal_values[i]
+                        for i in self._gather(self._literal_ptr, self._literal_rows, individual_ids).tolist()
+                )
+        ]
+        
+        # assemble the subgraph
+        subgraph = kg_arrays.KgArrays(
+                self._arrays.classes,
+                self._arrays.relations,
+                self._arrays.literals,
+                [self._arrays.individuals[i] for i in individual_ids.tolist()],
+                triples,
+                memberships,
+                literal_values
+        )
+        if as_kg:
+            subgraph = subgraph.to_kg(vocab_registry=vocab_registry)
+        return subgraph, individual_ids
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import kg_encoding
+from reldata.data import knowledge_graph
+from reldata.data import status as st
+from reldata.data import triple
+from reldata.data import triple_store
+from reldata.vocab import class_type
+from reldata.vocab import literal_type
+from reldata.vocab import relation_type
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+# ==================================================================================================================== #
+#  CLASS  T E M P O R A L  K N O W L E D G E  G R A P H                                                                #
+# ==================================================================================================================== #
+
+
+class TemporalKnowledgeGraph(object):
+    """A compact representation of a sequence of knowledge graphs that share the same vocabulary and individuals.
+    
+    Instead of storing every step of a sequence as a separate :class:`knowledge_graph.KnowledgeGraph`, a
+    ``TemporalKnowledgeGraph`` stores each distinct triple, class membership, and literal value that appears in any of
+    the steps exactly once, together with a *validity bitmap*, which specifies the steps that it appears in. Bitmaps are
+    stored as rows of packed ``uint8`` arrays (cf. ``numpy.packbits``), i.e., the bit for step k of an item is found at
+    bit position ``7 - k % 8`` of byte ``k // 8``.
+    
+    The data are encoded as integer arrays as follows:
+    
+    - :attr:`triples`: the same encoding as used by :class:`triple_store.TripleStore`,
+    - :attr:`memberships`: rows of individual, class, membership (``1`` or ``-1``), and status code, and
+    - :attr:`literal_values`: rows of individual, literal, value (an index into :attr:`values`), and status code.
+    
+    Single steps are accessed by means of :meth:`step`, which provides a lightweight view in O(1), and may be
+    materialized as :class:`knowledge_graph.KnowledgeGraph` via :meth:`materialize`.
+    """
+    
+    def __init__(self, kgs: typing.Sequence[knowledge_graph.KnowledgeGraph]):
+        """Creates a new ``TemporalKnowledgeGraph`` from a sequence of knowledge graphs.
+        
+        Args:
+            kgs (sequence[:class:`knowledge_graph.KnowledgeGraph`]): The steps of the sequence, which are expected to
+                share the same vocabulary and individuals, like the sequences loaded by
+                :meth:`kg_reader.KgReader.read_sequence`. The vocabulary and the individuals are taken from the first
+                step.
+        
+        Raises:
+            ValueError: If ``kgs`` is empty.
+        """
+        kgs = list(kgs)
+        if not kgs:
+            raise ValueError("A TemporalKnowledgeGraph has to consist of at least one step!")
+        
+        self._num_steps = len(kgs)
+        
+        # store vocabulary and individuals of the first step
+        self._classes = tuple(kgs[0].classes)
+        self._relations = tuple(kgs[0].relations)
+        self._literals = tuple(kgs[0].literals)
+        self._individuals = tuple(i.name for i in kgs[0].individuals)
+        
+        # encode triples
+        self._triples, self._triple_validity = self._encode([kg.triple_store.array() for kg in kgs])
+        self._triple_rows = {tuple(row): idx for idx, row in enumerate(self._triples.tolist())}
+        
+        # encode class memberships
+        self._memberships, self._membership_validity = self._encode([kg_encoding.encode_memberships(kg) for kg in kgs])
+        
+        # encode literal values, which are distinguished by their types as well, as, e.g., 1 == 1.0 == True
+        value_ids = {}
+        self._values = []
+        literal_rows = []
+        for kg in kgs:
+            rows = []
+            for ind, lit, value, status in kg_encoding.encode_literal_values(kg):
+                key = (type(value), value)
+                value_id = value_ids.get(key)
+                if value_id is None:
+                    value_id = value_ids[key] = len(self._values)
+                    self._values.append(value)
+                rows.append((ind, lit, value_id, status))
+            literal_rows.append(np.array(rows, dtype=np.int64).reshape(-1, 4))
+        self._literal_values, self._literal_validity = self._encode(literal_rows)
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __len__(self) -> int:
+        return self._num_steps
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def classes(self) -> typing.Tuple[class_type.ClassType, ...]:
+        """tuple[:class:`class_type.ClassType`]: The classes of all steps."""
+        return self._classes
+    
+    @property
+    def individuals(self) -> typing.Tuple[str, ...]:
+        """tuple[str]: The names of the individuals of all steps in the order of their indices."""
+        return self._individuals
+    
+    @property
+    def literal_validity(self) -> np.ndarray:
+        """``numpy.ndarray``: The packed validity bitmaps of the rows of :attr:`literal_values`."""
+        return self._literal_validity
+    
+    @property
+    def literal_values(self) -> np.ndarray:
+        """``numpy.ndarray``: All distinct literal values of the sequence as rows of individual, literal, value index,
+        and status code.
+        """
+        return self._literal_values
+    
+    @property
+    def literals(self) -> typing.Tuple[literal_type.LiteralType, ...]:
+        """tuple[:class:`literal_type.LiteralType`]: The literals of all steps."""
+        return self._literals
+    
+    @property
+    def membership_validity(self) -> np.ndarray:
+        """``numpy.ndarray``: The packed validity bitmaps of the rows of :attr:`memberships`."""
+        return self._membership_validity
+    
+    @property
+    def memberships(self) -> np.ndarray:
+        """``numpy.ndarray``: All distinct class memberships of the sequence as rows of individual, class, membership,
+        and status code.
+        """
+        return self._memberships
+    
+    @property
+    def relations(self) -> typing.Tuple[relation_type.RelationType, ...]:
+        """tuple[:class:`relation_type.RelationType`]: The relations of all steps."""
+        return self._relations
+    
+    @property
+    def triple_validity(self) -> np.ndarray:
+        """``numpy.ndarray``: The packed validity bitmaps of the rows of :attr:`triples`."""
+        return self._triple_validity
+    
+    @property
+    def triples(self) -> np.ndarray:
+        """``numpy.ndarray``: All distinct triples of the sequence (cf. :class:`triple_store.TripleStore`)."""
+        return self._triples
+    
+    @property
+    def values(self) -> typing.List:
+        """list: The distinct values of all literals, which are referred to by :attr:`literal_values`."""
+        return self._values
+    
+    #  METHODS  ########################################################################################################
+    
+    def _encode(self, rows_per_step: typing.List[np.ndarray]) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Determines the distinct rows of all steps as well as their validity bitmaps.
+        
+        Args:
+            rows_per_step (list[``numpy.ndarray``]): One 2D array of rows for each step.
+        
+        Returns:
+            tuple: The distinct rows and the according packed validity bitmaps.
+        """
+        all_rows = np.concatenate(rows_per_step)
+        steps = np.repeat(np.arange(self._num_steps), [len(rows) for rows in rows_per_step])
+        if len(all_rows) == 0:
+            return all_rows, np.zeros((0, (self._num_steps + 7) // 8), dtype=np.uint8)
+        
+        # find all distinct rows, and set the bits of all steps that each of them appears in
+        unique_rows, inverse = np.unique(all_rows, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        validity = np.zeros((len(unique_rows), (self._num_steps + 7) // 8), dtype=np.uint8)
+        np.bitwise_or.at(validity, (inverse, steps // 8), (128 >> (steps % 8)).astype(np.uint8))
+        
+        return unique_rows, validity
+    
+    def _steps_of(self, validity: np.ndarray, row: int) -> np.ndarray:
+        """Retrieves the steps that are set in one row of a packed validity bitmap."""
+        return np.flatnonzero(np.unpackbits(validity[row])[:self._num_steps])
+    
+    def materialize(self, step: int) -> knowledge_graph.KnowledgeGraph:
+        """Creates a stand-alone :class:`knowledge_graph.KnowledgeGraph` that contains the data of one step.
+        
+        The created graph shares the vocabulary of the ``TemporalKnowledgeGraph``, and its individuals are created in a
+        fresh data context (cf. :func:`kg_encoding.decode`).
+        
+        Args:
+            step (int): The index of the step to materialize.
+        
+        Returns:
+            :class:`knowledge_graph.KnowledgeGraph`: The newly created graph.
+        """
+        view = self.step(step)
+        return kg_encoding.decode(
+                self._classes,
+                self._relations,
+                self._literals,
+                self._individuals,
+                view.triples().tolist(),
+                view.memberships().tolist(),
+                [(ind, lit, self._values[value], status) for ind, lit, value, status in view.literal_values().tolist()]
+        )
+    
+    def step(self, step: int) -> "TemporalStep":
+        """Provides a view of a single step of a ``TemporalKnowledgeGraph``.
+        
+        Args:
+            step (int): The index of the step.
+        
+        Returns:
+            :class:`TemporalStep`: The view.
+        
+        Raises:
+            IndexError: If ``step`` is out of range.
+        """
+        if step < 0:
+            step += self._num_steps
+        if not 0 <= step < self._num_steps:
+            raise IndexError("The <step> is out of range: {}!".format(step))
+        return TemporalStep(self, step)
+    
+    def steps_of_triple(self, t: typing.Union[triple.Triple, typing.Sequence[int]]) -> np.ndarray:
+        """Retrieves all steps in which a triple holds.
+        
+        Args:
+            t (:class:`triple.Triple` or sequence[int]): The triple, either as :class:`triple.Triple` or encoded as a
+                row of :attr:`triples`.
+        
+        Returns:
+            ``numpy.ndarray``: The indices of all steps that contain ``t`` in ascending order.
+        """
+        key = triple_store.TripleStore.encode(t) if isinstance(t, triple.Triple) else tuple(int(x) for x in t)
+        row = self._triple_rows.get(key)
+        if row is None:
+            return np.zeros(0, dtype=np.int64)
+        return self._steps_of(self._triple_validity, row)
+
+
+# ==================================================================================================================== #
+#  CLASS  T E M P O R A L  S T E P                                                                                     #
+# ==================================================================================================================== #
+
+
+class TemporalStep(object):
+    """A read-only view of a single step of a :class:`TemporalKnowledgeGraph`.
+    
+    Creating a ``TemporalStep`` is O(1). The data of the step are selected from the arrays of the underlying
+    :class:`TemporalKnowledgeGraph` by means of a vectorized test of the according validity bits, whenever they are
+    requested.
+    """
+    
+    def __init__(self, tkg: TemporalKnowledgeGraph, step: int):
+        """Creates a new ``TemporalStep``.
+        
+        Args:
+            tkg (:class:`TemporalKnowledgeGraph`): The underlying temporal knowledge graph.
+            step (int): The index of the represented step.
+        """
+        self._byte = step // 8
+        self._shift = 7 - step % 8
+        self._step = step
+        self._tkg = tkg
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def index(self) -> int:
+        """int: The index of the step."""
+        return self._step
+    
+    #  METHODS  ########################################################################################################
+    
+    def _mask(self, validity: np.ndarray) -> np.ndarray:
+        """Computes a mask of all rows whose validity bit of the represented step is set."""
+        return ((validity[:, self._byte] >> self._shift) & 1).astype(bool)
+    
+    def literal_values(self) -> np.ndarray:
+        """Retrieves the literal values of the step encoded like :attr:`TemporalKnowledgeGraph.literal_values`.
+        
+        Returns:
+            ``numpy.ndarray``: The literal values.
+        """
+        return self._tkg.literal_values[self._mask(self._tkg.literal_validity)]
+    
+    def membership_matrix(self, status: int = st.FACT) -> np.ndarray:
+        """Retrieves the class memberships of the step as a matrix of shape individuals x classes (cf.
+        :meth:`membership_store.MembershipStore.matrix`).
+        
+        Args:
+            status (int, optional): The status code of the memberships to retrieve. This defaults to facts.
+        
+        Returns:
+            ``numpy.ndarray``: An ``int8`` matrix.
+        """
+        mem = self.memberships()
+        mem = mem[mem[:, 3] == status]
+        matrix = np.zeros((len(self._tkg.individuals), len(self._tkg.classes)), dtype=np.int8)
+        matrix[mem[:, 0], mem[:, 1]] = mem[:, 2]
+        return matrix
+    
+    def memberships(self) -> np.ndarray:
+        """Retrieves the class memberships of the step encoded like :attr:`TemporalKnowledgeGraph.memberships`.
+        
+        Returns:
+            ``numpy.ndarray``: The class memberships.
+        """
+        return self._tkg.memberships[self._mask(self._tkg.membership_validity)]
+    
+    def triples(self) -> np.ndarray:
+        """Retrieves the triples of the step encoded like :attr:`TemporalKnowledgeGraph.triples`.
+        
+        Returns:
+            ``numpy.ndarray``: The triples.
+        """
+        return self._tkg.triples[self._mask(self._tkg.triple_validity)]
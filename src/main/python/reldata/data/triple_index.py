@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import knowledge_graph
+from reldata.data import status as st
+from reldata.data import triple_store
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class TripleIndex(object):
+    """An index for checking the existence of many triples at once.
+    
+    A ``TripleIndex`` packs every triple, i.e., subject, predicate, and object, into a single ``int64`` key, and keeps
+    the keys of all indexed triples in a sorted array. Queries are provided as arrays of subjects, predicates, and
+    objects, and are answered by means of binary search in a vectorized manner:
+        
+        index = TripleIndex.from_kg(kg)  # -> all positive facts and inferences
+        mask = index.contains(subjects, predicates, objects)
+    
+    A ``TripleIndex`` is a snapshot, which is not updated if the graph that it has been created from is changed.
+    """
+    
+    def __init__(self, triples: np.ndarray):
+        """Creates a new ``TripleIndex``.
+        
+        Args:
+            triples (``numpy.ndarray``): An integer matrix whose first three columns contain the subjects, predicates,
+                and objects of the triples to index, like the rows of a :class:`triple_store.TripleStore`.
+        
+        Raises:
+            ValueError: If any of the indices is negative, or the keys of the provided triples would exceed the range of
+                ``int64``.
+        """
+        triples = np.asarray(triples, dtype=np.int64)
+        if len(triples) == 0:
+            triples = np.zeros((0, 3), dtype=np.int64)
+        elif triples[:, :3].min() < 0:
+            raise ValueError("The indices of the triples must not be negative!")
+        self._num_individuals = int(triples[:, [0, 2]].max()) + 1 if len(triples) > 0 else 0
+        self._num_relations = int(triples[:, 1].max()) + 1 if len(triples) > 0 else 0
+        if self._num_individuals ** 2 * self._num_relations >= 2 ** 63:
+            raise ValueError("The keys of the triples would exceed the range of int64!")
+        self._keys = np.unique(self._pack(triples[:, 0], triples[:, 1], triples[:, 2]))
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __contains__(self, item: typing.Tuple[int, int, int]) -> bool:
+        return bool(self.contains(*item))
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    #  METHODS  ########################################################################################################
+    
+    def _pack(self, subjects: np.ndarray, predicates: np.ndarray, objects: np.ndarray) -> np.ndarray:
+        """Packs triples, which are assumed to be in range, into keys."""
+        return (subjects * self._num_relations + predicates) * self._num_individuals + objects
+    
+    def contains(
+            self,
+            subjects: typing.Union[int, np.ndarray],
+            predicates: typing.Union[int, np.ndarray],
+            objects: typing.Union[int, np.ndarray]
+    ) -> np.ndarray:
+        """Checks whether the specified triples are contained in a ``TripleIndex``.
+        
+        All of the args are broadcast against each other, which allows for checking, e.g., all possible objects of a
+        fixed subject and predicate without creating the according arrays first.
+        
+        Args:
+            subjects (int or ``numpy.ndarray``): The subjects of the triples to check.
+            predicates (int or ``numpy.ndarray``): The predicates of the triples to check.
+            objects (int or ``numpy.ndarray``): The objects of the triples to check.
+        
+        Returns:
+            ``numpy.ndarray``: A boolean array of the broadcast shape of the args, which indicates which triples are
+                contained in the index.
+        """
+        subjects, predicates, objects = np.broadcast_arrays(
+                np.asarray(subjects, dtype=np.int64),
+                np.asarray(predicates, dtype=np.int64),
+                np.asarray(objects, dtype=np.int64)
+        )
+        result = np.zeros(subjects.shape, dtype=np.bool_)
+        
+        # triples whose elements are out of range cannot be contained in the index
+        valid = (
+                (subjects >= 0) & (subjects < self._num_individuals) &
+                (predicates >= 0) & (predicates < self._num_relations) &
+                (objects >= 0) & (objects < self._num_individuals)
+        )
+        if len(self._keys) > 0:
+            keys = self._pack(subjects[valid], predicates[valid], objects[valid])
+            positions = np.searchsorted(self._keys, keys)
+            positions[positions == len(self._keys)] = 0
+            result[valid] = self._keys[positions] == keys
+        
+        return result
+    
+    @classmethod
+    def from_kg(
+            cls,
+            kg: knowledge_graph.KnowledgeGraph,
+            status: typing.Iterable[int] = (st.FACT, st.INFERRED),
+            positive: bool = True
+    ) -> "TripleIndex":
+        """Creates a ``TripleIndex`` for the triples of a knowledge graph.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The graph to index.
+            status (iterable[int], optional): The status codes of the triples to index. By default, these are facts and
+                inferences.
+            positive (bool, optional): Indicates whether positive or negative triples are indexed. This defaults to
+                ``True``.
+        
+        Returns:
+            :class:`TripleIndex`: The created index.
+        """
+        store = kg.triple_store
+        mask = np.isin(store.status, list(status)) & (store.positive == int(positive))
+        return cls(store.array()[mask, :triple_store.TripleStore.OBJECT + 1])
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import status as st
+from reldata.data import triple
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class TripleStore(object):
+    """Stores all triples of a knowledge graph as rows of an integer array.
+    
+    Every triple is encoded as a row of five integers, namely the indices of its subject, predicate, and object, ``1``
+    or ``0`` depending on whether it is positive or negative, and its status code as defined in
+    :mod:`reldata.data.status`. The columns of the array are accessible as ``numpy.ndarray``s without copying any data,
+    which allows for processing the triples of a graph in a vectorized manner:
+        
+        store = kg.triple_store
+        facts = store.array()[store.status == status.FACT]
+    
+    The rows of a ``TripleStore`` are in the order that the triples were added in, except that removing a triple moves
+    the last row into its place. Notice further that a ``TripleStore`` is not populated by itself, but is maintained by
+    the :class:`knowledge_graph.KnowledgeGraph` that it belongs to.
+    """
+    
+    SUBJECT = 0
+    """int: The column that contains the indices of the subjects."""
+    
+    PREDICATE = 1
+    """int: The column that contains the indices of the predicates."""
+    
+    OBJECT = 2
+    """int: The column that contains the indices of the objects."""
+    
+    POSITIVE = 3
+    """int: The column that indicates whether triples are positive (``1``) or negative (``0``)."""
+    
+    STATUS = 4
+    """int: The column that contains the status codes of the triples."""
+    
+    NUM_COLUMNS = 5
+    """int: The total number of columns."""
+    
+    MIN_CAPACITY = 64
+    """int: The minimum number of rows that is allocated."""
+    
+    def __init__(self):
+        """Creates a new empty ``TripleStore``."""
+        self._data = np.zeros((self.MIN_CAPACITY, self.NUM_COLUMNS), dtype=np.int64)
+        self._rows = {}  # maps the encodings of all stored triples to their rows
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __contains__(self, item: triple.Triple) -> bool:
+        return self.encode(item) in self._rows
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def objects(self) -> np.ndarray:
+        """``numpy.ndarray``: The indices of the objects of all triples."""
+        return self._column(self.OBJECT)
+    
+    @property
+    def positive(self) -> np.ndarray:
+        """``numpy.ndarray``: ``1`` for every positive and ``0`` for every negative triple."""
+        return self._column(self.POSITIVE)
+    
+    @property
+    def predicates(self) -> np.ndarray:
+        """``numpy.ndarray``: The indices of the predicates of all triples."""
+        return self._column(self.PREDICATE)
+    
+    @property
+    def status(self) -> np.ndarray:
+        """``numpy.ndarray``: The status codes of all triples."""
+        return self._column(self.STATUS)
+    
+    @property
+    def subjects(self) -> np.ndarray:
+        """``numpy.ndarray``: The indices of the subjects of all triples."""
+        return self._column(self.SUBJECT)
+    
+    #  METHODS  ########################################################################################################
+    
+    def _column(self, col: int) -> np.ndarray:
+        """Retrieves a read-only view of one column of the stored triples."""
+        view = self._data[:len(self._rows), col]
+        view.flags.writeable = False
+        return view
+    
+    def _reserve(self, num_rows: int) -> None:
+        """Ensures that there is space for at least ``num_rows`` triples (the capacity is at least doubled if not)."""
+        if num_rows > len(self._data):
+            new_data = np.zeros((max(num_rows, 2 * len(self._data)), self.NUM_COLUMNS), dtype=np.int64)
+            new_data[:len(self._rows)] = self._data[:len(self._rows)]
+            self._data = new_data
+    
+    def add(self, t: triple.Triple) -> None:
+        """Adds a triple to a ``TripleStore`` unless it is stored already.
+        
+        Args:
+            t (:class:`triple.Triple`): The triple to add.
+        """
+        key = self.encode(t)
+        if key not in self._rows:
+            row = len(self._rows)
+            self._reserve(row + 1)
+            self._data[row] = key
+            self._rows[key] = row
+    
+    def add_all(self, triples: typing.Iterable[triple.Triple]) -> None:
+        """Adds several triples to a ``TripleStore`` at once.
+        
+        Args:
+            triples (iterable[:class:`triple.Triple`]): The triples to add. Those that are stored already are skipped.
+        """
+        # determine the encodings of all triples that have not been stored yet
+        new_keys = {}
+        for key in map(self.encode, triples):
+            if key not in self._rows:
+                new_keys[key] = None
+        if not new_keys:
+            return
+        
+        # write all of them at once
+        first_row = len(self._rows)
+        self._reserve(first_row + len(new_keys))
+        self._data[first_row:first_row + len(new_keys)] = np.array(list(new_keys), dtype=np.int64)
+        self._rows.update(zip(new_keys, range(first_row, first_row + len(new_keys))))
+    
+    def array(self) -> np.ndarray:
+        """Retrieves all stored triples.
+        
+        Returns:
+            ``numpy.ndarray``: A read-only view of shape triples x :attr:`NUM_COLUMNS`.
+        """
+        view = self._data[:len(self._rows)]
+        view.flags.writeable = False
+        return view
+    
+    def clear(self) -> None:
+        """Removes all triples from a ``TripleStore``."""
+        self._rows.clear()
+    
+    def discard(self, t: triple.Triple) -> None:
+        """Removes a triple from a ``TripleStore`` if it is stored.
+        
+        Args:
+            t (:class:`triple.Triple`): The triple to remove.
+        """
+        row = self._rows.pop(self.encode(t), None)
+        if row is None:
+            return
+        
+        # move the last row into the gap
+        last_row = len(self._rows)
+        if row != last_row:
+            self._data[row] = self._data[last_row]
+            self._rows[tuple(self._data[row].tolist())] = row
+    
+    @staticmethod
+    def encode(t: triple.Triple) -> typing.Tuple[int, int, int, int, int]:
+        """Computes the encoding of a triple that is used as row of a ``TripleStore``.
+        
+        Args:
+            t (:class:`triple.Triple`): The triple to encode.
+        
+        Returns:
+            tuple[int, int, int, int, int]: The encoding of ``t``.
+        """
+        return t.subject.index, t.predicate.index, t.object.index, int(t.positive), st.of(t)
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import knowledge_graph
+from reldata.data import status as st
+from reldata.data import triple_store
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class VocabAlignment(object):
+    """Unifies the vocabularies of multiple knowledge graphs, and maps their data into a common index space.
+    
+    Different knowledge graphs may assign different indices to classes, relations, and literals with the same names. A
+    ``VocabAlignment`` maintains a global vocabulary, which contains every name of any of the graphs that have been
+    added to it, and provides remap tables, i.e., ``numpy.ndarray``s that map the local indices of a graph to the
+    according global indices. These are used to re-encode entire arrays of triples and membership matrices at once:
+        
+        alignment = VocabAlignment(kgs)
+        for kg in kgs:
+            triples = alignment.remap_triples(kg)
+            memberships = alignment.remap_memberships(kg)
+    
+    Global indices are assigned in the order that names are encountered in, and never change. Therefore, adding further
+    graphs to an alignment does not invalidate any data that has been remapped before. Local indices that do not belong
+    to any element of a graph's vocabulary are mapped to ``-1``.
+    """
+    
+    def __init__(self, kgs: typing.Iterable[knowledge_graph.KnowledgeGraph] = None):
+        """Creates a new ``VocabAlignment``.
+        
+        Args:
+            kgs (iterable[:class:`knowledge_graph.KnowledgeGraph`], optional): Knowledge graphs whose vocabularies are
+                added to the alignment right away.
+        """
+        self._classes = {}    # maps class names to global indices
+        self._literals = {}   # maps literal names to global indices
+        self._relations = {}  # maps relation names to global indices
+        
+        if kgs is not None:
+            for kg in kgs:
+                self.add(kg)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def classes(self) -> typing.List[str]:
+        """list[str]: The names of all classes in the global vocabulary in the order of their global indices."""
+        return list(self._classes)
+    
+    @property
+    def literals(self) -> typing.List[str]:
+        """list[str]: The names of all literals in the global vocabulary in the order of their global indices."""
+        return list(self._literals)
+    
+    @property
+    def relations(self) -> typing.List[str]:
+        """list[str]: The names of all relations in the global vocabulary in the order of their global indices."""
+        return list(self._relations)
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def _add_names(global_vocab: typing.Dict[str, int], local_vocab: typing.Iterable) -> None:
+        """Adds the names of vocabulary objects to a global vocabulary unless they are contained in it already."""
+        for obj in local_vocab:
+            global_vocab.setdefault(obj.name, len(global_vocab))
+    
+    @staticmethod
+    def _create_table(global_vocab: typing.Dict[str, int], local_vocab: typing.Iterable) -> np.ndarray:
+        """Creates a remap table from the local indices of the provided vocabulary objects to global indices.
+        
+        Raises:
+            ValueError: If any of the vocabulary objects has not been added to the global vocabulary.
+        """
+        local_vocab = list(local_vocab)
+        table = np.full(max((obj.index for obj in local_vocab), default=-1) + 1, -1, dtype=np.int64)
+        for obj in local_vocab:
+            if obj.name not in global_vocab:
+                raise ValueError("'{}' is not part of the global vocabulary!".format(obj.name))
+            table[obj.index] = global_vocab[obj.name]
+        return table
+    
+    def add(self, kg: knowledge_graph.KnowledgeGraph) -> None:
+        """Adds the vocabulary of a knowledge graph to the global vocabulary.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The knowledge graph whose vocabulary is added.
+        """
+        self._add_names(self._classes, kg.classes)
+        self._add_names(self._relations, kg.relations)
+        self._add_names(self._literals, kg.literals)
+    
+    def class_table(self, kg: knowledge_graph.KnowledgeGraph) -> np.ndarray:
+        """Creates the remap table for the classes of a knowledge graph.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The knowledge graph to create the table for, which has to be
+                added to the alignment beforehand.
+        
+        Returns:
+            ``numpy.ndarray``: An ``int64`` vector whose i-th element is the global index of the class with local index
+                i, or ``-1`` if there is no such class in ``kg``.
+        
+        Raises:
+            ValueError: If the vocabulary of ``kg`` has not been added to the alignment.
+        """
+        return self._create_table(self._classes, kg.classes)
+    
+    def literal_table(self, kg: knowledge_graph.KnowledgeGraph) -> np.ndarray:
+        """Creates the remap table for the literals of a knowledge graph (cf. :meth:`class_table`).
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The knowledge graph to create the table for.
+        
+        Returns:
+            ``numpy.ndarray``: The remap table.
+        
+        Raises:
+            ValueError: If the vocabulary of ``kg`` has not been added to the alignment.
+        """
+        return self._create_table(self._literals, kg.literals)
+    
+    def relation_table(self, kg: knowledge_graph.KnowledgeGraph) -> np.ndarray:
+        """Creates the remap table for the relations of a knowledge graph (cf. :meth:`class_table`).
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The knowledge graph to create the table for.
+        
+        Returns:
+            ``numpy.ndarray``: The remap table.
+        
+        Raises:
+            ValueError: If the vocabulary of ``kg`` has not been added to the alignment.
+        """
+        return self._create_table(self._relations, kg.relations)
+    
+    def remap_memberships(self, kg: knowledge_graph.KnowledgeGraph, status: int = st.FACT) -> np.ndarray:
+        """Re-encodes the class-membership matrix of a knowledge graph in terms of the global vocabulary.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The knowledge graph whose memberships are re-encoded.
+            status (int, optional): The status code of the memberships to re-encode. This defaults to facts.
+        
+        Returns:
+            ``numpy.ndarray``: An ``int8`` matrix of shape individuals x global classes (cf.
+                :meth:`membership_store.MembershipStore.matrix`).
+        
+        Raises:
+            ValueError: If the vocabulary of ``kg`` has not been added to the alignment.
+        """
+        local = kg.memberships.matrix(status=status)
+        table = self.class_table(kg)[:local.shape[1]]
+        valid = table >= 0
+        
+        result = np.zeros((local.shape[0], len(self._classes)), dtype=np.int8)
+        result[:, table[valid]] = local[:, :len(table)][:, valid]
+        return result
+    
+    def remap_triples(self, kg: knowledge_graph.KnowledgeGraph) -> np.ndarray:
+        """Re-encodes the triples of a knowledge graph in terms of the global vocabulary.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The knowledge graph whose triples are re-encoded.
+        
+        Returns:
+            ``numpy.ndarray``: A copy of :meth:`triple_store.TripleStore.array` of ``kg``, whose predicates have been
+                replaced with global indices. Individuals are not affected by the alignment.
+        
+        Raises:
+            ValueError: If the vocabulary of ``kg`` has not been added to the alignment.
+        """
+        result = kg.triple_store.array().copy()
+        predicates = result[:, triple_store.TripleStore.PREDICATE]
+        predicates[:] = self.relation_table(kg)[predicates]
+        return result
@@ -7,6 +7,8 @@ import os
 import re
 import typing
 
+from reldata.io.kg_dataset import KgDataset
+from reldata.io.kg_loader import KgLoader
 from reldata.io.kg_reader import KgReader
 from reldata.io.kg_writer import KgWriter
 
@@ -64,6 +66,10 @@ CLASSES_SPEC_EXT = ".classes.data"
 CLASSES_VOCAB_EXT = ".classes"
 """str: The file extension that is used for storing class definitions."""
 
+DELTA_EXT = ".delta"
+"""str: The file extension that is used for storing the changes between a step of a delta-encoded sequence and the
+previous step."""
+
 INDIVIDUALS_SPEC_EXT = ".individuals"
 """str: The file extension that is used for storing individual specifications."""
 
@@ -113,12 +119,21 @@ ALL_EXT = [
 ]
 """list[str]: A list of all file extensions that are used to store the different parts of a knowledge graph."""
 
+DELTA_STATUS_TOKENS = ["spec", "inf", "pred"]
+"""list[str]: The tokens that denote facts, inferences, and predictions in delta files, i.e., the i-th token denotes the
+status code i as defined in :mod:`reldata.data.status`."""
+
 INDIVIDUALS_REGEX = "^(?P<base_name>.+){}$".format(INDIVIDUALS_SPEC_EXT.replace(".", "\\."))
 """str: A regex that matches any files that specify the individuals of a knowledge graph."""
 
 KG_FILE_REGEX = "^(?P<base_name>.+)\\.({})$".format("|".join([e[1:] for e in ALL_EXT]))
 """str: A regex that matches any filename that belongs to one of the files of a knowledge graph."""
 
+SEQUENCE_EXT = ALL_EXT[4:]
+"""list[str]: The file extensions of those parts of a knowledge graph that are stored separately for every step of a
+sequence, i.e., with the index of the step as additional extension (e.g., ".0"). The vocabulary and the individuals, in
+contrast, are shared by all steps."""
+
 
 # ==================================================================================================================== #
 #  F U N C T I O N S                                                                                                   #
@@ -201,7 +216,7 @@ def find_knowledge_graph_sequences(input_dir: str) -> typing.List[str]:
                 # if current extensions is not found -> skip candidate
                 if not os.path.isfile(os.path.join(input_dir, base_name + ext)):
                     raise StopIteration
-            for ext in ALL_EXT[4:]:
+            for ext in SEQUENCE_EXT:
                 # if current extensions is not found -> skip candidate
                 if not os.path.isfile(os.path.join(input_dir, base_name + ext + ".0")):
                     raise StopIteration
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import operator
+import os
+import threading
+import typing
+
+import insanity
+
+from reldata import io
+from reldata.data import knowledge_graph
+from reldata.io import kg_reader
+from reldata.vocab import vocab_registry as vr
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class KgDataset(object):
+    """Provides random access to the knowledge graphs in a directory, and caches the most recently used ones.
+    
+    A ``KgDataset`` indexes either all of the knowledge graphs or all steps of all knowledge-graph sequences that are
+    discovered in a directory in order of their base names (and steps). Graphs are loaded on first access, and kept in
+    a least-recently-used cache, whose size is bounded by an estimate of the memory that the cached graphs occupy. The
+    estimate of a graph is the total size of the files that it is loaded from, which, for steps of delta-encoded
+    sequences, includes the files of the previous keyframe as well as all delta files since then:
+        
+        dataset = KgDataset(input_dir, max_cache_size=2 ** 30)
+        for epoch in range(num_epochs):
+            for idx in range(len(dataset)):
+                train_on(dataset[idx])  # -> only the first epoch parses any files
+    
+    The cache can be populated in the background by means of :meth:`warm_up`, and a ``KgDataset`` may be accessed by
+    multiple threads at the same time.
+    """
+    
+    def __init__(
+            self,
+            input_dir: str,
+            sequences: bool = False,
+            max_cache_size: int = None,
+            vocab_registry: vr.VocabRegistry = None
+    ):
+        """Creates a new ``KgDataset``.
+        
+        Args:
+            input_dir (str): The directory that contains the data.
+            sequences (bool, optional): Indicates whether the dataset consists of the steps of all knowledge-graph
+                sequences rather than of all knowledge graphs in ``input_dir``. This defaults to ``False``.
+            max_cache_size (int, optional): The estimated number of bytes that the cached graphs may occupy at most. By
+                default, the size of the cache is not bounded. If the estimate of a single graph exceeds this value,
+                then it is still kept in the cache until another one is loaded.
+            vocab_registry (:class:`vr.VocabRegistry`, optional): An optional registry for sharing vocabularies among
+                the loaded graphs (cf. :meth:`kg_reader.KgReader.read_all`).
+        
+        Raises:
+            ValueError: If the specified directory does not exist, or ``max_cache_size`` is negative.
+        """
+        # sanitize args
+        input_dir = str(input_dir)
+        if not os.path.isdir(input_dir):
+            raise ValueError("The specified <input_dir> does not exist: '{}'!".format(input_dir))
+        if max_cache_size is not None:
+            insanity.sanitize_type("max_cache_size", max_cache_size, int)
+            insanity.sanitize_range("max_cache_size", max_cache_size, minimum=0)
+        insanity.sanitize_type("vocab_registry", vocab_registry, vr.VocabRegistry, none_allowed=True)
+        
+        # define attributes
+        self._cache = collections.OrderedDict()  # maps keys to pairs of graph and size estimate in LRU order
+        self._cache_size = 0
+        self._hits = 0
+        self._input_dir = input_dir
+        self._lock = threading.Lock()
+        self._max_cache_size = max_cache_size
+        self._misses = 0
+        self._vocab_registry = vocab_registry
+        
+        # assemble the keys of all graphs in the dataset
+        if sequences:
+            self._keys = [
+                    (base_name, idx)
+                    for base_name in io.find_knowledge_graph_sequences(input_dir)
+                    for idx in range(self._count_steps(base_name))
+            ]
+        else:
+            self._keys = [(base_name, None) for base_name in io.find_knowledge_graphs(input_dir)]
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __getitem__(self, item: int) -> knowledge_graph.KnowledgeGraph:
+        try:
+            item = operator.index(item)
+        except TypeError:
+            raise TypeError("The index of a KgDataset has to be an int, but found {}!".format(type(item)))
+        if item < -len(self._keys) or item >= len(self._keys):
+            raise IndexError("Index out of range: {}!".format(item))
+        return self._get(self._keys[item])
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def cache_size(self) -> int:
+        """int: The estimated number of bytes that the cached graphs occupy."""
+        return self._cache_size
+    
+    @property
+    def hits(self) -> int:
+        """int: The number of accesses that have been answered from the cache."""
+        return self._hits
+    
+    @property
+    def keys(self) -> typing.List[typing.Tuple[str, typing.Optional[int]]]:
+        """list[tuple[str, int]]: The base names and steps of all graphs in the dataset in the order of their indices.
+        If the dataset does not consist of sequences, then all steps are ``None``."""
+        return self._keys
+    
+    @property
+    def misses(self) -> int:
+        """int: The number of accesses that required loading a graph."""
+        return self._misses
+    
+    #  METHODS  ########################################################################################################
+    
+    def _count_steps(self, base_name: str) -> int:
+        """Determines the number of steps of a knowledge-graph sequence."""
+        num_steps = 0
+        while any(
+                os.path.isfile(os.path.join(self._input_dir, base_name + ext + "." + str(num_steps)))
+                for ext in [io.CLASSES_SPEC_EXT, io.DELTA_EXT]
+        ):
+            num_steps += 1
+        return num_steps
+    
+    def _estimate_size(self, key: typing.Tuple[str, typing.Optional[int]]) -> int:
+        """Estimates the memory that a graph occupies by the total size of the files that it is loaded from."""
+        base_name, idx = key
+        if idx is None:
+            paths = [base_name + ext for ext in io.ALL_EXT]
+        else:
+            # steps that are not keyframes are loaded from the previous keyframe and all delta files since then
+            keyframe = idx
+            while keyframe > 0 and not os.path.isfile(
+                    os.path.join(self._input_dir, base_name + io.CLASSES_SPEC_EXT + "." + str(keyframe))
+            ):
+                keyframe -= 1
+            paths = [base_name + ext + "." + str(keyframe) for ext in io.SEQUENCE_EXT]
+            paths += [base_name + io.DELTA_EXT + "." + str(i) for i in range(keyframe + 1, idx + 1)]
+        paths = [os.path.join(self._input_dir, p) for p in paths]
+        return sum(os.path.getsize(p) for p in paths if os.path.isfile(p))
+    
+    def _get(self, key: typing.Tuple[str, typing.Optional[int]], count: bool = True) -> knowledge_graph.KnowledgeGraph:
+        """Retrieves a graph from the cache, or loads it if necessary.
+        
+        Args:
+            key (tuple[str, int]): The key of the graph.
+            count (bool, optional): Indicates whether the access is recorded as hit or miss, respectively.
+        
+        Returns:
+            :class:`knowledge_graph.KnowledgeGraph`: The graph.
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                if count:
+                    self._hits += 1
+                return entry[0]
+            if count:
+                self._misses += 1
+        
+        # load the graph without holding the lock
+        base_name, idx = key
+        kg = kg_reader.KgReader.read(self._input_dir, base_name, index=idx, vocab_registry=self._vocab_registry)
+        size = self._estimate_size(key)
+        
+        # add it to the cache, and evict the least recently used graphs as needed
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = (kg, size)
+                self._cache_size += size
+                while (
+                        self._max_cache_size is not None and
+                        self._cache_size > self._max_cache_size and
+                        len(self._cache) > 1
+                ):
+                    _, (_, evicted_size) = self._cache.popitem(last=False)
+                    self._cache_size -= evicted_size
+            else:
+                self._cache.move_to_end(key)
+        
+        return kg
+    
+    def clear_cache(self) -> None:
+        """Removes all graphs from the cache, and resets the hit and miss counts."""
+        with self._lock:
+            self._cache.clear()
+            self._cache_size = 0
+            self._hits = 0
+            self._misses = 0
+    
+    def warm_up(self, indices: typing.Iterable[int] = None) -> threading.Thread:
+        """Starts loading graphs into the cache in a background thread.
+        
+        Graphs are loaded in the order of the provided indices until either all of them have been loaded or the cache is
+        full. Accesses made by the warm-up are not recorded as hits or misses.
+        
+        Args:
+            indices (iterable[int], optional): The indices of the graphs to load. By default, graphs are loaded in the
+                order of their indices.
+        
+        Returns:
+            ``threading.Thread``: The started thread, which may be joined in order to wait for the warm-up to finish.
+        """
+        indices = range(len(self._keys)) if indices is None else list(indices)
+        
+        def run():
+            for idx in indices:
+                self._get(self._keys[idx], count=False)
+                if self._max_cache_size is not None and self._cache_size >= self._max_cache_size:
+                    break
+        
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import itertools
+import os
+import random
+import typing
+
+import insanity
+
+from concurrent import futures
+
+from reldata import io
+from reldata.data import kg_arrays
+from reldata.data import knowledge_graph
+from reldata.io import kg_reader
+from reldata.vocab import vocab_registry as vr
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class KgLoader(object):
+    """Loads knowledge graphs from the disk in the background while they are being consumed.
+    
+    A ``KgLoader`` iterates over the knowledge graphs in a directory, and reads ahead up to a configurable number of
+    graphs, i.e., the prefetch depth, by means of an executor. This way, loading graphs overlaps with whatever is done
+    with them, while the number of graphs that are kept in memory at the same time stays bounded:
+        
+        loader = KgLoader(input_dir, prefetch=4, shuffle=True, seed=0, num_epochs=10)
+        for kg in loader:
+            train_on(kg)
+    
+    The order of the graphs is reshuffled for every epoch, and is the same for every iteration over a loader with a
+    fixed seed. If ``as_arrays`` is set, the loader yields :class:`kg_arrays.KgArrays` instead of knowledge graphs,
+    which are created in the workers already. This is particularly useful in combination with a
+    ``concurrent.futures.ProcessPoolExecutor``, as only the compact encodings have to be transferred between processes
+    then.
+    """
+    
+    def __init__(
+            self,
+            input_dir: str,
+            base_names: typing.Iterable[str] = None,
+            executor: futures.Executor = None,
+            num_workers: int = 1,
+            prefetch: int = 2,
+            shuffle: bool = False,
+            seed: int = None,
+            num_epochs: int = 1,
+            as_arrays: bool = False,
+            vocab_registry: vr.VocabRegistry = None
+    ):
+        """Creates a new ``KgLoader``.
+        
+        Args:
+            input_dir (str): The directory that contains the graphs to load.
+            base_names (iterable[str], optional): The base names of the graphs to load. By default, these are all of the
+                graphs that are discovered in ``input_dir`` (cf. :func:`io.find_knowledge_graphs`).
+            executor (futures.Executor, optional): The executor that is used for loading graphs. By default, every
+                iteration over the loader uses a thread pool of its own.
+            num_workers (int, optional): The number of threads that are used if no ``executor`` is provided. This
+                defaults to ``1``.
+            prefetch (int, optional): The maximum number of graphs that are being loaded ahead. This defaults to ``2``.
+            shuffle (bool, optional): Indicates whether the graphs are shuffled for every epoch. This defaults to
+                ``False``.
+            seed (int, optional): The seed that is used for shuffling.
+            num_epochs (int, optional): The number of times that every graph is provided. This defaults to ``1``.
+            as_arrays (bool, optional): Indicates whether the loaded graphs are provided as
+                :class:`kg_arrays.KgArrays`. This defaults to ``False``.
+            vocab_registry (:class:`vr.VocabRegistry`, optional): An optional registry for sharing vocabularies among
+                the loaded graphs (cf. :meth:`kg_reader.KgReader.read_all`).
+        
+        Raises:
+            ValueError: If the specified directory does not exist, or any of the numeric args is smaller than ``1``.
+        """
+        # sanitize args
+        input_dir = str(input_dir)
+        if not os.path.isdir(input_dir):
+            raise ValueError("The specified <input_dir> does not exist: '{}'!".format(input_dir))
+        insanity.sanitize_type("executor", executor, futures.Executor, none_allowed=True)
+        insanity.sanitize_type("num_workers", num_workers, int)
+        insanity.sanitize_range("num_workers", num_workers, minimum=1)
+        insanity.sanitize_type("prefetch", prefetch, int)
+        insanity.sanitize_range("prefetch", prefetch, minimum=1)
+        insanity.sanitize_type("num_epochs", num_epochs, int)
+        insanity.sanitize_range("num_epochs", num_epochs, minimum=1)
+        insanity.sanitize_type("vocab_registry", vocab_registry, vr.VocabRegistry, none_allowed=True)
+        
+        # define attributes
+        self._as_arrays = bool(as_arrays)
+        self._base_names = io.find_knowledge_graphs(input_dir) if base_names is None else [str(b) for b in base_names]
+        self._executor = executor
+        self._input_dir = input_dir
+        self._num_epochs = num_epochs
+        self._num_workers = num_workers
+        self._prefetch = prefetch
+        self._seed = seed
+        self._shuffle = bool(shuffle)
+        self._vocab_registry = vocab_registry
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __iter__(self) -> typing.Iterator[typing.Union[knowledge_graph.KnowledgeGraph, kg_arrays.KgArrays]]:
+        executor = self._executor
+        if executor is None:
+            executor = futures.ThreadPoolExecutor(max_workers=self._num_workers)
+        pending = collections.deque()  # the futures of all graphs that are being loaded ahead
+        try:
+            schedule = self._schedule()
+            for base_name in itertools.islice(schedule, self._prefetch):
+                pending.append(self._submit(executor, base_name))
+            
+            while pending:
+                kg = pending.popleft().result()
+                for base_name in itertools.islice(schedule, 1):  # -> keep the queue filled
+                    pending.append(self._submit(executor, base_name))
+                yield kg
+        finally:
+            for f in pending:
+                f.cancel()
+            if self._executor is None:
+                executor.shutdown(wait=False)
+    
+    def __len__(self) -> int:
+        return len(self._base_names) * self._num_epochs
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def base_names(self) -> typing.List[str]:
+        """list[str]: The base names of the graphs that are loaded in every epoch."""
+        return self._base_names
+    
+    @property
+    def num_epochs(self) -> int:
+        """int: The number of times that every graph is provided."""
+        return self._num_epochs
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def _load(
+            input_dir: str,
+            base_name: str,
+            as_arrays: bool,
+            vocab_registry: typing.Optional[vr.VocabRegistry]
+    ) -> typing.Union[knowledge_graph.KnowledgeGraph, kg_arrays.KgArrays]:
+        """Loads a single graph, and encodes it if requested (this is executed by the workers)."""
+        kg = kg_reader.KgReader.read(input_dir, base_name, vocab_registry=vocab_registry)
+        return kg_arrays.KgArrays.from_kg(kg) if as_arrays else kg
+    
+    def _schedule(self) -> typing.Iterator[str]:
+        """Yields the base names of the graphs to load in the order that they are provided in."""
+        rng = random.Random(self._seed)
+        for _ in range(self._num_epochs):
+            base_names = list(self._base_names)
+            if self._shuffle:
+                rng.shuffle(base_names)
+            yield from base_names
+    
+    def _submit(self, executor: futures.Executor, base_name: str) -> futures.Future:
+        """Submits the task of loading a single graph to the provided executor."""
+        return executor.submit(self._load, self._input_dir, base_name, self._as_arrays, self._vocab_registry)
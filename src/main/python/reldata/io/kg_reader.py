@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 
+import itertools
 import os
 import re
 import typing
@@ -13,12 +14,14 @@ from reldata import io
 from reldata.data import class_membership
 from reldata.data import data_context as dc
 from reldata.data import individual_factory
+from reldata.data import kg_encoding
 from reldata.data import knowledge_graph
 from reldata.data import literal_value
 from reldata.data import triple
 from reldata.vocab import class_type_factory as ctf
 from reldata.vocab import literal_type_factory as ltf
 from reldata.vocab import relation_type_factory as rtf
+from reldata.vocab import vocab_registry as vr
 
 
 __author__ = "Patrick Hohenecker"
@@ -57,6 +60,12 @@ __status__ = "Development"
 class KgReader(object):
     """A class for reading :class:`knowledge_graph.KnowledgeGraph`s from the disk."""
     
+    DELTA_REGEX = (
+            r"^\s*(?P<op>[\+-])\s+(?P<part>classes|literals|relations)\s+(?P<status>spec|inf|pred)\s+"
+            r"(?P<data>.*?)\s*$"
+    )
+    """str: A regular expression for parsing the lines of delta files (cf. :attr:`io.DELTA_STATUS_TOKENS`)."""
+    
     MEMBERSHIPS_REGEX = r"0|1|-1"
     """str: A regular expression for parsing class memberships."""
     
@@ -73,7 +82,13 @@ class KgReader(object):
     
     @classmethod
     @dc.new_context
-    def read(cls, input_dir: str, basename: str, index: int = None) -> knowledge_graph.KnowledgeGraph:
+    def read(
+            cls,
+            input_dir: str,
+            basename: str,
+            index: int = None,
+            vocab_registry: vr.VocabRegistry = None
+    ) -> knowledge_graph.KnowledgeGraph:
         """Loads a knowledge graph from the specified location.
         
         Args:
@@ -81,6 +96,9 @@ class KgReader(object):
             basename (str): The base name, i.e., the prefix, included in all files' names.
             index (int, optional): If this is provided, then ``input_dir`` and ``basename`` are assumed to specify a
                 sequence of knowledge graphs, and ``index`` specifies the element of this sequence to retrieve.
+            vocab_registry (:class:`vr.VocabRegistry`, optional): If this is provided, then the classes, relations, and
+                literals of the loaded graph are retrieved from the registry, and thus shared with all other graphs that
+                have the same vocabulary.
         
         Returns:
             :class:`knowledge_graph.KnowledgeGraph`: A knowledge graph that has been populated according to the read
@@ -98,6 +116,7 @@ class KgReader(object):
         if index is not None:
             insanity.sanitize_type("index", index, int)
             insanity.sanitize_range("index", index, minimum=0)
+        insanity.sanitize_type("vocab_registry", vocab_registry, vr.VocabRegistry, none_allowed=True)
         
         # assemble all needed paths
         # the used postfixes have the following meanings:
@@ -132,6 +151,12 @@ class KgReader(object):
         if not os.path.isdir(input_dir):
             raise ValueError("The provided <input_dir> does not exist: '{}'!".format(input_dir))
         
+        # steps of delta-encoded sequences that are not keyframes are reconstructed from the previous keyframe
+        if index is not None and not os.path.isfile(classes_spec):
+            delta_path = os.path.join(input_dir, basename + io.DELTA_EXT + "." + str(index))
+            if os.path.isfile(delta_path):
+                return cls._read_from_keyframe(input_dir, basename, index, vocab_registry)
+        
         # check whether all of the needed files exist:
         if not os.path.isfile(individual_spec):
             raise ValueError("Missing file: '{}'!".format(individual_spec))
@@ -165,42 +190,21 @@ class KgReader(object):
         # create new empty knowledge graph
         kg = knowledge_graph.KnowledgeGraph()
         
-        # read classes
-        with open(classes_vocab, "r") as f:
-            for index, line in enumerate(f):
-                if line == "":
-                    continue
-                m = re.match(cls.VOCAB_REGEX, line)
-                assert int(m.group("index")) == index
-                kg.classes.add(ctf.ClassTypeFactory.create_class(m.group("name")))
-        
-        # read relations
-        with open(relations_vocab, "r") as f:
-            for index, line in enumerate(f):
-                if line == "":
-                    continue
-                m = re.match(cls.VOCAB_REGEX, line)
-                assert int(m.group("index")) == index
-                kg.relations.add(rtf.RelationTypeFactory.create_relation(m.group("name")))
-        
-        # read literals
-        with open(literals_vocab, "r") as f:
-            for index, line in enumerate(f):
-                if line == "":
-                    continue
-                m = re.match(cls.VOCAB_REGEX, line)
-                assert int(m.group("index")) == index
-                kg.literals.add(ltf.LiteralTypeFactory.create_literal(m.group("name")))
+        # read classes, relations, and literals
+        if vocab_registry is None:
+            kg.classes.add_all(ctf.ClassTypeFactory.create_classes(cls._read_vocab(classes_vocab)))
+            kg.relations.add_all(rtf.RelationTypeFactory.create_relations(cls._read_vocab(relations_vocab)))
+            kg.literals.add_all(ltf.LiteralTypeFactory.create_literals(cls._read_vocab(literals_vocab)))
+        else:
+            kg.classes.add_all(vocab_registry.get_classes(cls._read_vocab(classes_vocab)))
+            kg.relations.add_all(vocab_registry.get_relations(cls._read_vocab(relations_vocab)))
+            kg.literals.add_all(vocab_registry.get_literals(cls._read_vocab(literals_vocab)))
         
         # //////// Read Individuals --------------------------------------------------------------------------------
         
-        with open(individual_spec, "r") as f:
-            for index, line in enumerate(f):
-                if line == "":
-                    continue
-                m = re.match(cls.VOCAB_REGEX, line)
-                assert int(m.group("index")) == index
-                kg.individuals.add(individual_factory.IndividualFactory.create_individual(m.group("name")))
+        kg.individuals.add_all(
+                individual_factory.IndividualFactory.create_individuals(cls._read_vocab(individual_spec))
+        )
 
         # //////// Read Class Memberships --------------------------------------------------------------------------
 
@@ -323,6 +327,9 @@ class KgReader(object):
         
         # //////// Read Triples ------------------------------------------------------------------------------------
         
+        # all triples are collected first, and then added to the graph at once
+        all_triples = []
+        
         # read specified triples
         with open(relations_spec, "r") as f:
             for line in f:
@@ -339,7 +346,7 @@ class KgReader(object):
                 obj = kg.individuals[int(m.group("object"))]
                 
                 # add triple
-                kg.triples.add(triple.Triple(sub, pred, obj, positive))
+                all_triples.append(triple.Triple(sub, pred, obj, positive))
         
         # read inferred triples
         with open(relations_inf, "r") as f:
@@ -357,7 +364,7 @@ class KgReader(object):
                 obj = kg.individuals[int(m.group("object"))]
         
                 # add triple
-                kg.triples.add(triple.Triple(sub, pred, obj, positive, inferred=True))
+                all_triples.append(triple.Triple(sub, pred, obj, positive, inferred=True))
         
         # read triples that are prediction targets
         with open(relations_pred, "r") as f:
@@ -375,18 +382,28 @@ class KgReader(object):
                 obj = kg.individuals[int(m.group("object"))]
         
                 # add triple
-                kg.triples.add(triple.Triple(sub, pred, obj, positive, prediction=True))
+                all_triples.append(triple.Triple(sub, pred, obj, positive, prediction=True))
+        
+        kg.triples.add_all(all_triples)
         
         return kg
     
     @classmethod
-    def read_all(cls, input_dir: str, executor: futures.Executor = None) -> typing.List[knowledge_graph.KnowledgeGraph]:
+    def read_all(
+            cls,
+            input_dir: str,
+            executor: futures.Executor = None,
+            vocab_registry: vr.VocabRegistry = None
+    ) -> typing.List[knowledge_graph.KnowledgeGraph]:
         """Loads all knowledge graphs that are discovered in the specified directory.
         
         Args:
             input_dir (str): The path of the directory that is being searched.
             executor (futures.Executor, optional): An optional executor for loading multiple knowledge graphs
                 concurrently.
+            vocab_registry (:class:`vr.VocabRegistry`, optional): An optional registry for sharing vocabularies among
+                the loaded graphs (cf. :meth:`read`). Notice that vocabularies can be shared among graphs that are
+                loaded in the same process only.
     
         Returns:
             list[:class:`knowledge_graph.KnowledgeGraph`]: All knowledge graphs that were found in ``input_dir``.
@@ -399,22 +416,24 @@ class KgReader(object):
         if not os.path.isdir(input_dir):
             raise ValueError("The specified <input_dir> does not exist: '{}'!".format(input_dir))
         insanity.sanitize_type("executor", executor, futures.Executor, none_allowed=True)
+        insanity.sanitize_type("vocab_registry", vocab_registry, vr.VocabRegistry, none_allowed=True)
         
         # find all knowledge graphs in the input directory
         all_kgs = io.find_knowledge_graphs(input_dir)
         
         # load all knowledge graphs that were found
         if executor is None:
-            return [cls.read(input_dir, kg) for kg in all_kgs]
+            return [cls.read(input_dir, kg, vocab_registry=vocab_registry) for kg in all_kgs]
         else:
             all_kgs = [os.path.join(input_dir, kg) for kg in all_kgs]
-            return list(executor.map(cls._read_from_one, all_kgs))
+            return list(executor.map(cls._read_from_one, all_kgs, itertools.repeat(vocab_registry)))
     
     @classmethod
     def read_all_sequences(
             cls,
             input_dir: str,
-            executor: futures.Executor = None
+            executor: futures.Executor = None,
+            vocab_registry: vr.VocabRegistry = None
     ) -> typing.List[typing.List[knowledge_graph.KnowledgeGraph]]:
         """Loads all knowledge-graph sequences that are discovered in the specified directory.
 
@@ -422,6 +441,8 @@ class KgReader(object):
             input_dir (str): The path of the directory that is being searched.
             executor (futures.Executor, optional): An optional executor for loading multiple knowledge-graph sequences
                 concurrently.
+            vocab_registry (:class:`vr.VocabRegistry`, optional): An optional registry for sharing vocabularies among
+                the loaded graphs (cf. :meth:`read_all`).
 
         Returns:
             list[list[:class:`knowledge_graph.KnowledgeGraph`]]: All knowledge-graph sequences that were found in
@@ -435,24 +456,35 @@ class KgReader(object):
         if not os.path.isdir(input_dir):
             raise ValueError("The specified <input_dir> does not exist: '{}'!".format(input_dir))
         insanity.sanitize_type("executor", executor, futures.Executor, none_allowed=True)
+        insanity.sanitize_type("vocab_registry", vocab_registry, vr.VocabRegistry, none_allowed=True)
     
         # find all knowledge-graph sequences in the input directory
         all_seq = io.find_knowledge_graph_sequences(input_dir)
     
         # load all knowledge graphs that were found
         if executor is None:
-            return [cls.read_sequence(input_dir, seq) for seq in all_seq]
+            return [cls.read_sequence(input_dir, seq, vocab_registry=vocab_registry) for seq in all_seq]
         else:
             all_seq = [os.path.join(input_dir, seq) for seq in all_seq]
-            return list(executor.map(cls._read_seq_from_one, all_seq))
+            return list(executor.map(cls._read_seq_from_one, all_seq, itertools.repeat(vocab_registry)))
     
     @classmethod
-    def read_sequence(cls, input_dir: str, basename: str) -> typing.List[knowledge_graph.KnowledgeGraph]:
+    def read_sequence(
+            cls,
+            input_dir: str,
+            basename: str,
+            vocab_registry: vr.VocabRegistry = None
+    ) -> typing.List[knowledge_graph.KnowledgeGraph]:
         """Loads a sequence of knowledge graph from the specified location.
 
         Args:
             input_dir (str): The directory that contains all of the files.
             basename (str): The base name, i.e., the prefix, included in all files' names.
+            vocab_registry (:class:`vr.VocabRegistry`, optional): An optional registry for sharing vocabularies among
+                the loaded graphs (cf. :meth:`read`).
+
+        Notice that this method supports delta-encoded sequences (cf. :meth:`kg_writer.KgWriter.write_sequence`) as
+        well, whose steps are reconstructed incrementally.
 
         Returns:
             list[:class:`knowledge_graph.KnowledgeGraph`]: A knowledge graph seqeunce that has been populated according
@@ -468,20 +500,174 @@ class KgReader(object):
         if not os.path.isdir(input_dir):
             raise ValueError("The provided <input_dir> does not exist: '{}'!".format(input_dir))
         
-        # determine the length of the sequence to load
-        seq_len = 0
-        while os.path.isfile(os.path.join(input_dir, basename + io.CLASSES_SPEC_EXT + "." + str(seq_len))):
-            seq_len += 1
-        
-        return [cls.read(input_dir, basename, index=idx) for idx in range(seq_len)]
+        # load all steps of the sequence, and stop as soon as neither full nor delta-encoded data are found
+        seq = []
+        state = None  # the encoded data of the previous step, which is created lazily for delta-encoded steps only
+        while True:
+            idx = len(seq)
+            classes_spec = os.path.join(input_dir, basename + io.CLASSES_SPEC_EXT + "." + str(idx))
+            delta_path = os.path.join(input_dir, basename + io.DELTA_EXT + "." + str(idx))
+            if os.path.isfile(classes_spec):  # -> the step is stored in full
+                seq.append(cls.read(input_dir, basename, index=idx, vocab_registry=vocab_registry))
+                state = None
+            elif seq and os.path.isfile(delta_path):  # -> the step is delta-encoded
+                if state is None:
+                    state = cls._encode_step(seq[-1])
+                cls._apply_delta(delta_path, *state)
+                seq.append(cls._decode_step(seq[-1], *state))
+            else:
+                break
+        
+        return seq
 
     @classmethod
-    def _read_from_one(cls, path: str) -> knowledge_graph.KnowledgeGraph:
+    def _apply_delta(
+            cls,
+            path: str,
+            triples: typing.Set[tuple],
+            memberships: typing.Set[tuple],
+            literals: typing.Set[tuple]
+    ) -> None:
+        """Applies the changes that are specified in a delta file to the encoded data of a step.
+        
+        Args:
+            path (str): The path of the delta file.
+            triples (set[tuple]): The encoded triples (cf. :mod:`kg_encoding`), which are updated in place.
+            memberships (set[tuple]): The encoded class memberships, which are updated in place.
+            literals (set[tuple]): The encoded literal values, which are updated in place.
+        """
+        with open(path, "r") as f:
+            for line in f:
+                m = re.match(cls.DELTA_REGEX, line)
+                if m is None:
+                    continue
+                
+                # parse the described item
+                status = io.DELTA_STATUS_TOKENS.index(m.group("status"))
+                part = m.group("part")
+                if part == "relations":
+                    t = re.match(cls.TYPED_TRIPLE_REGEX, m.group("data"))
+                    target = triples
+                    item = (
+                            int(t.group("subject")),
+                            int(t.group("predicate")),
+                            int(t.group("object")),
+                            int(t.group("type") == "+"),
+                            status
+                    )
+                elif part == "classes":
+                    ind, cls_index, mem = m.group("data").split()
+                    target = memberships
+                    item = (int(ind), int(cls_index), int(mem), status)
+                else:
+                    t = re.match(cls.TRIPLE_REGEX, m.group("data"))
+                    target = literals
+                    item = (int(t.group("subject")), int(t.group("predicate")), t.group("object"), status)
+                
+                # add or remove it
+                if m.group("op") == "+":
+                    target.add(item)
+                else:
+                    target.discard(item)
+    
+    @classmethod
+    def _decode_step(
+            cls,
+            prev_kg: knowledge_graph.KnowledgeGraph,
+            triples: typing.Set[tuple],
+            memberships: typing.Set[tuple],
+            literals: typing.Set[tuple]
+    ) -> knowledge_graph.KnowledgeGraph:
+        """Creates a step of a delta-encoded sequence from its encoded data.
+        
+        Args:
+            prev_kg (:class:`knowledge_graph.KnowledgeGraph`): The previous step, whose vocabulary is reused, and whose
+                individuals are replicated.
+            triples (set[tuple]): The encoded triples of the step.
+            memberships (set[tuple]): The encoded class memberships of the step.
+            literals (set[tuple]): The encoded literal values of the step.
+        
+        Returns:
+            :class:`knowledge_graph.KnowledgeGraph`: The step.
+        """
+        return kg_encoding.decode(
+                tuple(prev_kg.classes),
+                tuple(prev_kg.relations),
+                tuple(prev_kg.literals),
+                [i.name for i in prev_kg.individuals],
+                sorted(triples),
+                sorted(memberships),
+                literals
+        )
+    
+    @classmethod
+    def _encode_step(
+            cls,
+            kg: knowledge_graph.KnowledgeGraph
+    ) -> typing.Tuple[typing.Set[tuple], typing.Set[tuple], typing.Set[tuple]]:
+        """Encodes the data of a step of a sequence for applying delta files to it.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The step to encode.
+        
+        Returns:
+            tuple[set, set, set]: The encoded triples, class memberships, and literal values of ``kg``.
+        """
+        return (
+                set(map(tuple, kg.triple_store.array().tolist())),
+                set(map(tuple, kg_encoding.encode_memberships(kg).tolist())),
+                set(kg_encoding.encode_literal_values(kg))
+        )
+    
+    @classmethod
+    def _read_from_keyframe(
+            cls,
+            input_dir: str,
+            basename: str,
+            index: int,
+            vocab_registry: vr.VocabRegistry = None
+    ) -> knowledge_graph.KnowledgeGraph:
+        """Loads a delta-encoded step of a sequence by applying all delta files since the previous keyframe.
+        
+        Args:
+            input_dir (str): The directory that contains all of the files.
+            basename (str): The base name, i.e., the prefix, included in all files' names.
+            index (int): The index of the step to load.
+            vocab_registry (:class:`vr.VocabRegistry`, optional): This is passed on to :meth:`read`.
+        
+        Returns:
+            :class:`knowledge_graph.KnowledgeGraph`: The loaded step.
+        
+        Raises:
+            ValueError: If there is no keyframe before the requested step.
+        """
+        # find the previous keyframe
+        keyframe = index
+        while not os.path.isfile(os.path.join(input_dir, basename + io.CLASSES_SPEC_EXT + "." + str(keyframe))):
+            keyframe -= 1
+            if keyframe < 0:
+                raise ValueError("There is no keyframe before step {} of '{}'!".format(index, basename))
+        
+        # load the keyframe, and apply all changes since then
+        kg = cls.read(input_dir, basename, index=keyframe, vocab_registry=vocab_registry)
+        state = cls._encode_step(kg)
+        for idx in range(keyframe + 1, index + 1):
+            cls._apply_delta(os.path.join(input_dir, basename + io.DELTA_EXT + "." + str(idx)), *state)
+        
+        return cls._decode_step(kg, *state)
+    
+    @classmethod
+    def _read_from_one(
+            cls,
+            path: str,
+            vocab_registry: vr.VocabRegistry = None
+    ) -> knowledge_graph.KnowledgeGraph:
         """Splits the provided path into the directory and the base name of a knowledge graph, and then invokes
         :meth:`read`.
         
         Args:
             path (str): The path the contains both the input directory and the base name of a knowledge graph.
+            vocab_registry (:class:`vr.VocabRegistry`, optional): This is passed on to :meth:`read`.
         
         Returns:
             :class:`knowledge_graph.KnowledgeGraph`: The knowledge graph that was loaded from ``path``.
@@ -489,15 +675,20 @@ class KgReader(object):
         split_index = path.rfind(os.path.sep)
         input_dir = path[:split_index]
         base_name = path[split_index + 1:]
-        return cls.read(input_dir, base_name)
+        return cls.read(input_dir, base_name, vocab_registry=vocab_registry)
 
     @classmethod
-    def _read_seq_from_one(cls, path: str) -> typing.List[knowledge_graph.KnowledgeGraph]:
+    def _read_seq_from_one(
+            cls,
+            path: str,
+            vocab_registry: vr.VocabRegistry = None
+    ) -> typing.List[knowledge_graph.KnowledgeGraph]:
         """Splits the provided path into the directory and the base name of a knowledge-graph sequence, and then invokes
         :meth:`read_sequence`.
 
         Args:
             path (str): The path the contains both the input directory and the base name of a knowledge-graph sequence.
+            vocab_registry (:class:`vr.VocabRegistry`, optional): This is passed on to :meth:`read_sequence`.
 
         Returns:
             list[:class:`knowledge_graph.KnowledgeGraph`]: The knowledge-graph sequence that was loaded from ``path``.
@@ -505,4 +696,24 @@ class KgReader(object):
         split_index = path.rfind(os.path.sep)
         input_dir = path[:split_index]
         base_name = path[split_index + 1:]
-        return cls.read_sequence(input_dir, base_name)
+        return cls.read_sequence(input_dir, base_name, vocab_registry=vocab_registry)
+
+    @classmethod
+    def _read_vocab(cls, path: str) -> typing.List[str]:
+        """Reads the names of the classes, relations, literals, or individuals that are defined in the specified file.
+        
+        Args:
+            path (str): The path of the file to read.
+        
+        Returns:
+            list[str]: The names in the order of their indices.
+        """
+        names = []
+        with open(path, "r") as f:
+            for index, line in enumerate(f):
+                if line == "":
+                    continue
+                m = re.match(cls.VOCAB_REGEX, line)
+                assert int(m.group("index")) == index
+                names.append(m.group("name"))
+        return names
@@ -5,12 +5,17 @@ import os
 import typing
 
 import insanity
+import numpy as np
 
 from collections import abc
 
 from reldata import io
 from reldata.data import individual
+from reldata.data import kg_arrays
+from reldata.data import kg_diff
 from reldata.data import knowledge_graph
+from reldata.data import status as st
+from reldata.data import triple_store
 
 
 __author__ = "Patrick Hohenecker"
@@ -49,6 +54,9 @@ __status__ = "Development"
 class KgWriter(object):
     """A class for writing :class:`knowledge_graph.KnowledgeGraph`s to disk."""
     
+    DELTA_PATTERN = "{op} {part} {status} {data}\n"
+    """str: A pattern for writing the lines of delta files, each of which describes one addition or removal."""
+    
     VOCAB_PATTERN = "{index} {name}\n"
     """str: A pattern for writing class/relation/literal definitions."""
     
@@ -66,21 +74,105 @@ class KgWriter(object):
             kg: knowledge_graph.KnowledgeGraph,
             ind: individual.Individual
     ) -> typing.Tuple[str, str, str]:
+        # the memberships are read from the rows of the graph's membership matrices
         num_classes = len(kg.classes)
-        spec = ["0"] * num_classes
-        inf = ["0"] * num_classes
-        pred = ["0"] * num_classes
-        
-        for c in ind.classes:
-            value = "1" if c.is_member else "-1"
-            if c.inferred:
-                inf[c.cls.index] = value
-            elif c.prediction:
-                pred[c.cls.index] = value
-            else:
-                spec[c.cls.index] = value
+        vectors = []
+        for status in [st.FACT, st.INFERRED, st.PREDICTION]:
+            row = kg.memberships.row(ind.index, status=status).tolist()[:num_classes]
+            row += [0] * (num_classes - len(row))
+            vectors.append(" ".join(map(str, row)) + "\n")
+        
+        return vectors[0], vectors[1], vectors[2]
+    
+    @staticmethod
+    def _data_paths(
+            target_dir: str,
+            base_name: str,
+            index: typing.Optional[int]
+    ) -> typing.Dict[int, typing.Tuple[str, str, str]]:
+        """Computes the paths of the files that store the class memberships, literal values, and triples of a graph.
+        
+        Args:
+            target_dir (str): The path of the directory that contains the files.
+            base_name (str): The base name of the graph.
+            index (int): The index of the graph in a sequence, or ``None``.
+        
+        Returns:
+            dict: A mapping from status codes to the paths of the files that store class memberships, literal values,
+                and triples with that status, in this order.
+        """
+        suffix = "" if index is None else "." + str(index)
+        return {
+                status: tuple(os.path.join(target_dir, base_name + ext + suffix) for ext in extensions)
+                for status, extensions in [
+                        (st.FACT, (io.CLASSES_SPEC_EXT, io.LITERALS_SPEC_EXT, io.RELATIONS_SPEC_EXT)),
+                        (st.INFERRED, (io.CLASSES_INF_EXT, io.LITERALS_INF_EXT, io.RELATIONS_INF_EXT)),
+                        (st.PREDICTION, (io.CLASSES_PRED_EXT, io.LITERALS_PRED_EXT, io.RELATIONS_PRED_EXT))
+                ]
+        }
+    
+    @classmethod
+    def _write_delta(
+            cls,
+            prev_kg: knowledge_graph.KnowledgeGraph,
+            kg: knowledge_graph.KnowledgeGraph,
+            path: str
+    ) -> None:
+        """Writes the changes between two consecutive steps of a sequence to a delta file.
         
-        return " ".join(spec) + "\n", " ".join(inf) + "\n", " ".join(pred) + "\n"
+        Every line of a delta file specifies either the addition (``+``) or the removal (``-``) of a triple
+        (``relations``), class membership (``classes``), or literal value (``literals``), followed by its status (cf.
+        :attr:`io.DELTA_STATUS_TOKENS`) and the same data that is used to describe it in the usual files, e.g.:
+        
+            - classes inf 3 0 -1
+            + relations spec + 0 2 1
+            + literals pred 1 0 some-value
+        
+        All removals precede the additions, and both steps are expected to share the same vocabulary and individuals.
+        
+        Args:
+            prev_kg (:class:`knowledge_graph.KnowledgeGraph`): The previous step.
+            kg (:class:`knowledge_graph.KnowledgeGraph`): The step whose changes are written.
+            path (str): The path of the delta file.
+        """
+        diff = kg_diff.KgDiff(prev_kg, kg)
+        with open(path, "w") as f:
+            for op, t_diff, m_diff, l_diff in [
+                    ("-", diff.removed_triples, diff.removed_memberships, diff.removed_literal_values),
+                    ("+", diff.added_triples, diff.added_memberships, diff.added_literal_values)
+            ]:
+                for ind, cls_index, mem, status in m_diff.tolist():
+                    f.write(
+                            cls.DELTA_PATTERN.format(
+                                    op=op,
+                                    part="classes",
+                                    status=io.DELTA_STATUS_TOKENS[status],
+                                    data="{} {} {}".format(ind, cls_index, mem)
+                            )
+                    )
+                for ind, lit, value, status in l_diff:
+                    f.write(
+                            cls.DELTA_PATTERN.format(
+                                    op=op,
+                                    part="literals",
+                                    status=io.DELTA_STATUS_TOKENS[status],
+                                    data=cls.TRIPLES_PATTERN.format(subject=ind, predicate=lit, object=value).strip()
+                            )
+                    )
+                for sub, pred, obj, positive, status in t_diff.tolist():
+                    f.write(
+                            cls.DELTA_PATTERN.format(
+                                    op=op,
+                                    part="relations",
+                                    status=io.DELTA_STATUS_TOKENS[status],
+                                    data=cls.TYPED_TRIPLES_PATTERN.format(
+                                            type=("+" if positive else "-"),
+                                            subject=sub,
+                                            predicate=pred,
+                                            object=obj
+                                    ).strip()
+                            )
+                    )
 
     @classmethod
     def write(
@@ -112,6 +204,12 @@ class KgWriter(object):
         if index is not None:
             insanity.sanitize_type("index", index, int)
             insanity.sanitize_range("index", index, minimum=0)
+        
+        # compute the paths of all files that store data with a status code
+        paths = cls._data_paths(target_dir, base_name, index)
+        classes_spec, literals_spec, relations_spec = paths[st.FACT]
+        classes_inf, literals_inf, relations_inf = paths[st.INFERRED]
+        classes_pred, literals_pred, relations_pred = paths[st.PREDICTION]
 
         # //////// Write Vocabulary ------------------------------------------------------------------------------------
         
@@ -138,13 +236,6 @@ class KgWriter(object):
 
         # //////// Write Class Memberships -----------------------------------------------------------------------------
 
-        classes_spec = os.path.join(target_dir, base_name + io.CLASSES_SPEC_EXT)
-        classes_inf = os.path.join(target_dir, base_name + io.CLASSES_INF_EXT)
-        classes_pred = os.path.join(target_dir, base_name + io.CLASSES_PRED_EXT)
-        if index is not None:
-            classes_spec += "." + str(index)
-            classes_inf += "." + str(index)
-            classes_pred += "." + str(index)
         with open(classes_spec, "w") as f_spec:
             with open(classes_inf, "w") as f_inf:
                 with open(classes_pred, "w") as f_pred:
@@ -156,13 +247,6 @@ class KgWriter(object):
         
         # //////// Write Literals --------------------------------------------------------------------------------------
 
-        literals_spec = os.path.join(target_dir, base_name + io.LITERALS_SPEC_EXT)
-        literals_inf = os.path.join(target_dir, base_name + io.LITERALS_INF_EXT)
-        literals_pred = os.path.join(target_dir, base_name + io.LITERALS_PRED_EXT)
-        if index is not None:
-            literals_spec += "." + str(index)
-            literals_inf += "." + str(index)
-            literals_pred += "." + str(index)
         with open(literals_spec, "w") as f_spec:
             with open(literals_inf, "w") as f_inf:
                 with open(literals_pred, "w") as f_pred:
@@ -182,13 +266,6 @@ class KgWriter(object):
 
         # //////// Write Relations -------------------------------------------------------------------------------------
 
-        relations_spec = os.path.join(target_dir, base_name + io.RELATIONS_SPEC_EXT)
-        relations_inf = os.path.join(target_dir, base_name + io.RELATIONS_INF_EXT)
-        relations_pred = os.path.join(target_dir, base_name + io.RELATIONS_PRED_EXT)
-        if index is not None:
-            relations_spec += "." + str(index)
-            relations_inf += "." + str(index)
-            relations_pred += "." + str(index)
         with open(relations_spec, "w") as f_spec:
             with open(relations_inf, "w") as f_inf:
                 with open(relations_pred, "w") as f_pred:
@@ -206,19 +283,101 @@ class KgWriter(object):
                         else:
                             f_spec.write(line)
     
+    @classmethod
+    def write_arrays(
+            cls,
+            arrays: kg_arrays.KgArrays,
+            target_dir: str,
+            base_name: str,
+            index: int = None
+    ) -> None:
+        """Writes an encoded knowledge graph to the specified path without decoding it first.
+        
+        The created files are the same as the ones that are created by :meth:`write` for the decoded graph, except for
+        the order of the triples and literal values, which are written in the order of the encoding.
+        
+        Args:
+            arrays (:class:`kg_arrays.KgArrays`): The encoded knowledge graph to write to disk.
+            target_dir (str): The path of the directory to place all the files in.
+            base_name (str): The base name to use, i.e., the prefix, included in all files' names.
+            index (int, optional): The element of a sequence of knowledge graphs that is written (cf. :meth:`write`).
+        
+        Raises:
+            ValueError: If ``target_dir`` does not refer to an existing directory.
+        """
+        # sanitize args
+        insanity.sanitize_type("arrays", arrays, kg_arrays.KgArrays)
+        target_dir = str(target_dir)
+        base_name = str(base_name)
+        if not os.path.isdir(target_dir):
+            raise ValueError("The directory <target_dir> does not exist: '{}'!".format(target_dir))
+        if index is not None:
+            insanity.sanitize_type("index", index, int)
+            insanity.sanitize_range("index", index, minimum=0)
+        
+        # write vocabulary and individuals
+        for ext, names in [
+                (io.CLASSES_VOCAB_EXT, arrays.classes),
+                (io.LITERALS_VOCAB_EXT, arrays.literals),
+                (io.RELATIONS_VOCAB_EXT, arrays.relations),
+                (io.INDIVIDUALS_SPEC_EXT, arrays.individuals)
+        ]:
+            with open(os.path.join(target_dir, base_name + ext), "w") as f:
+                for idx, name in enumerate(names):
+                    f.write(cls.VOCAB_PATTERN.format(index=idx, name=name))
+        
+        # write class memberships, literal values, and triples, one status at a time
+        paths = cls._data_paths(target_dir, base_name, index)
+        for status, (classes_path, literals_path, relations_path) in paths.items():
+            memberships = arrays.memberships[arrays.memberships[:, kg_arrays.KgArrays.MEMBERSHIP_STATUS] == status]
+            matrix = np.zeros((len(arrays.individuals), len(arrays.classes)), dtype=np.int8)
+            matrix[
+                    memberships[:, kg_arrays.KgArrays.MEMBERSHIP_INDIVIDUAL],
+                    memberships[:, kg_arrays.KgArrays.MEMBERSHIP_CLASS]
+            ] = memberships[:, kg_arrays.KgArrays.MEMBERSHIP_VALUE]
+            with open(classes_path, "w") as f:
+                for row in matrix.tolist():
+                    f.write(" ".join(map(str, row)) + "\n")
+            
+            with open(literals_path, "w") as f:
+                for ind, lit, value, lit_status in arrays.literal_values:
+                    if lit_status == status:
+                        f.write(cls.TRIPLES_PATTERN.format(subject=ind, predicate=lit, object=value))
+            
+            triples = arrays.triples[arrays.triples[:, triple_store.TripleStore.STATUS] == status]
+            with open(relations_path, "w") as f:
+                for t in triples.tolist():
+                    f.write(
+                            cls.TYPED_TRIPLES_PATTERN.format(
+                                    type=("+" if t[triple_store.TripleStore.POSITIVE] else "-"),
+                                    subject=t[triple_store.TripleStore.SUBJECT],
+                                    predicate=t[triple_store.TripleStore.PREDICATE],
+                                    object=t[triple_store.TripleStore.OBJECT]
+                            )
+                    )
+    
     @classmethod
     def write_sequence(
             cls,
             seq: typing.Sequence[knowledge_graph.KnowledgeGraph],
             target_dir: str,
-            base_name: str
+            base_name: str,
+            keyframe_interval: int = None
     ) -> None:
         """Writes the provided knowledge graph to the specified path.
+        
+        By default, every step of the sequence is written in full. If ``keyframe_interval`` is provided, then the
+        sequence is delta-encoded instead, i.e., only every ``keyframe_interval``-th step, a so-called keyframe, is
+        written in full, and the remaining ones are stored as the changes with respect to the previous step (cf.
+        :attr:`io.DELTA_EXT`). This requires all steps to share the same vocabulary and individuals, and is
+        transparently handled by :meth:`kg_reader.KgReader.read_sequence`.
 
         Args:
             seq (sequence[:class:`knowledge_graph.KnowledgeGraph`]): The knowledge graph sequence to write to disk.
             target_dir (str): The path of the directory to place all the files in.
             base_name (str): The base name to use, i.e., the prefix, included in all files' names.
+            keyframe_interval (int, optional): If this is provided, then the sequence is delta-encoded with a keyframe
+                every ``keyframe_interval`` steps.
 
         Raises:
             ValueError: If ``target_dir`` does not refer to an existing directory.
@@ -230,7 +389,20 @@ class KgWriter(object):
         if not os.path.isdir(target_dir):
             raise ValueError("The provided <target_dir> does not exist: '{}'!".format(target_dir))
         base_name = str(base_name)
+        if keyframe_interval is not None:
+            insanity.sanitize_type("keyframe_interval", keyframe_interval, int)
+            insanity.sanitize_range("keyframe_interval", keyframe_interval, minimum=1)
         
         # write the sequence to disk
         for idx, kg in enumerate(seq):
-            cls.write(kg, target_dir, base_name, index=idx)
+            delta_path = os.path.join(target_dir, base_name + io.DELTA_EXT + "." + str(idx))
+            if keyframe_interval is None or idx % keyframe_interval == 0:
+                cls.write(kg, target_dir, base_name, index=idx)
+                if os.path.isfile(delta_path):  # -> remove stale delta file
+                    os.remove(delta_path)
+            else:
+                cls._write_delta(seq[idx - 1], kg, delta_path)
+                for ext in io.SEQUENCE_EXT:  # -> remove stale files of the full encoding
+                    full_path = os.path.join(target_dir, base_name + ext + "." + str(idx))
+                    if os.path.isfile(full_path):
+                        os.remove(full_path)
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import kg_arrays
+from reldata.data import knowledge_graph
+from reldata.data import status as st
+from reldata.data import triple_store
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+# ==================================================================================================================== #
+#  CLASS  B A T C H  P A C K E R                                                                                       #
+# ==================================================================================================================== #
+
+
+class BatchPacker(object):
+    """Packs multiple knowledge graphs into a single batch of arrays.
+    
+    All graphs of a batch are combined into one disconnected graph, which is described by a single array of triples and
+    a single stack of membership matrices. To that end, the individuals of each graph are shifted by the total number
+    of individuals in all graphs that precede it, while the vocabulary, which is expected to be shared, is left as is:
+        
+        packer = BatchPacker()
+        for graphs in batches:
+            batch = packer.pack(graphs)
+            model(batch.triples, batch.memberships)
+    
+    The arrays of a batch are views of buffers that belong to the packer, and that are reused for all batches in order
+    to avoid allocating memory over and over again. Therefore, a batch stays valid until the next one is packed only,
+    unless it is copied (cf. :meth:`PackedBatch.copy`).
+    """
+    
+    def __init__(self):
+        """Creates a new ``BatchPacker``."""
+        self._membership_buffer = np.zeros((len(st.ALL), 0, 0), dtype=np.int8)
+        self._triple_buffer = np.zeros((0, triple_store.TripleStore.NUM_COLUMNS), dtype=np.int64)
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def _describe(
+            graph: typing.Union[knowledge_graph.KnowledgeGraph, kg_arrays.KgArrays]
+    ) -> typing.Tuple[int, int, int]:
+        """Determines the number of individuals, classes, and triples of a graph."""
+        if isinstance(graph, knowledge_graph.KnowledgeGraph):
+            num_individuals = max(len(graph.individuals), graph.memberships.shape[0])
+            return num_individuals, len(graph.classes), len(graph.triple_store)
+        elif isinstance(graph, kg_arrays.KgArrays):
+            return len(graph.individuals), len(graph.classes), len(graph.triples)
+        else:
+            raise TypeError("Expected a KnowledgeGraph or KgArrays, but found {}!".format(type(graph)))
+    
+    def pack(
+            self,
+            graphs: typing.Iterable[typing.Union[knowledge_graph.KnowledgeGraph, kg_arrays.KgArrays]]
+    ) -> "PackedBatch":
+        """Packs the provided graphs into a batch.
+        
+        Args:
+            graphs (iterable): The graphs to pack, each of which is either a :class:`knowledge_graph.KnowledgeGraph` or
+                a :class:`kg_arrays.KgArrays`. All of them are expected to share the same vocabulary.
+        
+        Returns:
+            :class:`PackedBatch`: The batch, which stays valid until the next call of ``pack``.
+        
+        Raises:
+            TypeError: If any of the ``graphs`` is neither a ``KnowledgeGraph`` nor a ``KgArrays``.
+        """
+        graphs = list(graphs)
+        sizes = np.array([self._describe(g) for g in graphs], dtype=np.int64).reshape(-1, 3)
+        
+        # compute the boundaries of all graphs
+        individual_offsets = np.zeros(len(graphs) + 1, dtype=np.int64)
+        np.cumsum(sizes[:, 0], out=individual_offsets[1:])
+        triple_offsets = np.zeros(len(graphs) + 1, dtype=np.int64)
+        np.cumsum(sizes[:, 2], out=triple_offsets[1:])
+        num_individuals = int(individual_offsets[-1])
+        num_classes = int(sizes[:, 1].max()) if len(graphs) > 0 else 0
+        num_triples = int(triple_offsets[-1])
+        
+        # grow the buffers if necessary (buffers never shrink)
+        if num_triples > len(self._triple_buffer):
+            self._triple_buffer = np.empty(
+                    (max(num_triples, 2 * len(self._triple_buffer)), triple_store.TripleStore.NUM_COLUMNS),
+                    dtype=np.int64
+            )
+        if num_individuals > self._membership_buffer.shape[1] or num_classes > self._membership_buffer.shape[2]:
+            self._membership_buffer = np.empty(
+                    (
+                            len(st.ALL),
+                            max(num_individuals, 2 * self._membership_buffer.shape[1]),
+                            max(num_classes, self._membership_buffer.shape[2])
+                    ),
+                    dtype=np.int8
+            )
+        triples = self._triple_buffer[:num_triples]
+        memberships = self._membership_buffer[:, :num_individuals, :num_classes]
+        memberships[...] = 0
+        
+        # copy the data of all graphs into the buffers
+        for g, ind_start, t_start, t_end in zip(graphs, individual_offsets, triple_offsets[:-1], triple_offsets[1:]):
+            if isinstance(g, knowledge_graph.KnowledgeGraph):
+                triples[t_start:t_end] = g.triple_store.array()
+                g_memberships = g.memberships.matrices()
+                memberships[:, ind_start:ind_start + g_memberships.shape[1], :g_memberships.shape[2]] = g_memberships
+            else:
+                triples[t_start:t_end] = g.triples
+                memberships[g.memberships[:, 3], g.memberships[:, 0] + ind_start, g.memberships[:, 1]] = (
+                        g.memberships[:, 2]
+                )
+        
+        # shift subjects and objects by the offsets of their graphs
+        shift = np.repeat(individual_offsets[:-1], sizes[:, 2])
+        triples[:, triple_store.TripleStore.SUBJECT] += shift
+        triples[:, triple_store.TripleStore.OBJECT] += shift
+        
+        return PackedBatch(triples, memberships, individual_offsets, triple_offsets)
+
+
+# ==================================================================================================================== #
+#  CLASS  P A C K E D  B A T C H                                                                                       #
+# ==================================================================================================================== #
+
+
+class PackedBatch(object):
+    """A batch of knowledge graphs that has been created by a :class:`BatchPacker`."""
+    
+    def __init__(
+            self,
+            triples: np.ndarray,
+            memberships: np.ndarray,
+            individual_offsets: np.ndarray,
+            triple_offsets: np.ndarray
+    ):
+        """Creates a new ``PackedBatch``.
+        
+        Args:
+            triples (``numpy.ndarray``): The encoded triples of all graphs with shifted individuals.
+            memberships (``numpy.ndarray``): The stacked membership matrices of all graphs.
+            individual_offsets (``numpy.ndarray``): The boundaries of the graphs' individuals.
+            triple_offsets (``numpy.ndarray``): The boundaries of the graphs' triples.
+        """
+        self._individual_offsets = individual_offsets
+        self._memberships = memberships
+        self._triple_offsets = triple_offsets
+        self._triples = triples
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __len__(self) -> int:
+        return len(self._individual_offsets) - 1
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def individual_offsets(self) -> np.ndarray:
+        """``numpy.ndarray``: A vector of length graphs + 1, such that the individuals of the i-th graph are those with
+        indices from ``individual_offsets[i]`` (inclusively) to ``individual_offsets[i + 1]`` (exclusively)."""
+        return self._individual_offsets
+    
+    @property
+    def memberships(self) -> np.ndarray:
+        """``numpy.ndarray``: An ``int8`` array of shape status codes x individuals x classes, which contains the
+        membership matrices (cf. :meth:`membership_store.MembershipStore.matrices`) of all graphs stacked on top of each
+        other."""
+        return self._memberships
+    
+    @property
+    def triple_offsets(self) -> np.ndarray:
+        """``numpy.ndarray``: A vector of length graphs + 1 that specifies the boundaries of the graphs' triples like
+        :attr:`individual_offsets`."""
+        return self._triple_offsets
+    
+    @property
+    def triples(self) -> np.ndarray:
+        """``numpy.ndarray``: The encoded triples (cf. :class:`triple_store.TripleStore`) of all graphs, whose subjects
+        and objects have been shifted by :attr:`individual_offsets`."""
+        return self._triples
+    
+    #  METHODS  ########################################################################################################
+    
+    def copy(self) -> "PackedBatch":
+        """Creates a copy of a ``PackedBatch`` that does not share any memory with the packer that created it."""
+        return PackedBatch(
+                self._triples.copy(),
+                self._memberships.copy(),
+                self._individual_offsets.copy(),
+                self._triple_offsets.copy()
+        )
+    
+    def graph_of(self, individuals: typing.Union[int, np.ndarray]) -> typing.Union[int, np.ndarray]:
+        """Determines which graphs the provided individuals belong to.
+        
+        Args:
+            individuals (int or ``numpy.ndarray``): The (shifted) indices of individuals.
+        
+        Returns:
+            int or ``numpy.ndarray``: The positions of the according graphs in the batch.
+        """
+        return np.searchsorted(self._individual_offsets, individuals, side="right") - 1
+    
+    def unpack(self) -> typing.List[typing.Tuple[np.ndarray, np.ndarray]]:
+        """Splits a ``PackedBatch`` into the data of the individual graphs again.
+        
+        Returns:
+            list[tuple[``numpy.ndarray``, ``numpy.ndarray``]]: The encoded triples and membership matrices of all graphs
+                in the batch with the original indices of their individuals.
+        """
+        results = []
+        for ind_start, ind_end, t_start, t_end in zip(
+                self._individual_offsets[:-1],
+                self._individual_offsets[1:],
+                self._triple_offsets[:-1],
+                self._triple_offsets[1:]
+        ):
+            triples = self._triples[t_start:t_end].copy()
+            triples[:, triple_store.TripleStore.SUBJECT] -= ind_start
+            triples[:, triple_store.TripleStore.OBJECT] -= ind_start
+            results.append((triples, self._memberships[:, ind_start:ind_end].copy()))
+        
+        return results
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides functions for evaluating link-prediction models on knowledge graphs.
+
+All of the functions follow the usual filtered setting: when a test triple is ranked against all of its corruptions,
+i.e., the triples that are obtained by replacing its head or tail with any other individual, corruptions that are known
+to hold are not taken into account. The scores of triples are computed by a user-provided function, which receives
+arrays of subjects, predicates, and objects of the same shape, and returns an array of scores of that shape, where
+higher scores indicate more plausible triples:
+    
+    def score_fn(subjects, predicates, objects):
+        return model.predict(subjects, predicates, objects)
+    
+    results = evaluate(kg, score_fn)
+    print(results["mrr"], results["hits@10"])
+"""
+
+
+import typing
+
+import insanity
+import numpy as np
+
+from reldata.data import knowledge_graph
+from reldata.data import status as st
+from reldata.data import triple_index
+from reldata.data import triple_store
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+SIDES = ["head", "tail", "both"]
+"""list[str]: The possible values for the arg ``side`` of :func:`filtered_ranks` and :func:`evaluate`."""
+
+
+def evaluate(
+        kg: knowledge_graph.KnowledgeGraph,
+        score_fn: typing.Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray],
+        ks: typing.Iterable[int] = (1, 3, 10),
+        side: str = "both",
+        batch_size: int = 256
+) -> typing.Dict[str, float]:
+    """Evaluates a link-prediction model on the positive prediction targets of a knowledge graph.
+    
+    Every positive triple of ``kg`` that is a prediction target, i.e., that is stored in a ``.relations.data.pred``
+    file, is ranked against its corruptions, and all of the positive triples of ``kg``, regardless of their status, are
+    filtered.
+    
+    Args:
+        kg (:class:`knowledge_graph.KnowledgeGraph`): The graph to evaluate on.
+        score_fn (callable): The function that computes the scores of triples.
+        ks (iterable[int], optional): The values of k that Hits@k is computed for. These default to 1, 3, and 10.
+        side (str, optional): Specifies whether heads, tails, or both of them are corrupted (cf. :attr:`SIDES`). This
+            defaults to ``"both"``.
+        batch_size (int, optional): The number of test triples that are ranked at once. This defaults to ``256``.
+    
+    Returns:
+        dict[str, float]: The mean reciprocal rank (``"mrr"``), the mean rank (``"mr"``), and Hits@k (``"hits@k"``) for
+            all of the ``ks``.
+    """
+    store = kg.triple_store
+    targets = store.array()[(store.status == st.PREDICTION) & (store.positive == 1)]
+    ranks = filtered_ranks(
+            targets,
+            score_fn,
+            triple_index.TripleIndex.from_kg(kg, status=st.ALL),
+            kg.memberships.shape[0],
+            side=side,
+            batch_size=batch_size
+    )
+    
+    results = {"mrr": mean_reciprocal_rank(ranks), "mr": float(ranks.mean()) if len(ranks) > 0 else 0.0}
+    for k in ks:
+        results["hits@{}".format(k)] = hits_at_k(ranks, k)
+    return results
+
+
+def filtered_ranks(
+        triples: np.ndarray,
+        score_fn: typing.Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray],
+        index: triple_index.TripleIndex,
+        num_individuals: int,
+        side: str = "tail",
+        batch_size: int = 256
+) -> np.ndarray:
+    """Computes the filtered ranks of test triples among their corruptions.
+    
+    The rank of a test triple is one plus the number of unfiltered corruptions that have a higher score. Corruptions
+    with the very same score are counted by half, which is the expected rank if ties are broken randomly.
+    
+    Args:
+        triples (``numpy.ndarray``): An integer matrix whose first three columns contain the subjects, predicates, and
+            objects of the test triples.
+        score_fn (callable): The function that computes the scores of triples.
+        index (:class:`triple_index.TripleIndex`): An index of all triples that are filtered.
+        num_individuals (int): The number of individuals, i.e., every individual with a smaller index is used for
+            corrupting test triples.
+        side (str, optional): Specifies whether heads, tails, or both of them are corrupted (cf. :attr:`SIDES`). This
+            defaults to ``"tail"``.
+        batch_size (int, optional): The number of test triples that are ranked at once. This defaults to ``256``.
+    
+    Returns:
+        ``numpy.ndarray``: The ranks of all test triples. If ``side`` is ``"both"``, then this contains the ranks of
+            all tail corruptions followed by those of all head corruptions.
+    
+    Raises:
+        ValueError: If ``side`` is invalid.
+    """
+    # sanitize args
+    if side not in SIDES:
+        raise ValueError("<side> has to be one of {}, but found '{}'!".format(SIDES, side))
+    insanity.sanitize_type("batch_size", batch_size, int)
+    insanity.sanitize_range("batch_size", batch_size, minimum=1)
+    triples = np.asarray(triples, dtype=np.int64)
+    if len(triples) == 0:
+        triples = np.zeros((0, 3), dtype=np.int64)
+    
+    if side == "both":
+        return np.concatenate(
+                [
+                        filtered_ranks(triples, score_fn, index, num_individuals, "tail", batch_size),
+                        filtered_ranks(triples, score_fn, index, num_individuals, "head", batch_size)
+                ]
+        )
+    
+    ranks = np.zeros(len(triples), dtype=np.float64)
+    candidates = np.arange(num_individuals, dtype=np.int64)[np.newaxis, :]
+    for start in range(0, len(triples), batch_size):
+        batch = triples[start:start + batch_size]
+        subjects = batch[:, triple_store.TripleStore.SUBJECT, np.newaxis]
+        predicates = batch[:, triple_store.TripleStore.PREDICATE, np.newaxis]
+        objects = batch[:, triple_store.TripleStore.OBJECT, np.newaxis]
+        
+        # assemble and score all corruptions of the current batch
+        if side == "tail":
+            corrupted = np.broadcast_arrays(subjects, predicates, candidates)
+            targets = objects
+        else:
+            corrupted = np.broadcast_arrays(candidates, predicates, objects)
+            targets = subjects
+        scores = np.asarray(score_fn(*corrupted), dtype=np.float64).reshape(len(batch), num_individuals)
+        true_scores = scores[np.arange(len(batch)), targets[:, 0], np.newaxis]
+        
+        # count the unfiltered corruptions with higher and equal scores
+        considered = ~index.contains(*corrupted) & (candidates != targets)
+        higher = np.count_nonzero((scores > true_scores) & considered, axis=1)
+        equal = np.count_nonzero((scores == true_scores) & considered, axis=1)
+        ranks[start:start + len(batch)] = 1 + higher + equal / 2
+    
+    return ranks
+
+
+def hits_at_k(ranks: np.ndarray, k: int) -> float:
+    """Computes the fraction of ranks that are at most ``k``.
+    
+    Args:
+        ranks (``numpy.ndarray``): The ranks of all test triples.
+        k (int): The considered number of top-ranked triples.
+    
+    Returns:
+        float: Hits@k, or ``0.0`` if there are no ranks.
+    """
+    ranks = np.asarray(ranks)
+    return float(np.mean(ranks <= k)) if len(ranks) > 0 else 0.0
+
+
+def mean_reciprocal_rank(ranks: np.ndarray) -> float:
+    """Computes the mean reciprocal rank.
+    
+    Args:
+        ranks (``numpy.ndarray``): The ranks of all test triples.
+    
+    Returns:
+        float: The mean reciprocal rank, or ``0.0`` if there are no ranks.
+    """
+    ranks = np.asarray(ranks, dtype=np.float64)
+    return float(np.mean(1 / ranks)) if len(ranks) > 0 else 0.0
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+
+import threading
+import typing
+
+import insanity
+import numpy as np
+
+from reldata.data import kg_arrays
+from reldata.data import knowledge_graph
+from reldata.data import status as st
+from reldata.data import triple_index
+from reldata.data import triple_store
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class NegativeSampler(object):
+    """Creates negative training examples by corrupting the heads or tails of positive triples.
+    
+    A ``NegativeSampler`` replaces either the subject or the object of each positive triple with an individual that is
+    drawn uniformly at random. Which of them is replaced is decided either uniformly (``"uniform"``) or with a
+    probability that depends on the relation (``"bernoulli"``): heads are corrupted more often for relations that have
+    many tails per head, and vice versa, which reduces the chance of creating false negatives. All corruptions that are
+    known to be positive triples, regardless of their status, are resampled, and all samples are drawn in batches in a
+    vectorized manner:
+        
+        sampler = NegativeSampler.from_kg(kg, mode="bernoulli", seed=0)
+        negatives = sampler.corrupt(positives, num_negatives=10)
+    
+    In addition, a fraction of the samples may be taken from the negative facts that are specified explicitly in the
+    graph. A ``NegativeSampler`` may be used by multiple threads at the same time. Given a fixed seed and the same
+    sequence of calls, it creates the same samples.
+    """
+    
+    MODES = ["uniform", "bernoulli"]
+    """list[str]: The supported strategies for deciding whether to corrupt heads or tails."""
+    
+    def __init__(
+            self,
+            triples: np.ndarray,
+            num_individuals: int,
+            mode: str = "uniform",
+            explicit_rate: float = 0.0,
+            max_tries: int = 10,
+            seed: int = None
+    ):
+        """Creates a new ``NegativeSampler``.
+        
+        Args:
+            triples (``numpy.ndarray``): All triples of the graph to sample from, encoded like the rows of a
+                :class:`triple_store.TripleStore`.
+            num_individuals (int): The number of individuals that are used for corrupting triples.
+            mode (str, optional): The strategy for deciding whether heads or tails are corrupted (cf. :attr:`MODES`).
+                This defaults to ``"uniform"``.
+            explicit_rate (float, optional): The fraction of samples that are drawn from the explicitly specified
+                negative facts instead of being created by corruption. This defaults to ``0.0``, and has no effect if
+                there are no negative facts.
+            max_tries (int, optional): The maximum number of times that a corruption, which turned out to be a known
+                positive triple, is resampled. This defaults to ``10``.
+            seed (int, optional): The seed of the random number generator.
+        
+        Raises:
+            ValueError: If ``mode`` is invalid, or any of the numeric args is out of range.
+        """
+        # sanitize args
+        if mode not in self.MODES:
+            raise ValueError("<mode> has to be one of {}, but found '{}'!".format(self.MODES, mode))
+        insanity.sanitize_type("num_individuals", num_individuals, int)
+        insanity.sanitize_range("num_individuals", num_individuals, minimum=1)
+        insanity.sanitize_range("explicit_rate", explicit_rate, minimum=0, maximum=1)
+        insanity.sanitize_type("max_tries", max_tries, int)
+        insanity.sanitize_range("max_tries", max_tries, minimum=0)
+        
+        # split the triples into positive facts, known positives, and explicit negatives
+        triples = np.asarray(triples, dtype=np.int64).reshape(-1, triple_store.TripleStore.NUM_COLUMNS)
+        positive = triples[:, triple_store.TripleStore.POSITIVE] == 1
+        facts = triples[:, triple_store.TripleStore.STATUS] == st.FACT
+        self._known = triple_index.TripleIndex(triples[positive, :3])
+        self._negatives = triples[~positive & facts, :3]
+        self._positives = triples[positive & facts, :3]
+        
+        # define remaining attributes
+        self._explicit_rate = float(explicit_rate) if len(self._negatives) > 0 else 0.0
+        self._head_probs = self._compute_head_probs(self._positives, mode)
+        self._lock = threading.Lock()  # guards the random number generator
+        self._max_tries = max_tries
+        self._num_individuals = num_individuals
+        self._rng = np.random.RandomState(seed)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def positives(self) -> np.ndarray:
+        """``numpy.ndarray``: The subjects, predicates, and objects of all positive facts, which are corrupted by
+        :meth:`sample`."""
+        return self._positives
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def _compute_head_probs(positives: np.ndarray, mode: str) -> np.ndarray:
+        """Computes the probability of corrupting the head of a triple for every relation."""
+        num_relations = int(positives[:, 1].max()) + 1 if len(positives) > 0 else 0
+        if mode == "uniform" or num_relations == 0:
+            return np.full(num_relations, 0.5)
+        
+        # count the triples as well as the distinct heads and tails of every relation
+        num_triples = np.bincount(positives[:, 1], minlength=num_relations)
+        num_heads = np.bincount(np.unique(positives[:, [1, 0]], axis=0)[:, 0], minlength=num_relations)
+        num_tails = np.bincount(np.unique(positives[:, [1, 2]], axis=0)[:, 0], minlength=num_relations)
+        
+        # the probability of corrupting the head is tph / (tph + hpt)
+        used = num_triples > 0
+        tails_per_head = np.ones(num_relations)
+        heads_per_tail = np.ones(num_relations)
+        tails_per_head[used] = num_triples[used] / num_heads[used]
+        heads_per_tail[used] = num_triples[used] / num_tails[used]
+        return tails_per_head / (tails_per_head + heads_per_tail)
+    
+    def _draw(self, num_samples: int) -> np.ndarray:
+        """Draws random individuals in a thread-safe manner."""
+        with self._lock:
+            return self._rng.randint(0, self._num_individuals, size=num_samples)
+    
+    def corrupt(self, triples: np.ndarray, num_negatives: int = 1) -> np.ndarray:
+        """Creates negative samples for the provided positive triples.
+        
+        Args:
+            triples (``numpy.ndarray``): An integer matrix whose first three columns contain the subjects, predicates,
+                and objects of the triples to corrupt.
+            num_negatives (int, optional): The number of samples that are created for each triple. This defaults to
+                ``1``.
+        
+        Returns:
+            ``numpy.ndarray``: An ``int64`` matrix with three columns, which contains ``num_negatives`` consecutive
+                samples for each of the ``triples``. Corruptions that are still known positive triples after
+                ``max_tries`` attempts are kept.
+        """
+        insanity.sanitize_type("num_negatives", num_negatives, int)
+        insanity.sanitize_range("num_negatives", num_negatives, minimum=1)
+        samples = np.repeat(np.asarray(triples, dtype=np.int64).reshape(len(triples), -1)[:, :3], num_negatives, axis=0)
+        
+        # decide which samples are taken from the explicit negatives, and which heads are corrupted
+        head_probs = np.full(len(samples), 0.5)
+        known_relations = samples[:, 1] < len(self._head_probs)
+        head_probs[known_relations] = self._head_probs[samples[known_relations, 1]]
+        with self._lock:
+            explicit = self._rng.random_sample(len(samples)) < self._explicit_rate
+            heads = self._rng.random_sample(len(samples)) < head_probs
+            explicit_rows = self._rng.randint(0, max(len(self._negatives), 1), size=np.count_nonzero(explicit))
+        
+        # corrupt triples, and resample those corruptions that are known positives
+        to_corrupt = np.flatnonzero(~explicit)
+        for _ in range(self._max_tries + 1):
+            replacements = self._draw(len(to_corrupt))
+            corrupt_heads = heads[to_corrupt]
+            samples[to_corrupt[corrupt_heads], 0] = replacements[corrupt_heads]
+            samples[to_corrupt[~corrupt_heads], 2] = replacements[~corrupt_heads]
+            to_corrupt = to_corrupt[
+                    self._known.contains(samples[to_corrupt, 0], samples[to_corrupt, 1], samples[to_corrupt, 2])
+            ]
+            if len(to_corrupt) == 0:
+                break
+        
+        samples[explicit] = self._negatives[explicit_rows]
+        return samples
+    
+    @classmethod
+    def from_kg(
+            cls,
+            kg: typing.Union[knowledge_graph.KnowledgeGraph, kg_arrays.KgArrays],
+            **kwargs
+    ) -> "NegativeSampler":
+        """Creates a ``NegativeSampler`` for a knowledge graph.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph` or :class:`kg_arrays.KgArrays`): The graph to sample from.
+            **kwargs: Any additional args of :meth:`__init__`.
+        
+        Returns:
+            :class:`NegativeSampler`: The created sampler.
+        """
+        if isinstance(kg, kg_arrays.KgArrays):
+            return cls(kg.triples, len(kg.individuals), **kwargs)
+        return cls(kg.triple_store.array(), kg.memberships.shape[0], **kwargs)
+    
+    def sample(self, num_samples: int, num_negatives: int = 1) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Draws random positive facts, and creates negative samples for them.
+        
+        Args:
+            num_samples (int): The number of positive facts to draw.
+            num_negatives (int, optional): The number of negative samples per positive fact. This defaults to ``1``.
+        
+        Returns:
+            tuple[``numpy.ndarray``, ``numpy.ndarray``]: The drawn positive facts and the negative samples (cf.
+                :meth:`corrupt`).
+        
+        Raises:
+            ValueError: If there are no positive facts to draw from.
+        """
+        if len(self._positives) == 0:
+            raise ValueError("There are no positive facts to sample from!")
+        with self._lock:
+            rows = self._rng.randint(0, len(self._positives), size=num_samples)
+        positives = self._positives[rows]
+        return positives, self.corrupt(positives, num_negatives=num_negatives)
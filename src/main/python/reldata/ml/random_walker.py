@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import functools
+import itertools
+import typing
+
+import insanity
+import numpy as np
+
+from concurrent import futures
+
+from reldata.data import kg_arrays
+from reldata.data import knowledge_graph
+from reldata.data import status as st
+from reldata.data import triple_store
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class RandomWalker(object):
+    """Generates relation-typed random walks over the triples of a knowledge graph.
+    
+    A ``RandomWalker`` encodes the considered triples of a graph as outgoing edges of individuals in compressed sparse
+    row format (CSR) once, and advances an entire batch of walks with every step by means of a few vectorized
+    operations. Every walk is described by the individuals that it visits as well as the relations that it follows:
+        
+        walker = RandomWalker(kg, inverse_edges=True)
+        individuals, relations = walker.walk(starts, walk_length=10, seed=0)
+    
+    If ``inverse_edges`` is set, then every triple may be followed from its object to its subject as well, and the
+    according steps are labeled with the index of the relation plus :attr:`num_relations`, i.e., the largest index of
+    any relation in the graph plus one, which is not necessarily the number of relations, as indices may be shared
+    with other graphs. By default, a walk chooses among the outgoing edges of an individual uniformly at random, but
+    these may be weighted by relation type, too. A walk that reaches an individual without outgoing edges stops early.
+    
+    The randomness of every call is determined by the provided seed alone, and thus a ``RandomWalker`` may be used by
+    multiple threads at the same time. :meth:`write_walks` generates walks in parallel, by default in worker processes,
+    each of which receives a copy of the walker once, and writes them to the disk in a deterministic order while they
+    are being generated.
+    """
+    
+    def __init__(
+            self,
+            kg: typing.Union[knowledge_graph.KnowledgeGraph, kg_arrays.KgArrays],
+            status: typing.Iterable[int] = (st.FACT,),
+            positive: bool = True,
+            inverse_edges: bool = False,
+            relation_weights: typing.Sequence[float] = None
+    ):
+        """Creates a new ``RandomWalker``.
+        
+        Args:
+            kg (:class:`knowledge_graph.KnowledgeGraph` or :class:`kg_arrays.KgArrays`): The graph to walk on.
+            status (iterable[int], optional): The status codes of the triples that are followed. This defaults to
+                facts only.
+            positive (bool, optional): Indicates whether positive or negative triples are followed. This defaults to
+                ``True``.
+            inverse_edges (bool, optional): Indicates whether triples may be followed from objects to subjects as well.
+                This defaults to ``False``.
+            relation_weights (sequence[float], optional): A non-negative weight for every relation index up to
+                :attr:`num_relations`, which is proportional to the probability of following a triple of this
+                relation. The same weight is used for inverse edges. By default, all triples are equally likely.
+        
+        Raises:
+            ValueError: If ``relation_weights`` has the wrong length or contains negative values.
+        """
+        # fetch the data of the graph
+        if isinstance(kg, kg_arrays.KgArrays):
+            triples = kg.triples
+            self._num_individuals = len(kg.individuals)
+            self._num_relations = len(kg.relations)
+        else:
+            triples = kg.triple_store.array()
+            self._num_individuals = kg.memberships.shape[0]
+            self._num_relations = max((r.index for r in kg.relations), default=-1) + 1  # -> indices may have gaps
+        
+        # determine the edges to walk along
+        mask = (
+                np.isin(triples[:, triple_store.TripleStore.STATUS], list(status)) &
+                (triples[:, triple_store.TripleStore.POSITIVE] == int(positive))
+        )
+        sources = triples[mask, triple_store.TripleStore.SUBJECT]
+        relations = triples[mask, triple_store.TripleStore.PREDICATE]
+        targets = triples[mask, triple_store.TripleStore.OBJECT]
+        if inverse_edges:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+            relations = np.concatenate([relations, relations + self._num_relations])
+        
+        # encode the edges in CSR format
+        order = np.argsort(sources, kind="mergesort")
+        self._indptr = np.zeros(self._num_individuals + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=self._num_individuals), out=self._indptr[1:])
+        self._relations = relations[order]
+        self._targets = targets[order]
+        
+        # compute the cumulative weights of the edges, if any
+        self._cum_weights = None
+        if relation_weights is not None:
+            relation_weights = np.asarray(relation_weights, dtype=np.float64)
+            if relation_weights.shape != (self._num_relations,):
+                raise ValueError(
+                        "<relation_weights> has to contain {} weights, but has shape {}!".format(
+                                self._num_relations,
+                                relation_weights.shape
+                        )
+                )
+            if np.any(relation_weights < 0):
+                raise ValueError("<relation_weights> must not contain negative values!")
+            self._cum_weights = np.zeros(len(self._relations) + 1)
+            np.cumsum(relation_weights[self._relations % self._num_relations], out=self._cum_weights[1:])
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def num_edges(self) -> int:
+        """int: The total number of edges that may be followed, including inverse ones."""
+        return len(self._targets)
+    
+    @property
+    def num_relations(self) -> int:
+        """int: The largest index of any relation in the graph plus one, which is the offset of the labels of inverse
+        edges."""
+        return self._num_relations
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def _format_walks(
+            walker: "RandomWalker",
+            starts: np.ndarray,
+            walk_length: int,
+            seed: typing.List[int]
+    ) -> str:
+        """Generates walks, and formats them as lines of text (this is executed by the workers of
+        :meth:`write_walks`)."""
+        individuals, relations = walker.walk(starts, walk_length, seed=seed)
+        tokens = np.full((len(starts), 2 * walk_length + 1), -1, dtype=np.int64)
+        tokens[:, 0::2] = individuals
+        tokens[:, 1::2] = relations
+        lines = []
+        for walk in tokens.tolist():
+            length = walk.index(-1) if -1 in walk else len(walk)
+            lines.append(" ".join(map(str, walk[:length])) + "\n")
+        return "".join(lines)
+    
+    def walk(
+            self,
+            starts: typing.Iterable[int],
+            walk_length: int,
+            seed: typing.Union[int, typing.Sequence[int]] = None
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Generates one random walk for each of the provided start individuals.
+        
+        Args:
+            starts (iterable[int]): The indices of the individuals to start from.
+            walk_length (int): The maximum number of steps of every walk.
+            seed (int or sequence[int], optional): The seed of the random number generator that is used.
+        
+        Returns:
+            tuple[``numpy.ndarray``, ``numpy.ndarray``]: Two ``int64`` matrices of shape walks x ``walk_length + 1``
+                and walks x ``walk_length``, which contain the indices of the visited individuals and of the followed
+                relations, respectively. Walks that stop early are padded with ``-1``.
+        
+        Raises:
+            ValueError: If ``walk_length`` is negative, or any of the ``starts`` is not the index of an individual.
+        """
+        # sanitize args
+        if walk_length < 0:
+            raise ValueError("<walk_length> has to be non-negative, but is {}!".format(walk_length))
+        starts = np.asarray(list(starts), dtype=np.int64)
+        if np.any((starts < 0) | (starts >= self._num_individuals)):
+            raise ValueError("<starts> contains indices of individuals that do not exist!")
+        rng = np.random.RandomState(seed)
+        
+        individuals = np.full((len(starts), walk_length + 1), -1, dtype=np.int64)
+        relations = np.full((len(starts), walk_length), -1, dtype=np.int64)
+        individuals[:, 0] = starts
+        
+        # advance all walks that have not stopped yet by one step at a time
+        active = np.arange(len(starts))
+        current = starts
+        for step in range(walk_length):
+            first_edges = self._indptr[current]
+            last_edges = self._indptr[current + 1]
+            if self._cum_weights is None:
+                alive = last_edges > first_edges
+            else:
+                alive = self._cum_weights[last_edges] > self._cum_weights[first_edges]
+            active = active[alive]
+            first_edges = first_edges[alive]
+            last_edges = last_edges[alive]
+            if len(active) == 0:
+                break
+            
+            # choose one of the outgoing edges of every current individual
+            samples = rng.random_sample(len(active))
+            if self._cum_weights is None:
+                edges = first_edges + (samples * (last_edges - first_edges)).astype(np.int64)
+            else:
+                low = self._cum_weights[first_edges]
+                high = self._cum_weights[last_edges]
+                edges = np.searchsorted(self._cum_weights, low + samples * (high - low), side="right") - 1
+            edges = np.clip(edges, first_edges, last_edges - 1)  # -> guard against rounding errors
+            
+            current = self._targets[edges]
+            individuals[active, step + 1] = current
+            relations[active, step] = self._relations[edges]
+        
+        return individuals, relations
+    
+    def write_walks(
+            self,
+            path: str,
+            walk_length: int,
+            starts: typing.Iterable[int] = None,
+            walks_per_individual: int = 1,
+            batch_size: int = 10000,
+            seed: int = None,
+            num_workers: int = 1,
+            processes: bool = True,
+            prefetch: int = 4
+    ) -> int:
+        """Generates random walks in parallel, and streams them to a text file.
+        
+        Every walk is written to a line of its own, as indices of individuals and relations alternately, separated by
+        spaces, i.e., ``individual relation individual relation ... individual``. Walks are generated in batches, and
+        batch ``i`` uses the seed ``[seed, i]``. Therefore, the created file depends on the seed and the batch size
+        only, but not on the number of workers.
+        
+        Args:
+            path (str): The path of the file to write the walks to, which is overwritten if it exists.
+            walk_length (int): The maximum number of steps of every walk.
+            starts (iterable[int], optional): The indices of the individuals to start walks from. By default, walks
+                are started from all individuals.
+            walks_per_individual (int, optional): The number of walks that are started from each individual. This
+                defaults to ``1``.
+            batch_size (int, optional): The number of walks per batch. This defaults to ``10000``.
+            seed (int, optional): The seed that the seeds of all batches are derived from.
+            num_workers (int, optional): The number of workers that generate walks. This defaults to ``1``.
+            processes (bool, optional): Indicates whether the workers are processes (the default) or threads. Worker
+                processes receive a copy of the walker once when they are started, and only the start individuals and
+                seeds of the batches are sent to them subsequently.
+            prefetch (int, optional): The maximum number of batches that are being generated ahead of writing them.
+                This defaults to ``4``.
+        
+        Returns:
+            int: The total number of walks that have been written.
+        
+        Raises:
+            ValueError: If any of the numeric args is out of range.
+        """
+        # sanitize args
+        insanity.sanitize_type("walks_per_individual", walks_per_individual, int)
+        insanity.sanitize_range("walks_per_individual", walks_per_individual, minimum=1)
+        insanity.sanitize_type("batch_size", batch_size, int)
+        insanity.sanitize_range("batch_size", batch_size, minimum=1)
+        insanity.sanitize_type("num_workers", num_workers, int)
+        insanity.sanitize_range("num_workers", num_workers, minimum=1)
+        insanity.sanitize_type("prefetch", prefetch, int)
+        insanity.sanitize_range("prefetch", prefetch, minimum=1)
+        if starts is None:
+            starts = np.arange(self._num_individuals)
+        starts = np.repeat(np.asarray(list(starts), dtype=np.int64), walks_per_individual)
+        if seed is None:
+            seed = np.random.randint(2 ** 31)
+        
+        # generate the walks batch by batch, and write them in the order of the batches
+        if processes:
+            executor = futures.ProcessPoolExecutor(
+                    max_workers=num_workers,
+                    initializer=_init_worker,
+                    initargs=(self,)
+            )
+            task = _format_batch
+        else:
+            executor = futures.ThreadPoolExecutor(max_workers=num_workers)
+            task = functools.partial(self._format_walks, self)
+        batches = (
+                executor.submit(task, starts[i:i + batch_size], walk_length, [seed, batch_idx])
+                for batch_idx, i in enumerate(range(0, len(starts), batch_size))
+        )
+        pending = collections.deque()  # the futures of all batches that are being generated ahead
+        try:
+            pending.extend(itertools.islice(batches, prefetch))
+            with open(path, "w") as f:
+                while pending:
+                    text = pending.popleft().result()
+                    pending.extend(itertools.islice(batches, 1))  # -> keep the queue filled
+                    f.write(text)
+        finally:
+            for p in pending:
+                p.cancel()
+            executor.shutdown(wait=False)
+        
+        return len(starts)
+
+
+_worker_walker = None
+"""RandomWalker: The walker that is used by the current worker process of :meth:`RandomWalker.write_walks`."""
+
+
+def _format_batch(starts: np.ndarray, walk_length: int, seed: typing.List[int]) -> str:
+    """Generates and formats a batch of walks by means of the walker of the current worker process."""
+    return RandomWalker._format_walks(_worker_walker, starts, walk_length, seed)
+
+
+def _init_worker(walker: RandomWalker) -> None:
+    """Installs the walker that is used by the current worker process."""
+    global _worker_walker
+    _worker_walker = walker
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides functions for splitting the data of knowledge graphs into training, validation, and test sets.
+
+All functions work on the integer encodings of graphs, i.e., :class:`kg_arrays.KgArrays`, and a split is described by
+one sorted vector of row indices for each of its parts. These are turned into graphs of their own by means of
+:func:`select`, which does not create any objects, and the results may be written to the disk by means of
+:meth:`reldata.io.kg_writer.KgWriter.write_arrays` directly:
+    
+    arrays = KgArrays.from_kg(kg)
+    train, valid, test = split_triples(arrays, [0.8, 0.1, 0.1], constraint="transductive", seed=0)
+    
+    KgWriter.write_arrays(select(arrays, triples=train), target_dir, "train")
+    KgWriter.write_arrays(select(arrays, triples=train, target_triples=valid), target_dir, "valid")
+
+By default, only facts are split, which means that the prediction targets of a graph, i.e., the contents of its
+``.pred`` files, are never mixed with any of the created parts.
+"""
+
+
+import typing
+
+import numpy as np
+
+from reldata.data import kg_arrays
+from reldata.data import status as st
+from reldata.data import triple_store
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+CONSTRAINTS = ["transductive", "inductive"]
+"""list[str]: The possible values for the arg ``constraint`` of :func:`split_triples`."""
+
+
+def _assign(
+        groups: np.ndarray,
+        ratios: typing.Sequence[float],
+        rng: np.random.RandomState
+) -> np.ndarray:
+    """Randomly assigns every element to one of the parts of a split such that the ratios hold within every group."""
+    ratios = np.asarray(ratios, dtype=np.float64)
+    if ratios.ndim != 1 or len(ratios) == 0 or np.any(ratios < 0) or ratios.sum() <= 0:
+        raise ValueError("<ratios> has to be a non-empty sequence of non-negative numbers with a positive sum!")
+    bounds = np.cumsum(ratios / ratios.sum())[:-1]
+    
+    # shuffle the elements within their groups, and compute the relative position of every element in its group
+    order = np.lexsort((rng.random_sample(len(groups)), groups))
+    sorted_groups = groups[order]
+    _, starts, sizes = np.unique(sorted_groups, return_index=True, return_counts=True)
+    group_idx = np.repeat(np.arange(len(starts)), sizes)
+    positions = (np.arange(len(groups)) - starts[group_idx] + 0.5) / sizes[group_idx]
+    
+    parts = np.empty(len(groups), dtype=np.int64)
+    parts[order] = np.searchsorted(bounds, positions, side="right")
+    return parts
+
+
+def _to_rows(candidates: np.ndarray, parts: np.ndarray, num_parts: int) -> typing.List[np.ndarray]:
+    """Turns the assignment of candidate rows to parts into one vector of row indices per part."""
+    return [np.sort(candidates[parts == p]) for p in range(num_parts)]
+
+
+def select(
+        arrays: kg_arrays.KgArrays,
+        triples: np.ndarray = None,
+        memberships: np.ndarray = None,
+        target_triples: np.ndarray = None,
+        target_memberships: np.ndarray = None
+) -> kg_arrays.KgArrays:
+    """Creates an encoded graph that consists of selected triples and class memberships of another one.
+    
+    The vocabulary, the individuals, and the literal values are shared with the original graph.
+    
+    Args:
+        arrays (:class:`kg_arrays.KgArrays`): The graph to select from.
+        triples (``numpy.ndarray``, optional): The rows of the triples to keep as they are. By default, all triples
+            are kept.
+        memberships (``numpy.ndarray``, optional): The rows of the class memberships to keep as they are. By default,
+            all memberships are kept.
+        target_triples (``numpy.ndarray``, optional): The rows of further triples that are turned into prediction
+            targets.
+        target_memberships (``numpy.ndarray``, optional): The rows of further class memberships that are turned into
+            prediction targets.
+    
+    Returns:
+        :class:`kg_arrays.KgArrays`: The created graph.
+    """
+    data = {}
+    for name, all_rows, rows, target_rows, status_col in [
+            ("triples", arrays.triples, triples, target_triples, triple_store.TripleStore.STATUS),
+            ("memberships", arrays.memberships, memberships, target_memberships, kg_arrays.KgArrays.MEMBERSHIP_STATUS)
+    ]:
+        selected = all_rows if rows is None else all_rows[np.asarray(rows, dtype=np.int64)]
+        if target_rows is not None:
+            targets = all_rows[np.asarray(target_rows, dtype=np.int64)].copy()
+            targets[:, status_col] = st.PREDICTION
+            selected = np.concatenate([selected, targets])
+        data[name] = selected
+    
+    return kg_arrays.KgArrays(
+            arrays.classes,
+            arrays.relations,
+            arrays.literals,
+            arrays.individuals,
+            data["triples"],
+            data["memberships"],
+            arrays.literal_values
+    )
+
+
+def split_memberships(
+        arrays: kg_arrays.KgArrays,
+        ratios: typing.Sequence[float],
+        status: typing.Iterable[int] = (st.FACT,),
+        stratify: bool = True,
+        seed: int = None
+) -> typing.List[np.ndarray]:
+    """Randomly splits the class memberships of a graph.
+    
+    Args:
+        arrays (:class:`kg_arrays.KgArrays`): The graph whose memberships are split.
+        ratios (sequence[float]): The relative sizes of the parts of the split, which are normalized to sum up to 1.
+        status (iterable[int], optional): The status codes of the memberships to split. This defaults to facts only.
+        stratify (bool, optional): Indicates whether the ratios are enforced for every class separately rather than for
+            all memberships together. This defaults to ``True``.
+        seed (int, optional): The seed of the random number generator.
+    
+    Returns:
+        list[``numpy.ndarray``]: The sorted rows of :attr:`kg_arrays.KgArrays.memberships` that belong to each of the
+            parts.
+    
+    Raises:
+        ValueError: If ``ratios`` is invalid.
+    """
+    candidates = np.flatnonzero(np.isin(arrays.memberships[:, kg_arrays.KgArrays.MEMBERSHIP_STATUS], list(status)))
+    if stratify:
+        groups = arrays.memberships[candidates, kg_arrays.KgArrays.MEMBERSHIP_CLASS]
+    else:
+        groups = np.zeros(len(candidates), dtype=np.int64)
+    parts = _assign(groups, ratios, np.random.RandomState(seed))
+    return _to_rows(candidates, parts, len(ratios))
+
+
+def split_triples(
+        arrays: kg_arrays.KgArrays,
+        ratios: typing.Sequence[float],
+        status: typing.Iterable[int] = (st.FACT,),
+        positive: bool = None,
+        stratify: bool = True,
+        constraint: str = None,
+        seed: int = None
+) -> typing.List[np.ndarray]:
+    """Randomly splits the triples of a graph.
+    
+    The split may be subject to one of the following constraints (cf. :attr:`CONSTRAINTS`):
+    
+    - ``"transductive"``: every individual that occurs in any but the first part, usually the training set, occurs in
+      the first part as well. Triples that violate this are moved to the first part.
+    - ``"inductive"``: the individuals are split according to ``ratios``, and every part consists of the triples among
+      the individuals of one part only. Triples between individuals of different parts are dropped, and ``stratify``
+      has no effect.
+    
+    Args:
+        arrays (:class:`kg_arrays.KgArrays`): The graph whose triples are split.
+        ratios (sequence[float]): The relative sizes of the parts of the split, which are normalized to sum up to 1.
+        status (iterable[int], optional): The status codes of the triples to split. This defaults to facts only.
+        positive (bool, optional): If this is provided, then only positive or negative triples, respectively, are
+            split. By default, both of them are.
+        stratify (bool, optional): Indicates whether the ratios are enforced for every relation separately rather than
+            for all triples together. This defaults to ``True``.
+        constraint (str, optional): An optional constraint that the split has to satisfy.
+        seed (int, optional): The seed of the random number generator.
+    
+    Returns:
+        list[``numpy.ndarray``]: The sorted rows of :attr:`kg_arrays.KgArrays.triples` that belong to each of the parts.
+    
+    Raises:
+        ValueError: If ``ratios`` or ``constraint`` is invalid.
+    """
+    # sanitize args
+    if constraint is not None and constraint not in CONSTRAINTS:
+        raise ValueError("<constraint> has to be one of {}, but found '{}'!".format(CONSTRAINTS, constraint))
+    
+    # determine the triples to split
+    triples = arrays.triples
+    mask = np.isin(triples[:, triple_store.TripleStore.STATUS], list(status))
+    if positive is not None:
+        mask &= triples[:, triple_store.TripleStore.POSITIVE] == int(positive)
+    candidates = np.flatnonzero(mask)
+    subjects = triples[candidates, triple_store.TripleStore.SUBJECT]
+    objects = triples[candidates, triple_store.TripleStore.OBJECT]
+    rng = np.random.RandomState(seed)
+    
+    # split the individuals for inductive splits, and keep only the triples within the same part
+    if constraint == "inductive":
+        individual_parts = _assign(np.zeros(len(arrays.individuals), dtype=np.int64), ratios, rng)
+        parts = individual_parts[subjects]
+        parts[individual_parts[objects] != parts] = -1
+        return _to_rows(candidates, parts, len(ratios))
+    
+    # split the triples, and move those with unseen individuals to the first part for transductive splits
+    groups = triples[candidates, triple_store.TripleStore.PREDICATE] if stratify else np.zeros_like(candidates)
+    parts = _assign(groups, ratios, rng)
+    if constraint == "transductive":
+        seen = np.zeros(len(arrays.individuals), dtype=bool)
+        seen[subjects[parts == 0]] = True
+        seen[objects[parts == 0]] = True
+        unseen = ~(seen[subjects] & seen[objects])
+        parts[unseen] = 0
+    
+    return _to_rows(candidates, parts, len(ratios))
@@ -2,6 +2,7 @@
 
 
 import collections
+import contextlib
 import typing
 
 import insanity
@@ -62,9 +63,12 @@ class ObservableSet(collections.MutableSet, typing.Generic[T]):
         insanity.sanitize_type("data", data, collections.Iterable, none_allowed=True)
         
         # define attributes
+        self._bulk_depth = 0         # the number of currently active bulk updates
         self._data = set()
-        self._observers = []
+        self._observers = {}         # all registered observers by their ids
         self._element_type = element_type
+        self._pending_added = {}     # elements added during a bulk update, which observers were not notified about
+        self._pending_removed = {}   # elements removed during a bulk update, which observers were not notified about
 
         # add provided data
         if data is not None:
@@ -75,6 +79,13 @@ class ObservableSet(collections.MutableSet, typing.Generic[T]):
     def __contains__(self, item):
         return item in self._data
     
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        
+        # transient observers are not pickled together with the set
+        state["_observers"] = {key: obs for key, obs in self._observers.items() if not obs.transient}
+        return state
+    
     def __iter__(self) -> typing.Iterator[T]:
         # As it turned out, the order in which the data is iterated may vary over multiple executions of the same Python
         # script if we simply return iter(self._data) in this method. Interestingly, this is the case even if we read
@@ -87,8 +98,44 @@ class ObservableSet(collections.MutableSet, typing.Generic[T]):
     def __len__(self) -> int:
         return len(self._data)
     
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        
+        # observers are stored by their ids, which change when they are unpickled
+        self._observers = {id(obs): obs for obs in self._observers.values()}
+    
     #  METHODS  ########################################################################################################
     
+    def _add(self, elem) -> None:
+        """Adds an element whose type has been checked already."""
+        if elem in self._data:
+            return
+        self._data.add(elem)
+        
+        # notify observers, or defer notification if a bulk update is running
+        if self._bulk_depth > 0:
+            if elem in self._pending_removed:
+                del self._pending_removed[elem]
+            else:
+                self._pending_added[elem] = None
+        else:
+            for obs in self._observers.values():
+                obs.element_added(elem)
+    
+    def _flush_notifications(self) -> None:
+        """Notifies all observers about the changes that have been made during a bulk update."""
+        removed = list(self._pending_removed)
+        added = list(self._pending_added)
+        self._pending_removed.clear()
+        self._pending_added.clear()
+        
+        if removed:
+            for obs in list(self._observers.values()):
+                obs.elements_removed(removed)
+        if added:
+            for obs in list(self._observers.values()):
+                obs.elements_added(added)
+    
     def add_observer(self, obs: set_observer.SetObserver) -> None:
         """Adds an observer to an ``ObservableSet``.
         
@@ -97,20 +144,14 @@ class ObservableSet(collections.MutableSet, typing.Generic[T]):
         Args:
             obs (:class:`set_observer.SetObserver`): The observer to add.
         """
-        if obs not in self._observers:
-            self._observers.append(obs)
+        self._observers.setdefault(id(obs), obs)
     
     def add(self, elem) -> None:
         # sanitize args
         insanity.sanitize_type("elem", elem, self._element_type)
         
         # add element to list
-        if elem not in self:
-            self._data.add(elem)
-            
-            # notify observers
-            for obs in self._observers:
-                obs.element_added(elem)
+        self._add(elem)
     
     def add_all(self, elements: typing.Iterable[T]) -> None:
         """Adds all elements in the provided ``Iterable`` to an ``ObservableSet``.
@@ -119,17 +160,57 @@ class ObservableSet(collections.MutableSet, typing.Generic[T]):
             elements (Iterable): The elements to add.
         """
         insanity.sanitize_type("elements", elements, collections.Iterable)
-        for e in elements:
-            self.add(e)
+        elements = list(elements)
+        
+        # check the types of all elements at once
+        for t in set(map(type, elements)):
+            if not issubclass(t, self._element_type):
+                raise TypeError("The <elements> have to be of type {}, but found {}!".format(self._element_type, t))
+        
+        # add all elements, and notify observers about all of them at once
+        with self.bulk_update():
+            for e in elements:
+                self._add(e)
+    
+    @contextlib.contextmanager
+    def bulk_update(self) -> typing.Iterator["ObservableSet[T]"]:
+        """Creates a context in which observers are notified about changes of an ``ObservableSet`` in batches.
+        
+        While a bulk update is running, the set is modified immediately, but notifications of its observers are deferred
+        until the (outermost) bulk update ends. Then, all observers are notified about all of the changes at once by
+        means of :meth:`set_observer.SetObserver.elements_removed` and :meth:`set_observer.SetObserver.elements_added`,
+        respectively. Changes that cancel each other out, e.g., adding and removing the same element, are coalesced.
+        
+            with some_set.bulk_update():
+                # observers are not notified about changes made here
+                ...
+            # all observers have been notified at this point
+        
+        Yields:
+            :class:`ObservableSet`: The set itself.
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                self._flush_notifications()
     
     def discard(self, elem) -> None:
         # remove element if present
-        if elem in self:
+        if elem in self._data:
             self._data.discard(elem)
 
-            # notify observers
-            for o in self._observers:
-                o.element_removed(elem)
+            # notify observers, or defer notification if a bulk update is running
+            if self._bulk_depth > 0:
+                if elem in self._pending_added:
+                    del self._pending_added[elem]
+                else:
+                    self._pending_removed[elem] = None
+            else:
+                for o in self._observers.values():
+                    o.element_removed(elem)
     
     def remove_observer(self, obs: set_observer.SetObserver) -> None:
         """Removes an observer of an ``ObservableSet``.
@@ -137,5 +218,4 @@ class ObservableSet(collections.MutableSet, typing.Generic[T]):
         Args:
             obs (:class:`set_observer.SetObserver`): The observer to remove.
         """
-        if obs in self._observers:
-            self._observers.remove(obs)
+        self._observers.pop(id(obs), None)
@@ -2,9 +2,11 @@
 
 
 import collections
+import contextlib
 import typing
 
 import insanity
+import numpy as np
 
 from reldata.util import set_observer
 
@@ -56,7 +58,8 @@ class OrderedSet(collections.MutableSet, typing.Generic[T]):
             self,
             element_type: typing.Type[T],
             index_func: typing.Callable[[T], int],
-            data: typing.Iterable[T]=None
+            data: typing.Iterable[T]=None,
+            name_func: typing.Callable[[T], str]=None
     ):
         """Creates a new empty ``OrderedSet``.
         
@@ -64,20 +67,30 @@ class OrderedSet(collections.MutableSet, typing.Generic[T]):
             element_type (type): The type of the elements that will be added to the newly created set.
             index_func (function): A function that maps instances of type ``element_type`` to (unique) integer indices.
             data (Iterable, optional): An optional iterable that specifies data to add the newly created set.
+            name_func (function, optional): A function that maps instances of type ``element_type`` to names. If this
+                is provided, then the set maintains an index that allows for looking up elements by their names.
         """
         # sanitize args
         insanity.sanitize_type("element_type", element_type, type)
         if not callable(index_func):
             raise TypeError("The parameter <index_func> has to be callable!")
         insanity.sanitize_type("data", data, collections.Iterable, none_allowed=True)
+        if name_func is not None and not callable(name_func):
+            raise TypeError("The parameter <name_func> has to be callable!")
         
         # define attributes
+        self._bulk_depth = 0               # the number of currently active bulk updates
         self._data = []                    # a list that stores the data orderly
         self._element_type = element_type  # the type of elements of the set
         self._index_func = index_func      # a function that maps elements to indices
         self._len = 0                      # the length of self._data
+        self._name_func = name_func        # a function that maps elements to names (optional)
+        self._names = {}                   # maps names to elements (only used if a name_func was provided)
         self._num_elements = 0             # the actual number of elements in self._data (without Nones)
-        self._observers = []               # a list of all registered observers of an OrderedSet
+        self._observers = {}               # all registered observers of an OrderedSet by their ids
+        self._pending_added = {}           # maps indices to elements added during a bulk update (not notified yet)
+        self._pending_removed = {}         # maps indices to elements removed during a bulk update (not notified yet)
+        self._sorted_names = None          # a cached pair of arrays of sorted names and according indices
     
         # add provided data
         if data is not None:
@@ -116,6 +129,13 @@ class OrderedSet(collections.MutableSet, typing.Generic[T]):
         # the item is missing -> raise error
         raise KeyError("Unknown key: {}!".format(item))
     
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        
+        # transient observers are not pickled together with the set
+        state["_observers"] = {key: obs for key, obs in self._observers.items() if not obs.transient}
+        return state
+    
     def __iter__(self) -> typing.Iterator[T]:
         for element in self._data:
             if element is not None:
@@ -124,12 +144,25 @@ class OrderedSet(collections.MutableSet, typing.Generic[T]):
     def __len__(self) -> int:
         return self._num_elements
     
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        
+        # observers are stored by their ids, which change when they are unpickled
+        self._observers = {id(obs): obs for obs in self._observers.values()}
+    
     #  METHODS  ########################################################################################################
     
-    def add(self, element: T) -> None:
-        # sanitize args
-        insanity.sanitize_type("element", element, self._element_type)
+    def _check_names(self) -> None:
+        """Ensures that an ``OrderedSet`` maintains an index of names.
         
+        Raises:
+            ValueError: If the ``OrderedSet`` has been created without a ``name_func``.
+        """
+        if self._name_func is None:
+            raise ValueError("This OrderedSet has been created without a <name_func>!")
+    
+    def _add(self, element: T) -> None:
+        """Adds an element whose type has been checked already."""
         # get index of new element
         index = self._index_func(element)
         
@@ -146,20 +179,61 @@ class OrderedSet(collections.MutableSet, typing.Generic[T]):
         # store provided element
         self._data[index] = element
         self._num_elements += 1
+        if self._name_func is not None:
+            self._names[self._name_func(element)] = element
+            self._sorted_names = None
         
-        # notify all observers about the new element
-        for obs in self._observers:
-            obs.element_added(element)
+        # notify all observers about the new element, or defer notification if a bulk update is running
+        if self._bulk_depth > 0:
+            if self._pending_removed.get(index) is element:
+                del self._pending_removed[index]
+            else:
+                self._pending_added[index] = element
+        else:
+            for obs in self._observers.values():
+                obs.element_added(element)
+    
+    def _flush_notifications(self) -> None:
+        """Notifies all observers about the changes that have been made during a bulk update."""
+        removed = list(self._pending_removed.values())
+        added = list(self._pending_added.values())
+        self._pending_removed.clear()
+        self._pending_added.clear()
+        
+        if removed:
+            for obs in list(self._observers.values()):
+                obs.elements_removed(removed)
+        if added:
+            for obs in list(self._observers.values()):
+                obs.elements_added(added)
+    
+    def add(self, element: T) -> None:
+        # sanitize args
+        insanity.sanitize_type("element", element, self._element_type)
+        
+        self._add(element)
     
     def add_all(self, elements: typing.Iterable[T]) -> None:
         """Adds all elements in the provided ``Iterable`` to an ``OrderedSet``.
         
+        The types of the provided elements are checked before any of them is added, and all observers are notified
+        about the new elements at once (cf. :meth:`bulk_update`).
+        
         Args:
             elements (Iterable): The elements to add.
         """
         insanity.sanitize_type("elements", elements, collections.Iterable)
-        for e in elements:
-            self.add(e)
+        elements = list(elements)
+        
+        # check the types of all elements at once
+        for t in set(map(type, elements)):
+            if not issubclass(t, self._element_type):
+                raise TypeError("The <elements> have to be of type {}, but found {}!".format(self._element_type, t))
+        
+        # add all elements, and notify observers about all of them at once
+        with self.bulk_update():
+            for e in elements:
+                self._add(e)
     
     def add_observer(self, obs: set_observer.SetObserver) -> None:
         """Adds an observer to an ``OrderedSet``.
@@ -169,28 +243,160 @@ class OrderedSet(collections.MutableSet, typing.Generic[T]):
         Args:
             obs (:class:`set_observer.SetObserver`): The observer to add.
         """
-        if obs not in self._observers:
-            self._observers.append(obs)
+        self._observers.setdefault(id(obs), obs)
+    
+    @contextlib.contextmanager
+    def bulk_update(self) -> typing.Iterator["OrderedSet[T]"]:
+        """Creates a context in which observers are notified about changes of an ``OrderedSet`` in batches.
+        
+        While a bulk update is running, the set is modified immediately, but notifications of its observers are deferred
+        until the (outermost) bulk update ends. Then, all observers are notified about all of the changes at once by
+        means of :meth:`set_observer.SetObserver.elements_removed` and :meth:`set_observer.SetObserver.elements_added`,
+        respectively. Changes that cancel each other out, e.g., adding and removing the same element, are coalesced.
+        
+        Yields:
+            :class:`OrderedSet`: The set itself.
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                self._flush_notifications()
     
     def discard(self, value: typing.Union[T, int]) -> None:
         # if value is not contained in the set -> nothing to do
         if value not in self:
             return
         
-        # fetch index of element to remove
-        element = self._index_func(value) if isinstance(value, self._element_type) else value
+        # fetch index of element to remove as well as the element itself
+        index = self._index_func(value) if isinstance(value, self._element_type) else value
+        element = self._data[index]
 
         # remove element from data list
-        if element == self._len - 1:
-            del self._data[element]
+        if index == self._len - 1:
+            del self._data[index]
             self._len -= 1
         else:
-            self._data[element] = None
+            self._data[index] = None
         self._num_elements -= 1
+        if self._name_func is not None:
+            name = self._name_func(element)
+            if self._names.get(name) is element:
+                del self._names[name]
+            self._sorted_names = None
+    
+        # notify all observers about the removed element, or defer notification if a bulk update is running
+        if self._bulk_depth > 0:
+            if self._pending_added.get(index) is element:
+                del self._pending_added[index]
+            else:
+                self._pending_removed[index] = element
+        else:
+            for obs in self._observers.values():
+                obs.element_removed(element)
+    
+    def get_by_name(self, name: str) -> T:
+        """Retrieves the element with the provided name.
+        
+        Args:
+            name (str): The name of the element to retrieve.
+        
+        Returns:
+            The element whose name is ``name``.
+        
+        Raises:
+            KeyError: If the set does not contain an element with the provided name.
+            ValueError: If the ``OrderedSet`` has been created without a ``name_func``.
+        """
+        self._check_names()
+        try:
+            return self._names[name]
+        except KeyError:
+            raise KeyError("Unknown name: '{}'!".format(name))
+    
+    def has_name(self, name: str) -> bool:
+        """Checks whether an ``OrderedSet`` contains an element with the provided name.
+        
+        Args:
+            name (str): The name to check.
+        
+        Returns:
+            bool: ``True`` if an element with the name ``name`` is contained in the set, and ``False`` otherwise.
+        
+        Raises:
+            ValueError: If the ``OrderedSet`` has been created without a ``name_func``.
+        """
+        self._check_names()
+        return name in self._names
     
-        # notify all observers about the removed element
-        for obs in self._observers:
-            obs.element_removed(element)
+    def index_of(self, name: str) -> int:
+        """Retrieves the index of the element with the provided name.
+        
+        Args:
+            name (str): The name of the element whose index is retrieved.
+        
+        Returns:
+            int: The index of the element whose name is ``name``.
+        
+        Raises:
+            KeyError: If the set does not contain an element with the provided name.
+            ValueError: If the ``OrderedSet`` has been created without a ``name_func``.
+        """
+        return self._index_func(self.get_by_name(name))
+    
+    def indices_of(self, names: typing.Union[typing.Iterable[str], np.ndarray], default: int=None) -> np.ndarray:
+        """Translates many names into the indices of the according elements at once.
+        
+        The translation is vectorized by means of a sorted array of all names in the set, which is cached until the
+        set is modified next. Therefore, this method is suitable for encoding large amounts of data, e.g., triples that
+        have been provided as strings.
+        
+        Args:
+            names (iterable or ``numpy.ndarray``): The names to translate. If this is a ``numpy.ndarray``, then it may
+                have an arbitrary shape.
+            default (int, optional): The index to use for names that are not in the set. If this is not provided, then
+                unknown names cause an error.
+        
+        Returns:
+            ``numpy.ndarray``: An integer array of the same shape as ``names`` that contains the according indices.
+        
+        Raises:
+            KeyError: If ``default`` is ``None`` and any of the provided names does not belong to an element of the set.
+            ValueError: If the ``OrderedSet`` has been created without a ``name_func``.
+        """
+        self._check_names()
+        
+        # create the sorted arrays of names and indices if necessary
+        if self._sorted_names is None:
+            all_names = np.array(list(self._names.keys()), dtype=str)
+            all_indices = np.fromiter(
+                    (self._index_func(e) for e in self._names.values()),
+                    dtype=np.int64,
+                    count=len(self._names)
+            )
+            order = np.argsort(all_names, kind="mergesort")
+            self._sorted_names = all_names[order], all_indices[order]
+        sorted_names, sorted_indices = self._sorted_names
+        
+        # look up all of the provided names
+        names = np.asarray(names if isinstance(names, np.ndarray) else list(names), dtype=str)
+        if len(sorted_names) == 0:
+            pos = np.zeros(names.shape, dtype=np.int64)
+            found = np.zeros(names.shape, dtype=bool)
+        else:
+            pos = np.minimum(np.searchsorted(sorted_names, names), len(sorted_names) - 1)
+            found = sorted_names[pos] == names
+        
+        # assemble the result
+        if not found.all():
+            if default is None:
+                raise KeyError("Unknown name: '{}'!".format(names[~found].flat[0]))
+            result = np.full(names.shape, default, dtype=np.int64)
+            result[found] = sorted_indices[pos[found]]
+            return result
+        return sorted_indices[pos]
     
     def remove_observer(self, obs: set_observer.SetObserver) -> None:
         """Removes an observer of an ``OrderedSet``.
@@ -198,5 +404,4 @@ class OrderedSet(collections.MutableSet, typing.Generic[T]):
         Args:
             obs (:class:`set_observer.SetObserver`): The observer to remove.
         """
-        if obs in self._observers:
-            self._observers.remove(obs)
+        self._observers.pop(id(obs), None)
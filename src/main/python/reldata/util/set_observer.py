@@ -2,6 +2,7 @@
 
 
 import abc
+import typing
 
 
 __author__ = "Patrick Hohenecker"
@@ -41,6 +42,10 @@ class SetObserver(metaclass=abc.ABCMeta):
     """An interface that defines those methods that observers of :class:`reldata.util.observable_set.ObservableSet`s and
     :class:`reldata.util.ordered_set.OrderedSet`s, respectively, have to implement."""
     
+    transient = False
+    """bool: Indicates whether an observer is left out when an observed set is pickled, which is the case for observers
+    that only exist as long as some other object does, e.g., because they refer to it weakly."""
+    
     @abc.abstractmethod
     def element_added(self, elem) -> None:
         """An event function that is invoked whenever an element is added to the observed set.
@@ -58,3 +63,29 @@ class SetObserver(metaclass=abc.ABCMeta):
             elem: The element that has been removed.
         """
         pass
+    
+    def elements_added(self, elements: typing.Sequence) -> None:
+        """An event function that is invoked when the observed set is notifying its observers in a batch, e.g., at the
+        end of a bulk update, about a number of elements that have been added.
+        
+        By default, this method simply invokes :meth:`element_added` for each of the elements, but it may be overridden
+        in order to process batches more efficiently.
+        
+        Args:
+            elements (sequence): The elements that have been added.
+        """
+        for elem in elements:
+            self.element_added(elem)
+    
+    def elements_removed(self, elements: typing.Sequence) -> None:
+        """An event function that is invoked when the observed set is notifying its observers in a batch, e.g., at the
+        end of a bulk update, about a number of elements that have been removed.
+        
+        By default, this method simply invokes :meth:`element_removed` for each of the elements, but it may be
+        overridden in order to process batches more efficiently.
+        
+        Args:
+            elements (sequence): The elements that have been removed.
+        """
+        for elem in elements:
+            self.element_removed(elem)
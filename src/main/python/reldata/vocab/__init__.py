@@ -9,6 +9,7 @@ from reldata.vocab.literal_type import LiteralType
 from reldata.vocab.literal_type_factory import LiteralTypeFactory
 from reldata.vocab.relation_type import RelationType
 from reldata.vocab.relation_type_factory import RelationTypeFactory
+from reldata.vocab.vocab_registry import VocabRegistry
 
 
 __author__ = "Patrick Hohenecker"
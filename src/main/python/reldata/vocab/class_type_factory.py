@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
 
+import sys
+import typing
+
 from reldata.data import data_context as dc
 from reldata.vocab import class_type
 
@@ -56,9 +59,16 @@ class ClassTypeFactory(object):
     #  METHODS  ########################################################################################################
 
     @classmethod
-    def _prepare_context(cls):
-        if dc.DataContext.get_context()[cls._LAST_INDEX] is None:
+    def _prepare_context(cls) -> dc.DataContext:
+        """Retrieves the currently active context, and initializes it for the factory if necessary.
+        
+        Returns:
+            :class:`dc.DataContext`: The context.
+        """
+        ctx = dc.DataContext.get_context()
+        if ctx[cls._LAST_INDEX] is None:
             cls.reset()
+        return ctx
     
     @classmethod
     def create_class(cls, name: str) -> class_type.ClassType:
@@ -66,20 +76,41 @@ class ClassTypeFactory(object):
         
         Args:
             name (str): The name to assign to the created :class:`class_type.ClassType`. If the provided ``name`` is not
-                a ``str``, then it is converted into such.
+                a ``str``, then it is converted into such. In any case, the name is interned (cf. ``sys.intern``).
             
         Returns:
             :class:`class_type.ClassType`: The constructed instance.
         """
-        # prepare context if necessary
-        cls._prepare_context()
-        
-        # fetch current context
-        ctx = dc.DataContext.get_context()
+        # fetch current context, and prepare it if necessary
+        ctx = cls._prepare_context()
         
         # create class
         ctx[cls._LAST_INDEX] += 1
-        return _ClassType(ctx[cls._LAST_INDEX], str(name))
+        return _ClassType(ctx[cls._LAST_INDEX], sys.intern(str(name)))
+    
+    @classmethod
+    def create_classes(cls, names: typing.Iterable[str]) -> typing.List[class_type.ClassType]:
+        """Constructs instances of :class:`class_type.ClassType` for all of the provided names at once.
+        
+        This has the same effect as invoking :meth:`create_class` for each of the names in turn, but reserves the
+        according range of indices in a single step.
+        
+        Args:
+            names (iterable[str]): The names to assign to the created instances, which are converted and interned like
+                the arg ``name`` of :meth:`create_class`.
+        
+        Returns:
+            list[:class:`class_type.ClassType`]: The constructed instances in the same order as ``names``.
+        """
+        names = [sys.intern(str(n)) for n in names]
+        
+        # fetch current context, and prepare it if necessary
+        ctx = cls._prepare_context()
+        
+        # reserve the needed indices, and create all classes
+        first_index = ctx[cls._LAST_INDEX] + 1
+        ctx[cls._LAST_INDEX] += len(names)
+        return [_ClassType(index, name) for index, name in enumerate(names, start=first_index)]
     
     @classmethod
     def reset(cls) -> None:
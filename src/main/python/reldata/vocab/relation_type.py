@@ -45,7 +45,7 @@ class RelationType(vocab_element.VocabElement, metaclass=abc.ABCMeta):
     #  MAGIC FUNCTIONS  ################################################################################################
     
     def __eq__(self, other) -> bool:
-        return (
+        return other is self or (
                 isinstance(other, RelationType) and
                 other.index == self.index and
                 other.name == self.name
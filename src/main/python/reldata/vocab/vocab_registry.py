@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+
+import threading
+import typing
+
+from reldata.data import data_context as dc
+from reldata.vocab import class_type
+from reldata.vocab import class_type_factory as ctf
+from reldata.vocab import literal_type
+from reldata.vocab import literal_type_factory as ltf
+from reldata.vocab import relation_type
+from reldata.vocab import relation_type_factory as rtf
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class VocabRegistry(object):
+    """A registry that allows multiple knowledge graphs to share the same instances of their vocabulary.
+    
+    Usually, every knowledge graph is created in a :class:`dc.DataContext` of its own, and thus has its own instances of
+    :class:`class_type.ClassType`, :class:`relation_type.RelationType`, and :class:`literal_type.LiteralType`, even if
+    many graphs share the very same vocabulary. A ``VocabRegistry`` caches the vocabulary objects for every sequence of
+    names that it is asked for, and hands out the same instances whenever the same names are requested again. This
+    saves memory as well as loading time, and allows for comparing the vocabularies of different graphs by identity:
+        
+        registry = VocabRegistry()
+        kgs = KgReader.read_all(input_dir, vocab_registry=registry)
+        
+        # graphs that have the same classes share the same instances
+        kgs[0].classes[0] is kgs[1].classes[0]
+    
+    The vocabulary objects that are created by a ``VocabRegistry`` are assigned indices according to their positions in
+    the provided sequences of names, i.e., the same indices that they would get in a fresh context, and they live in a
+    ``DataContext`` that belongs to the registry. A ``VocabRegistry`` may be used by multiple threads at the same time.
+    """
+    
+    def __init__(self):
+        """Creates a new empty ``VocabRegistry``."""
+        self._classes = {}                # maps tuples of names to tuples of class types
+        self._context = dc.DataContext()  # the context that all vocabulary objects are created in
+        self._literals = {}               # maps tuples of names to tuples of literal types
+        self._lock = threading.Lock()     # guards the caches as well as the context
+        self._relations = {}              # maps tuples of names to tuples of relation types
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+    
+    def __len__(self) -> int:
+        return len(self._classes) + len(self._relations) + len(self._literals)
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    #  METHODS  ########################################################################################################
+    
+    def _get(
+            self,
+            cache: typing.Dict[typing.Tuple[str, ...], tuple],
+            names: typing.Iterable[str],
+            factory_reset: typing.Callable[[], None],
+            factory_create: typing.Callable[[typing.Iterable[str]], list]
+    ) -> tuple:
+        """Retrieves the cached vocabulary objects for the provided names, and creates them if necessary.
+        
+        Args:
+            cache (dict): The cache to use.
+            names (iterable[str]): The names of the requested vocabulary objects.
+            factory_reset (callable): The ``reset`` method of the factory that creates the requested type of objects.
+            factory_create (callable): The bulk-creation method of the same factory.
+        
+        Returns:
+            tuple: The requested vocabulary objects in the same order as ``names``.
+        """
+        names = tuple(str(n) for n in names)
+        with self._lock:
+            vocab = cache.get(names)
+            if vocab is None:
+                with self._context:
+                    factory_reset()  # -> indices always start at 0
+                    vocab = tuple(factory_create(names))
+                cache[names] = vocab
+        return vocab
+    
+    def clear(self) -> None:
+        """Removes all cached vocabulary objects from a ``VocabRegistry``."""
+        with self._lock:
+            self._classes.clear()
+            self._relations.clear()
+            self._literals.clear()
+            self._context.clear()
+    
+    def get_classes(self, names: typing.Iterable[str]) -> typing.Tuple[class_type.ClassType, ...]:
+        """Retrieves the shared class types with the provided names.
+        
+        Args:
+            names (iterable[str]): The names of the classes in the order of their indices.
+        
+        Returns:
+            tuple[:class:`class_type.ClassType`]: The class types in the same order as ``names``.
+        """
+        return self._get(
+                self._classes,
+                names,
+                ctf.ClassTypeFactory.reset,
+                ctf.ClassTypeFactory.create_classes
+        )
+    
+    def get_literals(self, names: typing.Iterable[str]) -> typing.Tuple[literal_type.LiteralType, ...]:
+        """Retrieves the shared literal types with the provided names.
+        
+        Args:
+            names (iterable[str]): The names of the literals in the order of their indices.
+        
+        Returns:
+            tuple[:class:`literal_type.LiteralType`]: The literal types in the same order as ``names``.
+        """
+        return self._get(
+                self._literals,
+                names,
+                ltf.LiteralTypeFactory.reset,
+                ltf.LiteralTypeFactory.create_literals
+        )
+    
+    def get_relations(self, names: typing.Iterable[str]) -> typing.Tuple[relation_type.RelationType, ...]:
+        """Retrieves the shared relation types with the provided names.
+        
+        Args:
+            names (iterable[str]): The names of the relations in the order of their indices.
+        
+        Returns:
+            tuple[:class:`relation_type.RelationType`]: The relation types in the same order as ``names``.
+        """
+        return self._get(
+                self._relations,
+                names,
+                rtf.RelationTypeFactory.reset,
+                rtf.RelationTypeFactory.create_relations
+        )
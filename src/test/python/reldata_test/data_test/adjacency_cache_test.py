@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+from reldata.data import status as st
+from reldata.io import kg_reader
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class AdjacencyCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+    
+    def _target_coo(self, relation, status, positive):
+        return sorted(
+                (t.subject.index, t.object.index)
+                for t in self.kg.triples
+                if t.predicate == relation and st.of(t) == status and t.positive == positive
+        )
+    
+    def _check_all(self):
+        for relation in self.kg.relations:
+            for status in st.ALL:
+                for positive in [True, False]:
+                    rows, cols = self.kg.adjacency.coo(relation, status=status, positive=positive)
+                    self.assertEqual(self._target_coo(relation, status, positive), list(zip(rows, cols)))
+    
+    def test_bulk_updates(self):
+        triples = list(self.kg.triples)[::2]
+        self.kg.adjacency.coo(triples[0].predicate)  # -> builds all matrices
+        
+        # CHECK: removing a batch of triples updates all affected matrices
+        with self.kg.bulk_update():
+            for t in triples:
+                self.kg.triples.discard(t)
+        self._check_all()
+        
+        # CHECK: adding them again restores the original matrices
+        with self.kg.bulk_update():
+            for t in triples:
+                self.kg.triples.add(t)
+        self._check_all()
+    
+    def test_coo(self):
+        # CHECK: all matrices are built correctly
+        self._check_all()
+    
+    def test_csr(self):
+        num_individuals = len(self.kg.individuals)
+        self.assertEqual((num_individuals, num_individuals), self.kg.adjacency.shape)
+        
+        for relation in self.kg.relations:
+            for status in st.ALL:
+                for positive in [True, False]:
+                    indptr, indices = self.kg.adjacency.csr(relation.index, status=status, positive=positive)
+                    
+                    # CHECK: the CSR encoding is consistent with the COO encoding
+                    self.assertEqual(num_individuals + 1, len(indptr))
+                    csr_entries = [
+                            (row, col)
+                            for row in range(num_individuals)
+                            for col in indices[indptr[row]:indptr[row + 1]]
+                    ]
+                    self.assertEqual(self._target_coo(relation, status, positive), csr_entries)
+    
+    def test_incremental_updates(self):
+        t = next(iter(self.kg.triples))
+        key = (t.predicate, st.of(t), t.positive)
+        other_keys = [
+                (r, s, p)
+                for r in self.kg.relations
+                for s in st.ALL
+                for p in [True, False]
+                if (r, s, p) != key
+        ]
+        other_matrices = [self.kg.adjacency.coo(r, status=s, positive=p) for r, s, p in other_keys]
+        
+        # CHECK: removing a triple updates the affected matrix only
+        self.kg.triples.discard(t)
+        self.assertEqual(self._target_coo(*key), list(zip(*self.kg.adjacency.coo(key[0], key[1], key[2]))))
+        for (r, s, p), matrix in zip(other_keys, other_matrices):
+            self.assertIs(matrix, self.kg.adjacency.coo(r, status=s, positive=p))
+        
+        # CHECK: adding it again updates the matrix as well
+        self.kg.triples.add(t)
+        self.assertEqual(self._target_coo(*key), list(zip(*self.kg.adjacency.coo(key[0], key[1], key[2]))))
+
+
+if __name__ == "__main__":
+    unittest.main()
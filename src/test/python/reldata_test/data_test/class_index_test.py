@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+import numpy as np
+
+from reldata.data import class_index
+from reldata.data import class_membership
+from reldata.data import data_context as dc
+from reldata.data import individual_factory
+from reldata.data import knowledge_graph
+from reldata.data import status as st
+from reldata.vocab import class_type_factory as ctf
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ClassIndexTest(unittest.TestCase):
+    
+    @dc.new_context
+    def test_maintained_by_knowledge_graph(self):
+        # create test data
+        kg = knowledge_graph.KnowledgeGraph()
+        cls_0 = ctf.ClassTypeFactory.create_class("class-0")
+        cls_1 = ctf.ClassTypeFactory.create_class("class-1")
+        inds = [individual_factory.IndividualFactory.create_individual("individual-{}".format(i)) for i in range(4)]
+        inds[0].classes.add(class_membership.ClassMembership(cls_0, True))
+        kg.individuals.add_all(inds)
+        inds[1].classes.add(class_membership.ClassMembership(cls_0, True))
+        inds[2].classes.add(class_membership.ClassMembership(cls_0, True, inferred=True))
+        inds[2].classes.add(class_membership.ClassMembership(cls_1, True))
+        inds[3].classes.add(class_membership.ClassMembership(cls_1, False, prediction=True))
+        
+        # CHECK: memberships that existed before and that were added after registering an individual are indexed
+        self.assertEqual(2, kg.class_index.count(cls_0, status=st.FACT))
+        self.assertEqual(3, kg.class_index.count(cls_0))
+        self.assertEqual(1, kg.class_index.count(cls_1, is_member=False, status=st.PREDICTION))
+        self.assertEqual([0, 1, 2], kg.class_index.individuals(cls_0).tolist())
+        self.assertEqual([0, 1], kg.class_index.individuals(cls_0, status=st.FACT).tolist())
+        self.assertEqual(
+                [True, True, True, False],
+                kg.class_index.mask(cls_0, status=[st.FACT, st.INFERRED]).tolist()
+        )
+        self.assertEqual([False] * 4, kg.class_index.mask(cls_0, status=st.PREDICTION).tolist())
+        
+        # CHECK: set algebra across classes works as expected
+        self.assertEqual([0, 1], kg.class_index.difference(cls_0, [cls_1]).tolist())
+        self.assertEqual([2], kg.class_index.intersection([cls_0, cls_1]).tolist())
+        self.assertEqual([0, 1, 2], kg.class_index.union([0, 1]).tolist())
+        
+        # CHECK: removed memberships and individuals are removed from the index
+        inds[1].classes.discard(class_membership.ClassMembership(cls_0, True))
+        kg.individuals.discard(inds[2])
+        self.assertEqual([0], kg.class_index.individuals(cls_0).tolist())
+        self.assertEqual(0, kg.class_index.count(cls_1))
+    
+    def test_to_indices(self):
+        mask = np.zeros(71, dtype=bool)
+        mask[[0, 3, 8, 70]] = True
+        
+        # CHECK: masks are converted correctly
+        self.assertEqual([], class_index.ClassIndex.to_indices(np.zeros(5, dtype=bool)).tolist())
+        self.assertEqual([0, 3, 8, 70], class_index.ClassIndex.to_indices(mask).tolist())
+        self.assertEqual(np.int64, class_index.ClassIndex.to_indices(mask).dtype)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 
+import asyncio
 import threading
 import unittest
 
@@ -45,6 +46,28 @@ __status__ = "Development"
 
 class DataContextTest(unittest.TestCase):
     
+    def test_asyncio_support(self):
+        # this coroutine creates a few individuals in a fresh context, and yields control in between
+        async def create_individuals(name: str) -> list:
+            with dc.DataContext():
+                inds = []
+                for i in range(3):
+                    inds.append(individual_factory.IndividualFactory.create_individual("{}-{}".format(name, i)))
+                    await asyncio.sleep(0)
+                return inds
+        
+        # this runs several of the coroutines concurrently
+        async def run_all() -> list:
+            return await asyncio.gather(*[create_individuals("individual") for _ in range(3)])
+        
+        with dc.DataContext() as outer_ctx:
+            results = asyncio.run(run_all())
+            
+            # CHECK: every task used a context of its own, and the outer context is still active
+            for inds in results:
+                self.assertEqual([0, 1, 2], [ind.index for ind in inds])
+            self.assertIs(outer_ctx, dc.DataContext.get_context())
+    
     def test_clear(self):
         ctx = dc.DataContext.get_context()
         ctx["data-context-test.test-item"] = 666
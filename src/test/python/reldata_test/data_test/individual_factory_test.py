@@ -102,6 +102,30 @@ class IndividualFactoryTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             factory.create_individual("ind", target_type=int)
 
+    
+    def test_create_individuals(self):
+        factory = individual_factory.IndividualFactory
+        
+        # CHECK: factory assigns consecutive indices, and continues where single creations left off
+        factory.reset()
+        factory.create_individual("ind-0")
+        inds = factory.create_individuals(["ind-1", "ind-2", "ind-3"])
+        self.assertEqual([1, 2, 3], [i.index for i in inds])
+        self.assertEqual(["ind-1", "ind-2", "ind-3"], [i.name for i in inds])
+        self.assertEqual(4, factory.create_individual("ind-4").index)
+        
+        # CHECK: names that have been used before or that appear repeatedly are rejected, and nothing is created then
+        with self.assertRaises(ValueError):
+            factory.create_individuals(["ind-5", "ind-0"])
+        with self.assertRaises(ValueError):
+            factory.create_individuals(["ind-5", "ind-5"])
+        self.assertEqual(5, factory.create_individual("ind-5").index)
+        
+        # CHECK: the factory correctly creates sub-types of Individual
+        factory.reset()
+        my_inds = factory.create_individuals(["a", "b"], target_type=MyIndividual, args=[True])
+        self.assertTrue(all(isinstance(i, MyIndividual) and i.female for i in my_inds))
+        self.assertEqual([0, 1], [i.index for i in my_inds])
 
 class MyIndividual(base_individual.BaseIndividual):
     
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import pickle
+import unittest
+
+from reldata.data import kg_arrays
+from reldata.io import kg_reader
+from reldata.vocab import vocab_registry as vr
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class KgArraysTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+    
+    def test_from_kg(self):
+        arrays = kg_arrays.KgArrays.from_kg(self.kg)
+        
+        # CHECK: the graph is encoded correctly
+        self.assertEqual([i.name for i in self.kg.individuals], arrays.individuals)
+        self.assertEqual([c.name for c in self.kg.classes], arrays.classes)
+        self.assertEqual(self.kg.triple_store.array().tolist(), arrays.triples.tolist())
+        self.assertEqual(
+                sum(len(ind.classes) for ind in self.kg.individuals),
+                len(arrays.memberships)
+        )
+        self.assertEqual(
+                sum(len(ind.literals) for ind in self.kg.individuals),
+                len(arrays.literal_values)
+        )
+    
+    def test_to_kg(self):
+        registry = vr.VocabRegistry()
+        arrays = pickle.loads(pickle.dumps(kg_arrays.KgArrays.from_kg(self.kg)))
+        kg = arrays.to_kg(vocab_registry=registry)
+        
+        # CHECK: the decoded graph is equal to the original one
+        self.assertEqual(self.kg, kg)
+        for ind in self.kg.individuals:
+            self.assertEqual(ind.classes, kg.individuals[ind.index].classes)
+            self.assertEqual(ind.literals, kg.individuals[ind.index].literals)
+        
+        # CHECK: the vocabulary is retrieved from the registry
+        self.assertIs(kg.classes[0], arrays.to_kg(vocab_registry=registry).classes[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+from reldata.data import kg_diff
+from reldata.data import kg_encoding
+from reldata.data import literal_value
+from reldata.io import kg_reader
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class KgDiffTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.seq = kg_reader.KgReader.read_sequence("src/test/resources", "kg-seq")
+    
+    def test_apply(self):
+        for idx in range(1, len(self.seq)):
+            kg = kg_reader.KgReader.read("src/test/resources", "kg-seq", index=0)
+            target_kg = self.seq[idx]
+            
+            # patch the first step
+            kg_diff.KgDiff(self.seq[0], target_kg).apply(kg)
+            
+            # CHECK: the patched graph is equal to the target
+            self.assertEqual(target_kg, kg)
+            self.assertEqual(
+                    sorted(target_kg.triple_store.array().tolist()),
+                    sorted(kg.triple_store.array().tolist())
+            )
+            for ind in target_kg.individuals:
+                self.assertEqual(ind.classes, kg.individuals[ind.index].classes)
+                self.assertEqual(ind.literals, kg.individuals[ind.index].literals)
+            
+            # CHECK: there are no differences left
+            self.assertEqual(0, len(kg_diff.KgDiff(kg, target_kg)))
+    
+    def test_apply_value_types(self):
+        # assign values to the same literal that are equal but have different types
+        kg = kg_reader.KgReader.read("src/test/resources", "kg-seq", index=0)
+        target_kg = kg_reader.KgReader.read("src/test/resources", "kg-seq", index=0)
+        lit = kg.literals[0]
+        kg.individuals[0].literals.add(literal_value.LiteralValue(lit, 1))
+        target_kg.individuals[0].literals.add(literal_value.LiteralValue(lit, 1.0))
+        
+        # CHECK: values that differ in their types only are replaced
+        diff = kg_diff.KgDiff(kg, target_kg)
+        self.assertEqual(2, len(diff))
+        diff.apply(kg)
+        values = [l.value for l in kg.individuals[0].literals if l.literal == lit]
+        self.assertEqual([float], list(map(type, values)))
+    
+    def test_apply_to_individuals(self):
+        kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+        target_kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+        
+        # change memberships and literal values of the target
+        for ind in target_kg.individuals:
+            if ind.classes:
+                ind.classes.discard(next(iter(ind.classes)))
+            if ind.literals:
+                lit = next(iter(ind.literals))
+                ind.literals.discard(lit)
+                ind.literals.add(literal_value.LiteralValue(lit.literal, "changed-" + str(lit.value)))
+        
+        # patch the original graph
+        diff = kg_diff.KgDiff(kg, target_kg)
+        diff.apply(kg)
+        
+        # CHECK: the patched graph is equal to the target
+        self.assertLess(0, len(diff.removed_memberships))
+        self.assertLess(0, len(diff.added_literal_values))
+        for ind in target_kg.individuals:
+            self.assertEqual(ind.classes, kg.individuals[ind.index].classes)
+            self.assertEqual(ind.literals, kg.individuals[ind.index].literals)
+        self.assertEqual(target_kg.memberships.matrices().tolist(), kg.memberships.matrices().tolist())
+    
+    def test_init(self):
+        old_kg, new_kg = self.seq[0], self.seq[1]
+        diff = kg_diff.KgDiff(old_kg, new_kg)
+        
+        # CHECK: the differences are computed correctly
+        old_triples = set(map(tuple, old_kg.triple_store.array().tolist()))
+        new_triples = set(map(tuple, new_kg.triple_store.array().tolist()))
+        self.assertEqual(sorted(old_triples - new_triples), list(map(tuple, diff.removed_triples.tolist())))
+        self.assertEqual(sorted(new_triples - old_triples), list(map(tuple, diff.added_triples.tolist())))
+        old_memberships = set(map(tuple, kg_encoding.encode_memberships(old_kg).tolist()))
+        new_memberships = set(map(tuple, kg_encoding.encode_memberships(new_kg).tolist()))
+        self.assertEqual(sorted(old_memberships - new_memberships), list(map(tuple, diff.removed_memberships.tolist())))
+        self.assertEqual(sorted(new_memberships - old_memberships), list(map(tuple, diff.added_memberships.tolist())))
+        old_literals = set(kg_encoding.encode_literal_values(old_kg))
+        new_literals = set(kg_encoding.encode_literal_values(new_kg))
+        self.assertEqual(old_literals - new_literals, set(diff.removed_literal_values))
+        self.assertEqual(new_literals - old_literals, set(diff.added_literal_values))
+        
+        # CHECK: a graph does not differ from itself
+        self.assertEqual(0, len(kg_diff.KgDiff(old_kg, old_kg)))
+        
+        # CHECK: graphs with different vocabularies are rejected
+        with self.assertRaises(ValueError):
+            kg_diff.KgDiff(old_kg, kg_reader.KgReader.read("src/test/resources", "test-kg"))
+
+
+if __name__ == "__main__":
+    unittest.main()
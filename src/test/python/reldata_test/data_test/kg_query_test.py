@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+
+import itertools
+import unittest
+
+import numpy as np
+
+from reldata.data import class_membership
+from reldata.data import data_context as dc
+from reldata.data import individual_factory
+from reldata.data import kg_query
+from reldata.data import knowledge_graph
+from reldata.data import literal_value
+from reldata.data import triple
+from reldata.vocab import class_type_factory as ctf
+from reldata.vocab import literal_type_factory as ltf
+from reldata.vocab import relation_type_factory as rtf
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class KgQueryTest(unittest.TestCase):
+    
+    @dc.new_context
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.kg = knowledge_graph.KnowledgeGraph()
+        self.city = ctf.ClassTypeFactory.create_class("City")
+        self.works_for, self.located_in, self.knows = rtf.RelationTypeFactory.create_relations(
+                ["worksFor", "locatedIn", "knows"]
+        )
+        self.age = ltf.LiteralTypeFactory.create_literal("age")
+        self.inds = individual_factory.IndividualFactory.create_individuals(
+                ["individual-{}".format(i) for i in range(30)]
+        )
+        
+        # add random memberships, literal values, and triples
+        for ind in self.inds:
+            if rng.random_sample() < 0.3:
+                ind.classes.add(class_membership.ClassMembership(self.city, True))
+            ind.literals.add(literal_value.LiteralValue(self.age, str(rng.randint(20, 60))))
+        self.kg.individuals.add_all(self.inds)
+        self.kg.triples.add_all(
+                triple.Triple(self.inds[s], rel, self.inds[o], rng.random_sample() < 0.9)
+                for rel, num_triples in [(self.works_for, 60), (self.located_in, 25), (self.knows, 80)]
+                for s, o in zip(rng.randint(0, 30, size=num_triples), rng.randint(0, 30, size=num_triples))
+        )
+    
+    def _holds(self, s, rel, o):
+        return triple.Triple(self.inds[s], rel, self.inds[o], True) in self.kg.triples
+    
+    def _is_city(self, i):
+        return class_membership.ClassMembership(self.city, True) in self.inds[i].classes
+    
+    def _age(self, i):
+        return int(next(iter(self.inds[i].literals)).value)
+    
+    @staticmethod
+    def _rows(results, variables):
+        return sorted(zip(*[results[v].tolist() for v in variables]))
+    
+    def test_execute(self):
+        results = (
+                kg_query.KgQuery(self.kg)
+                .triple("?x", "worksFor", "?y")
+                .triple("?y", self.located_in, "?z")
+                .member("?z", "City")
+                .literal("?x", "age", low=30, high=45)
+                .execute()
+        )
+        expected = sorted(
+                (x, y, z)
+                for x, y, z in itertools.product(range(30), repeat=3)
+                if (
+                        self._holds(x, self.works_for, y) and
+                        self._holds(y, self.located_in, z) and
+                        self._is_city(z) and
+                        30 <= self._age(x) <= 45
+                )
+        )
+        
+        # CHECK: the query is answered correctly
+        self.assertEqual(["?x", "?y", "?z"], list(results))
+        self.assertLess(0, len(expected))
+        self.assertEqual(expected, self._rows(results, ["?x", "?y", "?z"]))
+    
+    def test_execute_constants_and_repeated_variables(self):
+        # CHECK: constants are used as filters
+        results = kg_query.KgQuery(self.kg).triple(self.inds[0], "knows", "?y").triple("?y", "knows", "?z").execute()
+        expected = sorted(
+                (y, z)
+                for y, z in itertools.product(range(30), repeat=2)
+                if self._holds(0, self.knows, y) and self._holds(y, self.knows, z)
+        )
+        self.assertEqual(expected, self._rows(results, ["?y", "?z"]))
+        
+        # CHECK: variables that occur repeatedly in the same pattern have the same binding
+        results = kg_query.KgQuery(self.kg).triple("?x", "knows", "?x").execute()
+        self.assertEqual([x for x in range(30) if self._holds(x, self.knows, x)], sorted(results["?x"].tolist()))
+        
+        # CHECK: patterns without variables act as filters
+        s, o = next((s, o) for s, o in itertools.product(range(30), repeat=2) if self._holds(s, self.knows, o))
+        query = kg_query.KgQuery(self.kg).member("?x", self.city)
+        self.assertEqual(
+                len(query.execute()["?x"]),
+                len(query.triple("individual-{}".format(s), "knows", self.inds[o]).execute()["?x"])
+        )
+        
+        # CHECK: disconnected patterns yield the cross product of their bindings
+        age = self._age(0)
+        results = kg_query.KgQuery(self.kg).member("?x", "City").literal("?y", "age", value=str(age)).execute()
+        cities = [i for i in range(30) if self._is_city(i)]
+        aged = [i for i in range(30) if self._age(i) == age]
+        self.assertEqual(sorted(itertools.product(cities, aged)), self._rows(results, ["?x", "?y"]))
+    
+    def test_explain(self):
+        query = (
+                kg_query.KgQuery(self.kg)
+                .triple("?x", "knows", "?y")
+                .triple("?y", "locatedIn", "?z")
+                .member("?z", "City")
+                .literal("?a", "age")
+        )
+        plan = query.explain()
+        
+        # CHECK: the most selective pattern comes first, and connected patterns precede disconnected ones
+        sizes = [size for _, size in plan]
+        self.assertEqual(4, len(plan))
+        self.assertEqual(min(sizes[:3]), sizes[0])
+        self.assertEqual("?a age [None, None]", plan[-1][0])
+        
+        # CHECK: invalid queries are rejected
+        with self.assertRaises(ValueError):
+            kg_query.KgQuery(self.kg).execute()
+        with self.assertRaises(KeyError):
+            kg_query.KgQuery(self.kg).triple("?x", "foo", "?y")
+        with self.assertRaises(KeyError):
+            kg_query.KgQuery(self.kg).member("foo", "City")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+
+import gc
+import pickle
+import unittest
+
+import numpy as np
+
+from reldata.data import status as st
+from reldata.data import triple
+from reldata.data import triple_store
+from reldata.io import kg_reader
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class KgViewTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+    
+    def _expected(self, status=st.ALL, positive=None, relations=None):
+        return {
+                t
+                for t in self.kg.triples
+                if (
+                        st.of(t) in status and
+                        (positive is None or t.positive == positive) and
+                        (relations is None or t.predicate.index in relations)
+                )
+        }
+    
+    def test_detach(self):
+        num_observers = len(self.kg.triples._observers)
+        views = [self.kg.view(status=[st.FACT]) for _ in range(10)]
+        self.assertEqual(num_observers + 10, len(self.kg.triples._observers))
+        
+        # CHECK: views that are not closed are not pickled together with their graph
+        kg = pickle.loads(pickle.dumps(self.kg))
+        self.assertEqual(len(self.kg.triples), len(kg.triples))
+        self.assertEqual(set(map(str, self.kg.triples)), set(map(str, kg.triples)))
+        self.assertEqual(num_observers, len(kg.triples._observers))
+        kg = pickle.loads(pickle.dumps(kg))
+        self.assertEqual(num_observers, len(kg.triples._observers))
+        
+        # CHECK: closed views are detached from the graph
+        views[0].close()
+        views[0].close()
+        self.assertEqual(num_observers + 9, len(self.kg.triples._observers))
+        
+        # CHECK: views that are not closed are detached when they are garbage collected
+        del views
+        gc.collect()
+        self.assertEqual(num_observers, len(self.kg.triples._observers))
+    
+    def test_individuals(self):
+        cls = self.kg.classes[0]
+        view = self.kg.view(status=[st.FACT, st.INFERRED], positive=True, classes=[cls])
+        expected = np.union1d(
+                self.kg.class_index.individuals(cls, status=st.FACT),
+                self.kg.class_index.individuals(cls, status=st.INFERRED)
+        )
+        
+        # CHECK: individuals are retrieved for the statuses, polarities, and classes of the view
+        self.assertEqual(expected.tolist(), view.individuals(cls).tolist())
+        self.assertEqual([], view.individuals(cls, is_member=False).tolist())
+        self.assertEqual([], view.individuals(self.kg.classes[1]).tolist())
+    
+    def test_literal_column(self):
+        lit = self.kg.literals[0]
+        view = self.kg.view(status=[st.FACT], literals=[lit])
+        
+        # CHECK: columns are retrieved from the literal store of the graph
+        self.assertIs(self.kg.literal_store.column(lit), view.literal_column(lit))
+        
+        # CHECK: literals and statuses that are not part of the view are rejected
+        with self.assertRaises(ValueError):
+            view.literal_column(lit, status=st.INFERRED)
+        with self.assertRaises(ValueError):
+            view.literal_column(self.kg.literals[1])
+    
+    def test_membership_matrix(self):
+        full_matrix = self.kg.memberships.matrix()
+        
+        # CHECK: unrestricted views provide the matrix of the graph
+        matrix = self.kg.view().membership_matrix()
+        self.assertTrue(np.array_equal(full_matrix, matrix))
+        
+        # CHECK: entries that are not part of restricted views are 0
+        matrix = self.kg.view(positive=False, classes=[0, 2]).membership_matrix()
+        expected = np.where(full_matrix == -1, -1, 0)
+        expected[:, 1] = 0
+        self.assertTrue(np.array_equal(expected, matrix))
+        
+        # CHECK: statuses that are not part of the view are rejected
+        with self.assertRaises(ValueError):
+            self.kg.view(status=[st.FACT]).membership_matrix(st.PREDICTION)
+    
+    def test_triples(self):
+        for kwargs in [{}, {"status": [st.FACT], "positive": True}, {"positive": False, "relations": [0, 2]}]:
+            with self.kg.view(**kwargs) as view:
+                expected = self._expected(**kwargs)
+                
+                # CHECK: the view contains the matching triples
+                self.assertEqual(expected, set(view.triples))
+                self.assertEqual(len(expected), len(view))
+                self.assertEqual(
+                        {triple_store.TripleStore.encode(t) for t in expected},
+                        set(map(tuple, view.triple_array().tolist()))
+                )
+    
+    def test_triples_live(self):
+        view = self.kg.view(status=[st.FACT], positive=True)
+        subject, obj = self.kg.individuals[0], self.kg.individuals[1]
+        new_fact = triple.Triple(subject, self.kg.relations[0], obj, True)
+        new_negative = triple.Triple(subject, self.kg.relations[0], obj, False)
+        self.assertNotIn(new_fact, self.kg.triples)
+        num_triples = len(view.triple_array())
+        
+        # CHECK: added triples are reflected if they match
+        self.kg.triples.add(new_fact)
+        with self.kg.bulk_update():
+            self.kg.triples.add(new_negative)
+        self.assertIn(new_fact, view)
+        self.assertNotIn(new_negative, view)
+        self.assertEqual(num_triples + 1, len(view.triple_array()))
+        self.assertEqual(self._expected(status=[st.FACT], positive=True), set(view.triples))
+        
+        # CHECK: removed triples are reflected
+        self.kg.triples.discard(new_fact)
+        self.assertNotIn(new_fact, view)
+        self.assertEqual(num_triples, len(view.triple_array()))
+        
+        # CHECK: closed views are not updated anymore
+        view.close()
+        self.kg.triples.add(new_fact)
+        self.assertNotIn(new_fact, view)
+
+
+if __name__ == "__main__":
+    unittest.main()
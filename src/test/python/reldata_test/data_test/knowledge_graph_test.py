@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 
+import pickle
 import unittest
 
 import reldata
@@ -132,6 +133,28 @@ class KnowledgeGraphTest(unittest.TestCase):
         target_literals = ordered_set.OrderedSet(literal_type.LiteralType, lambda x: x.index, data=[self.lit_0])
         self.assertEqual(target_literals, kg.literals)
     
+    @dc.new_context
+    def test_bulk_update(self):
+        # create test data
+        kg = knowledge_graph.KnowledgeGraph()
+        rel = rtf.RelationTypeFactory.create_relation("relation-0")
+        inds = [individual_factory.IndividualFactory.create_individual("individual-{}".format(i)) for i in range(3)]
+        inds[2].classes.add(class_membership.ClassMembership(self.cls_0, True))
+        
+        with kg.bulk_update():
+            kg.triples.add(triple.Triple(inds[0], rel, inds[1], True))
+            kg.triples.add(triple.Triple(inds[1], rel, inds[2], False))
+            
+            # CHECK: the triples were stored, but have not been registered yet
+            self.assertEqual(2, len(kg.triples))
+            self.assertEqual(0, len(kg.individuals))
+        
+        # CHECK: all of the individuals and vocabulary were registered when the context was left
+        self.assertEqual(inds, list(kg.individuals))
+        self.assertEqual([rel], list(kg.relations))
+        self.assertEqual([self.cls_0], list(kg.classes))
+        self.assertEqual([2], kg.class_index.individuals(self.cls_0).tolist())
+    
     @dc.new_context
     def test_modifying_individuals(self):
         # create test data
@@ -150,6 +173,30 @@ class KnowledgeGraphTest(unittest.TestCase):
         # CHECK: new literals are registered if an individual is changed
         ind.literals.add(literal_value.LiteralValue(lit, 666, False))
         self.assertTrue(lit in kg.literals)
+    
+    @dc.new_context
+    def test_pickling(self):
+        # create test data
+        kg = knowledge_graph.KnowledgeGraph()
+        cls = ctf.ClassTypeFactory.create_class("class-0")
+        ind_0 = individual_factory.IndividualFactory.create_individual("individual-0")
+        ind_1 = individual_factory.IndividualFactory.create_individual("individual-1")
+        kg.triples.add(triple.Triple(ind_0, rtf.RelationTypeFactory.create_relation("relation-0"), ind_1, True))
+        
+        # pickle and unpickle the knowledge graph
+        kg = pickle.loads(pickle.dumps(kg))
+        ind_0 = kg.individuals[0]
+        
+        # CHECK: the unpickled graph is still notified about changes of its individuals
+        ind_0.classes.add(class_membership.ClassMembership(cls, True))
+        self.assertTrue(cls in kg.classes)
+        self.assertEqual([0], kg.class_index.individuals(cls).tolist())
+        
+        # CHECK: removed individuals are not observed anymore
+        kg.individuals.discard(ind_0)
+        ind_0.classes.discard(class_membership.ClassMembership(cls, True))
+        ind_0.classes.add(class_membership.ClassMembership(cls, True))
+        self.assertEqual(0, kg.class_index.count(cls))
 
 
 if __name__ == "__main__":
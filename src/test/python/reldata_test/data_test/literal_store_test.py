@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+import numpy as np
+
+from reldata.data import data_context as dc
+from reldata.data import individual_factory
+from reldata.data import knowledge_graph
+from reldata.data import literal_store
+from reldata.data import literal_value
+from reldata.data import status as st
+from reldata.vocab import literal_type_factory as ltf
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class LiteralStoreTest(unittest.TestCase):
+    
+    @dc.new_context
+    def setUp(self):
+        self.kg = knowledge_graph.KnowledgeGraph()
+        self.age = ltf.LiteralTypeFactory.create_literal("age")
+        self.name = ltf.LiteralTypeFactory.create_literal("name")
+        self.inds = [
+                individual_factory.IndividualFactory.create_individual("individual-{}".format(i)) for i in range(4)
+        ]
+        for ind, age in zip(self.inds, ["35", "42", "31", "40"]):
+            ind.literals.add(literal_value.LiteralValue(self.age, age))
+            ind.literals.add(literal_value.LiteralValue(self.name, ind.name))
+        self.inds[0].literals.add(literal_value.LiteralValue(self.age, "1.5", inferred=True))
+        self.kg.individuals.add_all(self.inds)
+    
+    def test_colliding_values(self):
+        ind = self.inds[2]
+        num_values = len(self.kg.literal_store)
+        
+        # CHECK: values that are equal but distinct elements of an individual's literals are stored separately
+        ind.literals.add(literal_value.LiteralValue(self.age, 1))
+        ind.literals.add(literal_value.LiteralValue(self.age, 1.0))
+        self.assertEqual(num_values + 2, len(self.kg.literal_store))
+        ind.literals.discard(literal_value.LiteralValue(self.age, 1.0))
+        self.assertEqual(num_values + 1, len(self.kg.literal_store))
+        self.assertEqual([0, 1, 2, 3, 2], self.kg.literal_store.column(self.age).individuals.tolist())
+        self.assertEqual([35, 42, 31, 40, 1], self.kg.literal_store.column(self.age).values.tolist())
+        
+        # CHECK: values that are not hashable themselves are accepted
+        ind.literals.add(literal_value.LiteralValue(self.name, ["a", "b"]))
+        self.assertEqual(num_values + 2, len(self.kg.literal_store))
+    
+    def test_column(self):
+        ages = self.kg.literal_store.column(self.age)
+        names = self.kg.literal_store.column(self.name.index)
+        
+        # CHECK: the values are stored with the according types
+        self.assertEqual([0, 1, 2, 3], ages.individuals.tolist())
+        self.assertEqual(np.int64, ages.dtype)
+        self.assertTrue(ages.is_numeric)
+        self.assertEqual([35, 42, 31, 40], ages.values.tolist())
+        self.assertFalse(names.is_numeric)
+        self.assertEqual([ind.name for ind in self.inds], names.values.tolist())
+        self.assertEqual([1.5], self.kg.literal_store.column(self.age, status=st.INFERRED).values.tolist())
+        self.assertEqual(0, len(self.kg.literal_store.column(self.age, status=st.PREDICTION)))
+        
+        # CHECK: columns are updated when values are added or removed
+        self.inds[1].literals.discard(literal_value.LiteralValue(self.age, "42"))
+        self.inds[1].literals.add(literal_value.LiteralValue(self.age, "42.5"))
+        ages = self.kg.literal_store.column(self.age)
+        self.assertEqual(np.float64, ages.dtype)
+        self.assertEqual([0, 2, 3, 1], ages.individuals.tolist())
+        self.kg.individuals.discard(self.inds[0])
+        self.assertEqual([2, 3, 1], self.kg.literal_store.column(self.age).individuals.tolist())
+    
+    def test_convert(self):
+        # CHECK: the most specific type is inferred
+        self.assertEqual(np.bool_, literal_store.LiteralColumn.convert(["true", "False"]).dtype)
+        self.assertEqual(np.int64, literal_store.LiteralColumn.convert(["1", "-2"]).dtype)
+        self.assertEqual(np.float64, literal_store.LiteralColumn.convert(["1", "2.5"]).dtype)
+        self.assertEqual(np.float64, literal_store.LiteralColumn.convert([1.5, 2]).dtype)
+        self.assertEqual(["1", "x"], literal_store.LiteralColumn.convert([1, "x"]).tolist())
+    
+    def test_range(self):
+        ages = self.kg.literal_store.column(self.age)
+        
+        # CHECK: range queries are answered correctly
+        self.assertEqual([2, 0, 3], ages.range(30, 40).tolist())
+        self.assertEqual([3, 1], ages.range(low=40).tolist())
+        self.assertEqual([2], ages.range(high=34).tolist())
+        self.assertEqual([], ages.range(50, 60).tolist())
+        self.assertEqual([1, 2], self.kg.literal_store.column(self.name).range("individual-1", "individual-2").tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+import numpy as np
+
+from reldata.data import class_membership
+from reldata.data import data_context as dc
+from reldata.data import individual_factory
+from reldata.data import knowledge_graph
+from reldata.data import membership_store
+from reldata.data import status as st
+from reldata.vocab import class_type_factory as ctf
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class MembershipStoreTest(unittest.TestCase):
+    
+    def test_extend(self):
+        store = membership_store.MembershipStore()
+        
+        # CHECK: the matrices grow beyond their initial capacity, and stored values are preserved
+        store.extend(num_individuals=2, num_classes=3)
+        self.assertEqual((2, 3), store.shape)
+        store.extend(num_individuals=100, num_classes=1)
+        self.assertEqual((100, 3), store.shape)
+        self.assertEqual((3, 100, 3), store.matrices().shape)
+        self.assertEqual(np.int8, store.matrices().dtype)
+        
+        # CHECK: the matrices are stored with two bits per cell
+        store.extend(num_individuals=1000, num_classes=1000)
+        self.assertEqual(3 * 2 * 1000 * 125, store.nbytes)
+        
+        # CHECK: the returned views cannot be modified
+        with self.assertRaises(ValueError):
+            store.matrix()[0, 0] = 1
+    
+    @dc.new_context
+    def test_maintained_by_knowledge_graph(self):
+        # create test data
+        kg = knowledge_graph.KnowledgeGraph()
+        cls_0 = ctf.ClassTypeFactory.create_class("class-0")
+        cls_1 = ctf.ClassTypeFactory.create_class("class-1")
+        inds = [individual_factory.IndividualFactory.create_individual("individual-{}".format(i)) for i in range(3)]
+        inds[0].classes.add(class_membership.ClassMembership(cls_0, True))
+        kg.individuals.add_all(inds)
+        inds[1].classes.add(class_membership.ClassMembership(cls_1, False))
+        inds[2].classes.add(class_membership.ClassMembership(cls_0, True, inferred=True))
+        inds[2].classes.add(class_membership.ClassMembership(cls_1, True, prediction=True))
+        
+        # CHECK: memberships that existed before and that were added after registering an individual are stored
+        self.assertEqual((3, 2), kg.memberships.shape)
+        self.assertEqual([[1, 0], [0, -1], [0, 0]], kg.memberships.matrix().tolist())
+        self.assertEqual([0, 0, 1], kg.memberships.column(cls_0, status=st.INFERRED).tolist())
+        self.assertEqual([0, 1], kg.memberships.row(2, status=st.PREDICTION).tolist())
+        self.assertEqual(1, kg.memberships.get(0, cls_0))
+        self.assertEqual(-1, kg.memberships.get(1, 1))
+        self.assertEqual(0, kg.memberships.get(2, cls_0))
+        self.assertEqual(1, kg.memberships.count(cls_0))
+        self.assertEqual(1, kg.memberships.count(cls_1, is_member=False))
+        self.assertEqual(0, kg.memberships.count(cls_1))
+        self.assertEqual(1, kg.memberships.count(cls_1, status=st.PREDICTION))
+        
+        # CHECK: removed memberships and individuals are removed from the store
+        inds[1].classes.discard(class_membership.ClassMembership(cls_1, False))
+        kg.individuals.discard(inds[2])
+        self.assertEqual(0, kg.memberships.get(1, cls_1))
+        self.assertFalse(kg.memberships.matrices()[:, 2].any())
+        self.assertEqual(1, kg.memberships.get(0, cls_0))
+        
+        # CHECK: the counts are updated as well
+        for status in st.ALL:
+            for cls in [cls_0, cls_1]:
+                for is_member, value in [(True, 1), (False, -1)]:
+                    self.assertEqual(
+                            np.count_nonzero(kg.memberships.column(cls, status=status) == value),
+                            kg.memberships.count(cls, is_member=is_member, status=status)
+                    )
+    
+    @dc.new_context
+    def test_packed_matrix(self):
+        # create test data
+        kg = knowledge_graph.KnowledgeGraph()
+        classes = [ctf.ClassTypeFactory.create_class("class-{}".format(i)) for i in range(11)]
+        inds = [individual_factory.IndividualFactory.create_individual("individual-{}".format(i)) for i in range(3)]
+        inds[0].classes.add(class_membership.ClassMembership(classes[0], True))
+        inds[1].classes.add(class_membership.ClassMembership(classes[9], False))
+        kg.individuals.add_all(inds)
+        kg.classes.add_all(classes)
+        
+        # CHECK: the packed matrix encodes the original one
+        positive, negative = kg.memberships.packed_matrix()
+        self.assertEqual((3, 2), positive.shape)
+        self.assertEqual(np.uint8, positive.dtype)
+        self.assertEqual(
+                kg.memberships.matrix().tolist(),
+                kg.memberships.unpack_matrix(positive, negative, 11).tolist()
+        )
+        
+        # CHECK: the packed matrix is updated incrementally
+        inds[2].classes.add(class_membership.ClassMembership(classes[10], True))
+        inds[0].classes.discard(class_membership.ClassMembership(classes[0], True))
+        inds[1].classes.add(class_membership.ClassMembership(classes[9], True))
+        self.assertIs(positive.base, kg.memberships.packed_matrix()[0].base)
+        self.assertEqual(
+                kg.memberships.matrix().tolist(),
+                kg.memberships.unpack_matrix(*kg.memberships.packed_matrix(), 11).tolist()
+        )
+        self.assertEqual(
+                kg.memberships.matrix(st.INFERRED).tolist(),
+                kg.memberships.unpack_matrix(*kg.memberships.packed_matrix(st.INFERRED), 11).tolist()
+        )
+        
+        # CHECK: the returned views cannot be modified
+        with self.assertRaises(ValueError):
+            positive[0, 0] = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+import numpy as np
+
+from reldata.data import kg_arrays
+from reldata.data import knowledge_graph
+from reldata.data import status as st
+from reldata.data import subgraph_extractor
+from reldata.io import kg_reader
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SubgraphExtractorTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+        self.extractor = subgraph_extractor.SubgraphExtractor(self.kg)
+    
+    def _neighborhood(self, seeds, num_hops):
+        edges = [
+                (t.subject.index, t.object.index)
+                for t in self.kg.triples
+                if t.positive and not t.inferred and not t.prediction
+        ]
+        reached = set(seeds)
+        frontier = set(seeds)
+        for _ in range(num_hops):
+            frontier = {o for s, o in edges if s in frontier} | {s for s, o in edges if o in frontier}
+            frontier -= reached
+            reached |= frontier
+        return reached
+    
+    def test_extract(self):
+        for seeds, num_hops in [([0], 0), ([0], 1), ([2, 0], 2), ([1], 5)]:
+            subgraph, individual_ids = self.extractor.extract(seeds, num_hops=num_hops)
+            ids = individual_ids.tolist()
+            
+            # CHECK: the individuals of the neighborhood are extracted, and the seeds come first
+            self.assertIsInstance(subgraph, kg_arrays.KgArrays)
+            self.assertEqual(self._neighborhood(seeds, num_hops), set(ids))
+            self.assertEqual(len(ids), len(set(ids)))
+            self.assertEqual(seeds, ids[:len(seeds)])
+            self.assertEqual([self.kg.individuals[i].name for i in ids], subgraph.individuals)
+            
+            # CHECK: the subgraph contains all triples among the extracted individuals
+            expected = {
+                    (
+                            ids.index(t.subject.index),
+                            t.predicate.index,
+                            ids.index(t.object.index),
+                            int(t.positive),
+                            st.of(t)
+                    )
+                    for t in self.kg.triples
+                    if t.subject.index in ids and t.object.index in ids
+            }
+            self.assertEqual(expected, set(map(tuple, subgraph.triples.tolist())))
+            
+            # CHECK: memberships and literal values are re-indexed
+            for local, original in enumerate(ids):
+                ind = self.kg.individuals[original]
+                self.assertEqual(
+                        {(c.cls.index, 1 if c.is_member else -1, st.of(c)) for c in ind.classes},
+                        {tuple(row[1:]) for row in subgraph.memberships.tolist() if row[0] == local}
+                )
+                self.assertEqual(
+                        {(l.literal.index, l.value, st.of(l)) for l in ind.literals},
+                        {v[1:] for v in subgraph.literal_values if v[0] == local}
+                )
+        
+        # CHECK: subgraphs can be decoded into knowledge graphs
+        kg, individual_ids = self.extractor.extract([0], num_hops=1, as_kg=True)
+        self.assertIsInstance(kg, knowledge_graph.KnowledgeGraph)
+        self.assertEqual(len(individual_ids), len(kg.individuals))
+        
+        # CHECK: invalid args are rejected
+        with self.assertRaises(ValueError):
+            self.extractor.extract([len(self.kg.individuals)])
+        with self.assertRaises(ValueError):
+            self.extractor.extract([0], num_hops=-1)
+    
+    def test_extract_directed(self):
+        extractor = subgraph_extractor.SubgraphExtractor(self.kg, directed=True)
+        subgraph, individual_ids = extractor.extract([0], num_hops=1)
+        expected = {0} | {
+                t.object.index
+                for t in self.kg.triples
+                if t.subject.index == 0 and t.positive and not t.inferred and not t.prediction
+        }
+        
+        # CHECK: only outgoing triples are traversed
+        self.assertEqual(expected, set(individual_ids.tolist()))
+        self.assertTrue(np.all(individual_ids >= 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+from reldata.data import literal_value
+from reldata.data import status as st
+from reldata.data import temporal_knowledge_graph as tkg
+from reldata.io import kg_reader
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class TemporalKnowledgeGraphTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.seq = kg_reader.KgReader.read_sequence("src/test/resources", "kg-seq")
+        self.temporal_kg = tkg.TemporalKnowledgeGraph(self.seq)
+    
+    def test_materialize(self):
+        for idx, kg in enumerate(self.seq):
+            step_kg = self.temporal_kg.materialize(idx)
+            
+            # CHECK: the materialized step is equal to the original one
+            self.assertEqual(kg, step_kg)
+            for ind in kg.individuals:
+                self.assertEqual(ind.classes, step_kg.individuals[ind.index].classes)
+                self.assertEqual(ind.literals, step_kg.individuals[ind.index].literals)
+    
+    def test_materialize_value_types(self):
+        # assign values to the same literal that are equal but have different types in each step
+        lit = self.seq[0].literals[0]
+        for kg, value in zip(self.seq, [1, 1.0, True]):
+            kg.individuals[0].literals.add(literal_value.LiteralValue(lit, value))
+        temporal_kg = tkg.TemporalKnowledgeGraph(self.seq)
+        
+        # CHECK: the values keep their types
+        for idx, value_type in enumerate([int, float, bool]):
+            step_ind = temporal_kg.materialize(idx).individuals[0]
+            values = [l.value for l in step_ind.literals if l.literal == lit]
+            self.assertEqual([value_type], list(map(type, values)))
+    
+    def test_step(self):
+        # CHECK: every distinct triple is stored exactly once
+        distinct_triples = set()
+        for kg in self.seq:
+            distinct_triples |= set(map(tuple, kg.triple_store.array().tolist()))
+        self.assertEqual(len(distinct_triples), len(self.temporal_kg.triples))
+        
+        for idx, kg in enumerate(self.seq):
+            step = self.temporal_kg.step(idx)
+            
+            # CHECK: the views provide the data of the according steps
+            self.assertEqual(
+                    sorted(kg.triple_store.array().tolist()),
+                    sorted(step.triples().tolist())
+            )
+            for status in st.ALL:
+                self.assertEqual(kg.memberships.matrix(status).tolist(), step.membership_matrix(status).tolist())
+        
+        # CHECK: steps out of range are rejected
+        with self.assertRaises(IndexError):
+            self.temporal_kg.step(len(self.seq))
+    
+    def test_steps_of_triple(self):
+        # CHECK: the steps that a triple holds in are retrieved correctly
+        for t in self.seq[0].triples:
+            target = [idx for idx, kg in enumerate(self.seq) if t in kg.triple_store]
+            self.assertEqual(target, self.temporal_kg.steps_of_triple(t).tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import itertools
+import unittest
+
+import numpy as np
+
+from reldata.data import status as st
+from reldata.data import triple_index
+from reldata.io import kg_reader
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class TripleIndexTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+    
+    def test_contains(self):
+        index = triple_index.TripleIndex.from_kg(self.kg)
+        targets = {
+                (t.subject.index, t.predicate.index, t.object.index)
+                for t in self.kg.triples
+                if t.positive and not t.prediction
+        }
+        
+        # CHECK: all possible triples are checked correctly
+        num_individuals = len(self.kg.individuals)
+        all_triples = np.array(
+                list(
+                        itertools.product(
+                                range(num_individuals + 1),
+                                range(len(self.kg.relations)),
+                                range(num_individuals)
+                        )
+                )
+        )
+        mask = index.contains(all_triples[:, 0], all_triples[:, 1], all_triples[:, 2])
+        self.assertEqual(len(targets), len(index))
+        self.assertEqual(targets, set(map(tuple, all_triples[mask].tolist())))
+        
+        # CHECK: args are broadcast
+        s, p, o = next(iter(targets))
+        self.assertEqual((1, num_individuals), index.contains(s, p, np.arange(num_individuals)[np.newaxis]).shape)
+        self.assertIn((s, p, o), index)
+        self.assertNotIn((s, p, num_individuals), index)
+        self.assertNotIn((-1, p, o), index)
+        
+        # CHECK: other selections of triples are supported
+        index = triple_index.TripleIndex.from_kg(self.kg, status=[st.PREDICTION], positive=False)
+        self.assertEqual(
+                sum(1 for t in self.kg.triples if not t.positive and t.prediction),
+                len(index)
+        )
+        self.assertFalse(triple_index.TripleIndex(np.zeros((0, 3))).contains([0, 1], 0, 0).any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+from reldata.data import data_context as dc
+from reldata.data import individual_factory
+from reldata.data import knowledge_graph
+from reldata.data import status as st
+from reldata.data import triple
+from reldata.data import triple_store
+from reldata.vocab import relation_type_factory as rtf
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class TripleStoreTest(unittest.TestCase):
+    
+    @dc.new_context
+    def test_maintained_by_knowledge_graph(self):
+        # create test data
+        kg = knowledge_graph.KnowledgeGraph()
+        rel = rtf.RelationTypeFactory.create_relation("relation-0")
+        inds = individual_factory.IndividualFactory.create_individuals(["individual-{}".format(i) for i in range(3)])
+        t_0 = triple.Triple(inds[0], rel, inds[1], True)
+        t_1 = triple.Triple(inds[1], rel, inds[2], False, inferred=True)
+        t_2 = triple.Triple(inds[2], rel, inds[0], True, prediction=True)
+        kg.triples.add(t_0)
+        kg.triples.add_all([t_1, t_2, t_0])
+        
+        # CHECK: all triples are encoded correctly in the order that they were added in
+        self.assertEqual(3, len(kg.triple_store))
+        self.assertEqual(
+                [[0, 0, 1, 1, st.FACT], [1, 0, 2, 0, st.INFERRED], [2, 0, 0, 1, st.PREDICTION]],
+                kg.triple_store.array().tolist()
+        )
+        self.assertEqual([0, 1, 2], kg.triple_store.subjects.tolist())
+        self.assertEqual([1, 0, 1], kg.triple_store.positive.tolist())
+        self.assertIn(t_1, kg.triple_store)
+        
+        # CHECK: removing a triple moves the last one into its place
+        kg.triples.discard(t_0)
+        self.assertEqual([[2, 0, 0, 1, st.PREDICTION], [1, 0, 2, 0, st.INFERRED]], kg.triple_store.array().tolist())
+        self.assertNotIn(t_0, kg.triple_store)
+        kg.triples.discard(t_1)
+        self.assertEqual([[2, 0, 0, 1, st.PREDICTION]], kg.triple_store.array().tolist())
+    
+    @dc.new_context
+    def test_reserve(self):
+        store = triple_store.TripleStore()
+        rel = rtf.RelationTypeFactory.create_relation("relation-0")
+        inds = individual_factory.IndividualFactory.create_individuals(["individual-{}".format(i) for i in range(300)])
+        
+        # CHECK: the store grows beyond its initial capacity
+        store.add_all(triple.Triple(inds[i], rel, inds[i + 1], True) for i in range(299))
+        self.assertEqual(299, len(store))
+        self.assertEqual(list(range(1, 300)), store.objects.tolist())
+        
+        # CHECK: the returned views cannot be modified
+        with self.assertRaises(ValueError):
+            store.subjects[0] = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
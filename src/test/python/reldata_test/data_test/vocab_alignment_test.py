@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+import numpy as np
+
+from reldata.data import class_membership
+from reldata.data import data_context as dc
+from reldata.data import individual_factory
+from reldata.data import knowledge_graph
+from reldata.data import triple
+from reldata.data import vocab_alignment
+from reldata.vocab import class_type_factory as ctf
+from reldata.vocab import relation_type_factory as rtf
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class VocabAlignmentTest(unittest.TestCase):
+    
+    @staticmethod
+    @dc.new_context
+    def _create_kg(class_names, relation_names) -> knowledge_graph.KnowledgeGraph:
+        kg = knowledge_graph.KnowledgeGraph()
+        kg.classes.add_all(ctf.ClassTypeFactory.create_classes(class_names))
+        kg.relations.add_all(rtf.RelationTypeFactory.create_relations(relation_names))
+        inds = individual_factory.IndividualFactory.create_individuals(["individual-0", "individual-1"])
+        inds[0].classes.add(class_membership.ClassMembership(kg.classes[0], True))
+        inds[1].classes.add(class_membership.ClassMembership(kg.classes[1], False))
+        kg.individuals.add_all(inds)
+        kg.triples.add(triple.Triple(inds[0], kg.relations[0], inds[1], True))
+        kg.triples.add(triple.Triple(inds[1], kg.relations[1], inds[0], True))
+        return kg
+    
+    def test_remap(self):
+        kg_0 = self._create_kg(["a", "b"], ["r", "s"])
+        kg_1 = self._create_kg(["c", "a"], ["s", "r"])
+        alignment = vocab_alignment.VocabAlignment([kg_0, kg_1])
+        
+        # CHECK: the global vocabulary contains all names in the order that they were encountered in
+        self.assertEqual(["a", "b", "c"], alignment.classes)
+        self.assertEqual(["r", "s"], alignment.relations)
+        
+        # CHECK: the remap tables map local to global indices
+        self.assertEqual([0, 1], alignment.class_table(kg_0).tolist())
+        self.assertEqual([2, 0], alignment.class_table(kg_1).tolist())
+        self.assertEqual([1, 0], alignment.relation_table(kg_1).tolist())
+        
+        # CHECK: triples and memberships are re-encoded correctly
+        self.assertEqual([[0, 1, 1, 1, 0], [1, 0, 0, 1, 0]], alignment.remap_triples(kg_1).tolist())
+        self.assertEqual([[0, 0, 1], [-1, 0, 0]], alignment.remap_memberships(kg_1).tolist())
+        self.assertEqual(np.int8, alignment.remap_memberships(kg_0).dtype)
+        
+        # CHECK: graphs that have not been added cannot be remapped
+        with self.assertRaises(ValueError):
+            alignment.class_table(self._create_kg(["d", "a"], ["r", "s"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import tempfile
+import unittest
+
+import numpy as np
+
+from reldata.io import kg_dataset
+from reldata.io import kg_reader
+from reldata.io import kg_writer
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Nov 13, 2017"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class KgDatasetTest(unittest.TestCase):
+    
+    def setUp(self):
+        # store multiple copies of the test graph with different base names
+        self.kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        for idx in range(4):
+            kg_writer.KgWriter.write(self.kg, self.temp_dir.name, "kg-{}".format(idx))
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_getitem(self):
+        dataset = kg_dataset.KgDataset(self.temp_dir.name)
+        
+        # CHECK: all graphs are indexed in order
+        self.assertEqual(4, len(dataset))
+        self.assertEqual([("kg-{}".format(idx), None) for idx in range(4)], dataset.keys)
+        self.assertEqual(self.kg, dataset[0])
+        
+        # CHECK: repeated accesses are answered from the cache
+        self.assertIs(dataset[0], dataset[0])
+        self.assertIs(dataset[-4], dataset[0])
+        self.assertIs(dataset[np.int64(0)], dataset[0])
+        self.assertEqual(1, dataset.misses)
+        self.assertEqual(6, dataset.hits)
+        
+        # CHECK: invalid indices are rejected
+        with self.assertRaises(IndexError):
+            dataset[4]
+        with self.assertRaises(TypeError):
+            dataset["0"]
+    
+    def test_getitem_sequences(self):
+        dataset = kg_dataset.KgDataset("src/test/resources", sequences=True)
+        seq = kg_reader.KgReader.read_sequence("src/test/resources", "kg-seq")
+        
+        # CHECK: the dataset consists of all steps of the sequence
+        self.assertEqual(len(seq), len(dataset))
+        for idx, kg in enumerate(seq):
+            self.assertEqual(kg, dataset[idx])
+    
+    def test_estimate_delta_steps(self):
+        seq = kg_reader.KgReader.read_sequence("src/test/resources", "kg-seq")
+        with tempfile.TemporaryDirectory() as target_dir:
+            kg_writer.KgWriter.write_sequence(seq, target_dir, "kg-seq", keyframe_interval=len(seq))
+            dataset = kg_dataset.KgDataset(target_dir, sequences=True)
+            dataset[0]
+            keyframe_size = dataset.cache_size
+            
+            # CHECK: delta steps are estimated by the keyframe that they are loaded from and all deltas since then
+            for idx in range(1, len(seq)):
+                dataset.clear_cache()
+                dataset[idx]
+                self.assertGreater(dataset.cache_size, keyframe_size)
+    
+    def test_max_cache_size(self):
+        dataset = kg_dataset.KgDataset(self.temp_dir.name)
+        dataset[0]
+        size = dataset.cache_size
+        dataset = kg_dataset.KgDataset(self.temp_dir.name, max_cache_size=2 * size)
+        
+        # CHECK: the least recently used graph is evicted
+        first_kg = dataset[0]
+        dataset[1]
+        self.assertIs(first_kg, dataset[0])
+        dataset[2]
+        self.assertEqual(2 * size, dataset.cache_size)
+        self.assertIs(first_kg, dataset[0])
+        self.assertEqual(3, dataset.misses)
+        dataset[1]
+        self.assertEqual(4, dataset.misses)
+    
+    def test_warm_up(self):
+        dataset = kg_dataset.KgDataset(self.temp_dir.name)
+        dataset.warm_up().join()
+        
+        # CHECK: all graphs are cached without recording any accesses
+        self.assertEqual(0, dataset.misses)
+        for idx in range(len(dataset)):
+            dataset[idx]
+        self.assertEqual(0, dataset.misses)
+        self.assertEqual(len(dataset), dataset.hits)
+        
+        # CHECK: clearing the cache resets the metrics
+        dataset.clear_cache()
+        self.assertEqual(0, dataset.hits)
+        self.assertEqual(0, dataset.cache_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import tempfile
+import unittest
+
+from concurrent import futures
+
+from reldata.data import kg_arrays
+from reldata.data import knowledge_graph
+from reldata.io import kg_loader
+from reldata.io import kg_reader
+from reldata.io import kg_writer
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class KgLoaderTest(unittest.TestCase):
+    
+    def setUp(self):
+        # store multiple copies of the test graph with different base names
+        self.kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_names = ["kg-{}".format(idx) for idx in range(5)]
+        for base_name in self.base_names:
+            kg_writer.KgWriter.write(self.kg, self.temp_dir.name, base_name)
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_iter(self):
+        # CHECK: all graphs are loaded in order
+        loader = kg_loader.KgLoader(self.temp_dir.name, prefetch=2, num_workers=2)
+        self.assertEqual(self.base_names, loader.base_names)
+        kgs = list(loader)
+        self.assertEqual(len(self.base_names), len(kgs))
+        for kg in kgs:
+            self.assertIsInstance(kg, knowledge_graph.KnowledgeGraph)
+            self.assertEqual(self.kg, kg)
+        
+        # CHECK: the loader can be iterated over repeatedly and stopped early
+        self.assertEqual(len(self.base_names), len(list(loader)))
+        self.assertEqual(self.kg, next(iter(loader)))
+    
+    def test_iter_arrays(self):
+        with futures.ProcessPoolExecutor(max_workers=2) as executor:
+            loader = kg_loader.KgLoader(self.temp_dir.name, executor=executor, as_arrays=True)
+            all_arrays = list(loader)
+        
+        # CHECK: the graphs are provided as array encodings
+        target = kg_arrays.KgArrays.from_kg(self.kg)
+        self.assertEqual(len(self.base_names), len(all_arrays))
+        for arrays in all_arrays:
+            self.assertIsInstance(arrays, kg_arrays.KgArrays)
+            self.assertEqual(target.individuals, arrays.individuals)
+            self.assertEqual(sorted(target.triples.tolist()), sorted(arrays.triples.tolist()))
+            self.assertEqual(target.memberships.tolist(), arrays.memberships.tolist())
+    
+    def test_schedule(self):
+        loader = kg_loader.KgLoader(self.temp_dir.name, shuffle=True, seed=7, num_epochs=3)
+        schedule = list(loader._schedule())
+        
+        # CHECK: every epoch provides every graph exactly once
+        self.assertEqual(3 * len(self.base_names), len(loader))
+        self.assertEqual(len(loader), len(schedule))
+        for epoch in range(3):
+            self.assertEqual(
+                    self.base_names,
+                    sorted(schedule[epoch * len(self.base_names):(epoch + 1) * len(self.base_names)])
+            )
+        
+        # CHECK: the order is reproducible
+        self.assertEqual(schedule, list(loader._schedule()))
+        self.assertEqual(
+                schedule,
+                list(kg_loader.KgLoader(self.temp_dir.name, shuffle=True, seed=7, num_epochs=3)._schedule())
+        )
+        
+        # CHECK: invalid args are rejected
+        with self.assertRaises(ValueError):
+            kg_loader.KgLoader(self.temp_dir.name, prefetch=0)
+        with self.assertRaises(ValueError):
+            kg_loader.KgLoader(self.temp_dir.name, num_epochs=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,7 @@ from reldata.io import kg_reader
 from reldata.vocab import class_type_factory as ctf
 from reldata.vocab import literal_type_factory as ltf
 from reldata.vocab import relation_type_factory as rtf
+from reldata.vocab import vocab_registry
 
 
 __author__ = "Patrick Hohenecker"
@@ -330,6 +331,26 @@ class KgReaderTest(unittest.TestCase):
                 self.assertEqual(target_ind.classes, ind.classes)
                 self.assertEqual(target_ind.literals, ind.literals)
         
+    
+    def test_read_with_vocab_registry(self):
+        # the data that will be loaded
+        input_dir = "src/test/resources"
+        base_name = "kg-seq"
+        
+        # load the same sequence with and without sharing vocabularies
+        target_seq = kg_reader.KgReader.read_sequence(input_dir, base_name)
+        registry = vocab_registry.VocabRegistry()
+        seq = kg_reader.KgReader.read_sequence(input_dir, base_name, vocab_registry=registry)
+        
+        # CHECK: the knowledge graphs were loaded correctly
+        self.assertEqual(target_seq, seq)
+        
+        # CHECK: all graphs share the same vocabulary instances
+        for kg in seq[1:]:
+            for attr in ["classes", "relations", "literals"]:
+                for a, b in zip(getattr(seq[0], attr), getattr(kg, attr)):
+                    self.assertIs(a, b)
+        self.assertEqual(3, len(registry))
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,9 +3,11 @@
 
 
 import os
+import tempfile
 import unittest
 
 from reldata import io
+from reldata.data import kg_arrays
 from reldata.io import kg_reader
 from reldata.io import kg_writer
 
@@ -82,6 +84,31 @@ class KgWriterTest(unittest.TestCase):
         os.remove(os.path.join(".", "kg-writer-test-knowledge-graph" + io.RELATIONS_PRED_EXT))
         os.remove(os.path.join(".", "kg-writer-test-knowledge-graph" + io.INDIVIDUALS_SPEC_EXT))
 
+    def test_write_arrays(self):
+        target_kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+        target_step = kg_reader.KgReader.read("src/test/resources", "kg-seq", index=1)
+        
+        with tempfile.TemporaryDirectory() as target_dir:
+            # write encoded knowledge graphs
+            kg_writer.KgWriter.write_arrays(kg_arrays.KgArrays.from_kg(target_kg), target_dir, "kg-writer-test-arrays")
+            kg_writer.KgWriter.write_arrays(kg_arrays.KgArrays.from_kg(target_step), target_dir, "seq", index=1)
+            
+            # reload written knowledge graphs
+            kg = kg_reader.KgReader.read(target_dir, "kg-writer-test-arrays")
+            step = kg_reader.KgReader.read(target_dir, "seq", index=1)
+        
+        # CHECK: knowledge graphs were written correctly
+        for target, actual in [(target_kg, kg), (target_step, step)]:
+            self.assertEqual(target, actual)
+            for ind in actual.individuals:
+                target_ind = target.individuals[ind.index]
+                self.assertEqual(target_ind.classes, ind.classes)
+                self.assertEqual(target_ind.literals, ind.literals)
+        
+        # CHECK: invalid target directories are rejected
+        with self.assertRaises(ValueError):
+            kg_writer.KgWriter.write_arrays(kg_arrays.KgArrays.from_kg(target_kg), "does-not-exist", "foo")
+    
     def test_write_sequence(self):
         # load knowledge graph sequence for testing
         # (notice, KgReader has been tested already)
@@ -118,7 +145,42 @@ class KgWriterTest(unittest.TestCase):
             os.remove(os.path.join(".", "kg-writer-test-seq" + io.RELATIONS_SPEC_EXT) + "." + str(idx))
             os.remove(os.path.join(".", "kg-writer-test-seq" + io.RELATIONS_INF_EXT) + "." + str(idx))
             os.remove(os.path.join(".", "kg-writer-test-seq" + io.RELATIONS_PRED_EXT) + "." + str(idx))
+
+    
+    def test_write_sequence_delta_encoded(self):
+        # load knowledge graph sequence for testing
+        target_seq = kg_reader.KgReader.read_sequence("src/test/resources", "kg-seq")
         
+        with tempfile.TemporaryDirectory() as target_dir:
+            # write delta-encoded sequence
+            kg_writer.KgWriter.write_sequence(target_seq, target_dir, "kg-writer-test-seq", keyframe_interval=2)
+            
+            # CHECK: only keyframes are stored in full
+            for idx in range(len(target_seq)):
+                delta_path = os.path.join(target_dir, "kg-writer-test-seq" + io.DELTA_EXT + "." + str(idx))
+                full_path = os.path.join(target_dir, "kg-writer-test-seq" + io.CLASSES_SPEC_EXT + "." + str(idx))
+                self.assertEqual(idx % 2 == 0, os.path.isfile(full_path))
+                self.assertEqual(idx % 2 == 1, os.path.isfile(delta_path))
+            
+            # reload written sequence as a whole as well as step by step
+            seq = kg_reader.KgReader.read_sequence(target_dir, "kg-writer-test-seq")
+            single_steps = [
+                    kg_reader.KgReader.read(target_dir, "kg-writer-test-seq", index=idx)
+                    for idx in range(len(target_seq))
+            ]
+            
+            # CHECK: knowledge graph sequence was written correctly
+            self.assertEqual(len(target_seq), len(seq))
+            for target_kg, kg, single_kg in zip(target_seq, seq, single_steps):
+                self.assertEqual(target_kg, kg)
+                self.assertEqual(target_kg, single_kg)
+                for ind in kg.individuals:
+                    target_ind = target_kg.individuals[ind.index]
+                    self.assertEqual(target_ind.classes, ind.classes)
+                    self.assertEqual(target_ind.literals, ind.literals)
+                    self.assertEqual(target_ind.classes, single_kg.individuals[ind.index].classes)
+                    self.assertEqual(target_ind.literals, single_kg.individuals[ind.index].literals)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+import numpy as np
+
+from reldata.data import kg_arrays
+from reldata.io import kg_reader
+from reldata.ml import batch_packer
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class BatchPackerTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.seq = kg_reader.KgReader.read_sequence("src/test/resources", "kg-seq")
+        self.kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+        self.packer = batch_packer.BatchPacker()
+    
+    def test_pack(self):
+        graphs = [self.kg, kg_arrays.KgArrays.from_kg(self.kg), self.kg]
+        batch = self.packer.pack(graphs)
+        num_individuals = len(self.kg.individuals)
+        num_triples = len(self.kg.triple_store)
+        
+        # CHECK: the boundaries are computed correctly
+        self.assertEqual(3, len(batch))
+        self.assertEqual(
+                [0, num_individuals, 2 * num_individuals, 3 * num_individuals],
+                batch.individual_offsets.tolist()
+        )
+        self.assertEqual([0, num_triples, 2 * num_triples, 3 * num_triples], batch.triple_offsets.tolist())
+        self.assertEqual([0, 1, 2], batch.graph_of(batch.individual_offsets[:-1]).tolist())
+        
+        # CHECK: the individuals of the triples are shifted
+        target = self.kg.triple_store.array()
+        for idx in range(3):
+            triples = batch.triples[idx * num_triples:(idx + 1) * num_triples]
+            self.assertEqual((target[:, 0] + idx * num_individuals).tolist(), triples[:, 0].tolist())
+            self.assertEqual(target[:, 1].tolist(), triples[:, 1].tolist())
+            self.assertEqual((target[:, 2] + idx * num_individuals).tolist(), triples[:, 2].tolist())
+        
+        # CHECK: the membership matrices are stacked
+        target = self.kg.memberships.matrices()
+        self.assertEqual(np.concatenate([target] * 3, axis=1).tolist(), batch.memberships.tolist())
+    
+    def test_reuse_buffers(self):
+        first_batch = self.packer.pack(self.seq).copy()
+        
+        # CHECK: packing a smaller batch reuses the buffers
+        second_batch = self.packer.pack(self.seq[:2])
+        self.assertTrue(np.shares_memory(second_batch.triples, self.packer.pack(self.seq[:1]).triples))
+        
+        # CHECK: copied batches are not affected
+        self.assertEqual(first_batch.triples.tolist(), self.packer.pack(self.seq).triples.tolist())
+        
+        # CHECK: empty batches are supported
+        self.assertEqual(0, len(self.packer.pack([])))
+    
+    def test_unpack(self):
+        batch = self.packer.pack(self.seq)
+        
+        # CHECK: unpacking restores the data of all graphs
+        self.assertEqual(len(self.seq), len(batch.unpack()))
+        for kg, (triples, memberships) in zip(self.seq, batch.unpack()):
+            self.assertEqual(kg.triple_store.array().tolist(), triples.tolist())
+            self.assertEqual(kg.memberships.matrices().tolist(), memberships.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+import numpy as np
+
+from reldata.data import status as st
+from reldata.data import triple_index
+from reldata.io import kg_reader
+from reldata.ml import link_prediction
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class LinkPredictionTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+        self.num_individuals = len(self.kg.individuals)
+        self.scores = np.random.RandomState(0).randint(0, 3, size=(self.num_individuals, 10, self.num_individuals))
+        self.known = {(t.subject.index, t.predicate.index, t.object.index) for t in self.kg.triples if t.positive}
+    
+    def _score(self, subjects, predicates, objects):
+        return self.scores[subjects, predicates, objects]
+    
+    def _target_rank(self, s, p, o, tail):
+        true_score = self.scores[s, p, o]
+        rank = 1.0
+        for candidate in range(self.num_individuals):
+            corrupted = (s, p, candidate) if tail else (candidate, p, o)
+            if corrupted in self.known or candidate == (o if tail else s):
+                continue
+            score = self.scores[corrupted]
+            rank += 1 if score > true_score else 0.5 if score == true_score else 0
+        return rank
+    
+    def test_evaluate(self):
+        results = link_prediction.evaluate(self.kg, self._score, ks=[1, 2])
+        targets = [
+                (t.subject.index, t.predicate.index, t.object.index)
+                for t in self.kg.triples
+                if t.positive and t.prediction
+        ]
+        ranks = np.array(
+                [self._target_rank(*t, tail=True) for t in targets] +
+                [self._target_rank(*t, tail=False) for t in targets]
+        )
+        self.assertLess(0, len(targets))
+        
+        # CHECK: the metrics are computed correctly
+        self.assertEqual({"mrr", "mr", "hits@1", "hits@2"}, set(results))
+        self.assertAlmostEqual(np.mean(1 / ranks), results["mrr"])
+        self.assertAlmostEqual(np.mean(ranks), results["mr"])
+        self.assertAlmostEqual(np.mean(ranks <= 2), results["hits@2"])
+    
+    def test_filtered_ranks(self):
+        index = triple_index.TripleIndex.from_kg(self.kg, status=st.ALL)
+        test_triples = np.array(sorted(self.known))
+        
+        for side, tail in [("tail", True), ("head", False)]:
+            ranks = link_prediction.filtered_ranks(
+                    test_triples,
+                    self._score,
+                    index,
+                    self.num_individuals,
+                    side=side,
+                    batch_size=2
+            )
+            
+            # CHECK: the ranks are computed correctly
+            self.assertEqual([self._target_rank(*t, tail=tail) for t in test_triples.tolist()], ranks.tolist())
+        
+        # CHECK: invalid sides are rejected
+        with self.assertRaises(ValueError):
+            link_prediction.filtered_ranks(test_triples, self._score, index, self.num_individuals, side="foo")
+    
+    def test_metrics(self):
+        ranks = np.array([1, 2, 4, 10])
+        
+        # CHECK: the metrics are computed correctly
+        self.assertAlmostEqual((1 + 1 / 2 + 1 / 4 + 1 / 10) / 4, link_prediction.mean_reciprocal_rank(ranks))
+        self.assertAlmostEqual(0.5, link_prediction.hits_at_k(ranks, 3))
+        self.assertEqual(0.0, link_prediction.hits_at_k([], 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
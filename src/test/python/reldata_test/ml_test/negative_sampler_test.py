@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+
+import threading
+import unittest
+
+import numpy as np
+
+from reldata.data import kg_arrays
+from reldata.io import kg_reader
+from reldata.ml import negative_sampler
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class NegativeSamplerTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+        self.known = {(t.subject.index, t.predicate.index, t.object.index) for t in self.kg.triples if t.positive}
+        self.negatives = {
+                (t.subject.index, t.predicate.index, t.object.index)
+                for t in self.kg.triples
+                if not t.positive and not t.inferred and not t.prediction
+        }
+    
+    def test_corrupt(self):
+        for mode in negative_sampler.NegativeSampler.MODES:
+            sampler = negative_sampler.NegativeSampler.from_kg(self.kg, mode=mode, seed=0)
+            positives = sampler.positives
+            samples = sampler.corrupt(positives, num_negatives=5)
+            
+            # CHECK: every triple is corrupted the requested number of times
+            self.assertEqual((5 * len(positives), 3), samples.shape)
+            originals = np.repeat(positives, 5, axis=0)
+            self.assertTrue(np.all(samples[:, 1] == originals[:, 1]))
+            self.assertTrue(np.all((samples[:, 0] == originals[:, 0]) | (samples[:, 2] == originals[:, 2])))
+            
+            # CHECK: none of the samples is a known positive triple
+            self.assertFalse(self.known & set(map(tuple, samples.tolist())))
+        
+        # CHECK: invalid args are rejected
+        with self.assertRaises(ValueError):
+            negative_sampler.NegativeSampler.from_kg(self.kg, mode="foo")
+        with self.assertRaises(ValueError):
+            negative_sampler.NegativeSampler.from_kg(self.kg, explicit_rate=2)
+    
+    def test_explicit_negatives(self):
+        sampler = negative_sampler.NegativeSampler.from_kg(self.kg, explicit_rate=1.0, seed=0)
+        samples = sampler.corrupt(sampler.positives, num_negatives=3)
+        
+        # CHECK: all samples are taken from the explicit negatives
+        self.assertLess(0, len(self.negatives))
+        self.assertTrue(set(map(tuple, samples.tolist())) <= self.negatives)
+    
+    def test_sample(self):
+        arrays = kg_arrays.KgArrays.from_kg(self.kg)
+        first = negative_sampler.NegativeSampler.from_kg(arrays, mode="bernoulli", seed=1)
+        second = negative_sampler.NegativeSampler.from_kg(self.kg, mode="bernoulli", seed=1)
+        positives, samples = first.sample(20, num_negatives=2)
+        
+        # CHECK: the same seed yields the same samples, both for graphs and for arrays
+        expected_positives, expected_samples = second.sample(20, num_negatives=2)
+        self.assertTrue(np.array_equal(expected_positives, positives))
+        self.assertTrue(np.array_equal(expected_samples, samples))
+        
+        # CHECK: positives are facts of the graph
+        self.assertTrue(set(map(tuple, positives.tolist())) <= self.known)
+        
+        # CHECK: the sampler can be used by multiple threads at the same time
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(first.sample(100)[1])) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(4, len(results))
+        for r in results:
+            self.assertFalse(self.known & set(map(tuple, r.tolist())))
+
+
+if __name__ == "__main__":
+    unittest.main()
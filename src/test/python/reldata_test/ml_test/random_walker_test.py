@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from reldata.data import data_context as dc
+from reldata.data import individual_factory
+from reldata.data import kg_arrays
+from reldata.data import knowledge_graph
+from reldata.data import triple
+from reldata.io import kg_reader
+from reldata.ml import random_walker
+from reldata.vocab import relation_type_factory as rtf
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class RandomWalkerTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.kg = kg_reader.KgReader.read("src/test/resources", "test-kg")
+        self.num_relations = len(self.kg.relations)
+        self.edges = {
+                (t.subject.index, t.predicate.index, t.object.index)
+                for t in self.kg.triples
+                if t.positive and not t.inferred and not t.prediction
+        }
+        self.inverse_edges = self.edges | {(o, p + self.num_relations, s) for s, p, o in self.edges}
+        self.starts = np.repeat(np.arange(len(self.kg.individuals)), 20)
+    
+    def _check_walks(self, individuals, relations, edges):
+        for inds, rels in zip(individuals.tolist(), relations.tolist()):
+            for step, r in enumerate(rels):
+                if r < 0:
+                    self.assertEqual(-1, inds[step + 1])
+                    continue
+                self.assertIn((inds[step], r, inds[step + 1]), edges)
+            
+            # CHECK: walks only stop at individuals without outgoing edges
+            length = rels.index(-1) if -1 in rels else len(rels)
+            if length < len(rels):
+                self.assertFalse(any(s == inds[length] for s, _, _ in edges))
+    
+    def test_walk(self):
+        walker = random_walker.RandomWalker(self.kg)
+        individuals, relations = walker.walk(self.starts, 5, seed=0)
+        
+        # CHECK: walks follow existing edges only
+        self.assertEqual((len(self.starts), 6), individuals.shape)
+        self.assertEqual((len(self.starts), 5), relations.shape)
+        self.assertEqual(self.starts.tolist(), individuals[:, 0].tolist())
+        self.assertEqual(len(self.edges), walker.num_edges)
+        self._check_walks(individuals, relations, self.edges)
+        
+        # CHECK: the same seed yields the same walks
+        other_individuals, other_relations = walker.walk(self.starts, 5, seed=0)
+        self.assertTrue(np.array_equal(individuals, other_individuals))
+        self.assertTrue(np.array_equal(relations, other_relations))
+        
+        # CHECK: invalid args are rejected
+        with self.assertRaises(ValueError):
+            walker.walk([len(self.kg.individuals)], 5)
+        with self.assertRaises(ValueError):
+            walker.walk([0], -1)
+    
+    def test_walk_inverse_edges(self):
+        walker = random_walker.RandomWalker(kg_arrays.KgArrays.from_kg(self.kg), inverse_edges=True)
+        individuals, relations = walker.walk(self.starts, 8, seed=1)
+        
+        # CHECK: walks may follow edges in both directions
+        self.assertEqual(2 * len(self.edges), walker.num_edges)
+        self._check_walks(individuals, relations, self.inverse_edges)
+        self.assertTrue(np.any(relations >= self.num_relations))
+    
+    @dc.new_context
+    def test_walk_relation_gaps(self):
+        # create a graph that uses relations 0 and 2, but not 1
+        kg = knowledge_graph.KnowledgeGraph()
+        rels = [rtf.RelationTypeFactory.create_relation("relation-{}".format(i)) for i in range(3)]
+        inds = individual_factory.IndividualFactory.create_individuals(["individual-{}".format(i) for i in range(3)])
+        kg.triples.add_all(
+                [triple.Triple(inds[0], rels[0], inds[1], True), triple.Triple(inds[1], rels[2], inds[2], True)]
+        )
+        self.assertEqual(2, len(kg.relations))
+        walker = random_walker.RandomWalker(kg, inverse_edges=True, relation_weights=[1.0, 1.0, 0.0])
+        individuals, relations = walker.walk(np.repeat(np.arange(3), 20), 4, seed=0)
+        
+        # CHECK: inverse edges are labeled with labels that do not collide with other relations
+        self.assertEqual(3, walker.num_relations)
+        self._check_walks(individuals, relations, {(0, 0, 1), (1, 3, 0)})  # -> relation 2 has weight 0
+        
+        # CHECK: weights have to be provided for all relation indices
+        with self.assertRaises(ValueError):
+            random_walker.RandomWalker(kg, relation_weights=[1.0, 1.0])
+    
+    def test_walk_relation_weights(self):
+        used_relations = sorted({p for _, p, _ in self.edges})
+        excluded = used_relations[0]
+        weights = np.ones(self.num_relations)
+        weights[excluded] = 0
+        walker = random_walker.RandomWalker(self.kg, inverse_edges=True, relation_weights=weights)
+        individuals, relations = walker.walk(self.starts, 8, seed=2)
+        
+        # CHECK: relations with zero weight are never followed
+        edges = {(s, p, o) for s, p, o in self.inverse_edges if p % self.num_relations != excluded}
+        for inds, rels in zip(individuals.tolist(), relations.tolist()):
+            for step, r in enumerate(rels):
+                if r >= 0:
+                    self.assertIn((inds[step], r, inds[step + 1]), edges)
+        
+        # CHECK: invalid weights are rejected
+        with self.assertRaises(ValueError):
+            random_walker.RandomWalker(self.kg, relation_weights=[1.0])
+        with self.assertRaises(ValueError):
+            random_walker.RandomWalker(self.kg, relation_weights=-weights)
+    
+    def test_write_walks(self):
+        walker = random_walker.RandomWalker(self.kg, inverse_edges=True)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            thread_path = os.path.join(tmp_dir, "threads.txt")
+            process_path = os.path.join(tmp_dir, "processes.txt")
+            num_walks = walker.write_walks(
+                    thread_path,
+                    4,
+                    walks_per_individual=3,
+                    batch_size=5,
+                    seed=0,
+                    num_workers=3,
+                    processes=False
+            )
+            walker.write_walks(
+                    process_path,
+                    4,
+                    walks_per_individual=3,
+                    batch_size=5,
+                    seed=0,
+                    num_workers=2
+            )
+            with open(thread_path) as f:
+                thread_lines = f.read().splitlines()
+            with open(process_path) as f:
+                process_lines = f.read().splitlines()
+        
+        # CHECK: all walks are written, and the output does not depend on the workers
+        self.assertEqual(3 * len(self.kg.individuals), num_walks)
+        self.assertEqual(num_walks, len(thread_lines))
+        self.assertEqual(thread_lines, process_lines)
+        
+        # CHECK: every line alternates between individuals and relations
+        for line in thread_lines:
+            tokens = [int(t) for t in line.split()]
+            self.assertEqual(1, len(tokens) % 2)
+            for i in range(0, len(tokens) - 2, 2):
+                self.assertIn(tuple(tokens[i:i + 3]), self.inverse_edges)
+
+
+if __name__ == "__main__":
+    unittest.main()
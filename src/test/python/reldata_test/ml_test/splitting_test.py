@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+import numpy as np
+
+from reldata.data import kg_arrays
+from reldata.data import status as st
+from reldata.ml import splitting
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017, Patrick Hohenecker\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2017.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SplittingTest(unittest.TestCase):
+    
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        num_individuals = 50
+        num_triples = 1000
+        triples = np.stack(
+                [
+                        rng.randint(0, num_individuals, size=num_triples),
+                        rng.randint(0, 4, size=num_triples),
+                        rng.randint(0, num_individuals, size=num_triples),
+                        rng.randint(0, 2, size=num_triples),
+                        rng.choice([st.FACT, st.FACT, st.INFERRED, st.PREDICTION], size=num_triples)
+                ],
+                axis=1
+        )
+        triples = np.unique(triples, axis=0)
+        memberships = np.array(
+                [
+                        [ind, cls, 1 if (ind + cls) % 3 else -1, st.FACT]
+                        for ind in range(num_individuals)
+                        for cls in range(3)
+                ]
+        )
+        self.arrays = kg_arrays.KgArrays(
+                ["c{}".format(i) for i in range(3)],
+                ["r{}".format(i) for i in range(4)],
+                ["l0"],
+                ["i{}".format(i) for i in range(num_individuals)],
+                triples,
+                memberships,
+                [(0, 0, "foo", st.FACT)]
+        )
+        self.facts = set(np.flatnonzero(triples[:, 4] == st.FACT).tolist())
+    
+    def _check_partition(self, parts, expected_rows):
+        all_rows = np.concatenate(parts).tolist()
+        self.assertEqual(len(all_rows), len(set(all_rows)))
+        self.assertEqual(expected_rows, set(all_rows))
+        for p in parts:
+            self.assertEqual(sorted(p.tolist()), p.tolist())
+    
+    def test_select(self):
+        train, valid = splitting.split_triples(self.arrays, [0.8, 0.2], seed=0)
+        memberships = splitting.split_memberships(self.arrays, [0.5, 0.5], seed=0)
+        selected = splitting.select(
+                self.arrays,
+                triples=train,
+                memberships=memberships[0],
+                target_triples=valid,
+                target_memberships=memberships[1]
+        )
+        
+        # CHECK: the selected rows are kept, and the targets are turned into predictions
+        expected_triples = self.arrays.triples[valid].copy()
+        expected_triples[:, 4] = st.PREDICTION
+        self.assertEqual(
+                self.arrays.triples[train].tolist() + expected_triples.tolist(),
+                selected.triples.tolist()
+        )
+        self.assertEqual(len(self.arrays.memberships), len(selected.memberships))
+        self.assertEqual(len(memberships[1]), np.count_nonzero(selected.memberships[:, 3] == st.PREDICTION))
+        self.assertEqual(self.arrays.individuals, selected.individuals)
+        self.assertEqual(self.arrays.literal_values, selected.literal_values)
+        
+        # CHECK: by default, all rows are kept
+        self.assertTrue(np.array_equal(self.arrays.triples, splitting.select(self.arrays).triples))
+    
+    def test_split_memberships(self):
+        parts = splitting.split_memberships(self.arrays, [2, 1, 1], seed=0)
+        
+        # CHECK: memberships are split per class according to the ratios
+        self._check_partition(parts, set(range(len(self.arrays.memberships))))
+        for cls in range(3):
+            sizes = [np.count_nonzero(self.arrays.memberships[p, 1] == cls) for p in parts]
+            self.assertEqual([25, 12, 13], sizes)
+    
+    def test_split_triples(self):
+        parts = splitting.split_triples(self.arrays, [0.8, 0.1, 0.1], seed=0)
+        
+        # CHECK: all facts are split, and the ratios hold for every relation
+        self._check_partition(parts, self.facts)
+        for rel in range(4):
+            sizes = np.array([np.count_nonzero(self.arrays.triples[p, 1] == rel) for p in parts])
+            self.assertTrue(np.all(np.abs(sizes - sizes.sum() * np.array([0.8, 0.1, 0.1])) <= 1))
+        
+        # CHECK: the same seed yields the same split
+        other_parts = splitting.split_triples(self.arrays, [0.8, 0.1, 0.1], seed=0)
+        self.assertEqual([p.tolist() for p in parts], [p.tolist() for p in other_parts])
+        
+        # CHECK: the polarity of the split triples may be restricted
+        parts = splitting.split_triples(self.arrays, [0.5, 0.5], positive=True, stratify=False, seed=1)
+        self._check_partition(parts, {r for r in self.facts if self.arrays.triples[r, 3] == 1})
+        
+        # CHECK: invalid args are rejected
+        with self.assertRaises(ValueError):
+            splitting.split_triples(self.arrays, [0.8, -0.2])
+        with self.assertRaises(ValueError):
+            splitting.split_triples(self.arrays, [0.8, 0.2], constraint="foo")
+    
+    def test_split_triples_inductive(self):
+        parts = splitting.split_triples(self.arrays, [0.6, 0.4], constraint="inductive", seed=0)
+        individuals = [
+                set(self.arrays.triples[p, 0].tolist()) | set(self.arrays.triples[p, 2].tolist())
+                for p in parts
+        ]
+        
+        # CHECK: the parts do not share any individuals
+        self.assertFalse(individuals[0] & individuals[1])
+        self.assertTrue(set(np.concatenate(parts).tolist()) <= self.facts)
+    
+    def test_split_triples_transductive(self):
+        parts = splitting.split_triples(self.arrays, [0.1, 0.45, 0.45], constraint="transductive", seed=0)
+        train = set(self.arrays.triples[parts[0], 0].tolist()) | set(self.arrays.triples[parts[0], 2].tolist())
+        
+        # CHECK: all facts are split, and every individual occurs in the training set
+        self._check_partition(parts, self.facts)
+        for p in parts[1:]:
+            self.assertTrue(set(self.arrays.triples[p, 0].tolist()) <= train)
+            self.assertTrue(set(self.arrays.triples[p, 2].tolist()) <= train)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,10 @@
 
 import unittest
 
+import numpy as np
+
 from reldata.util import ordered_set
+from reldata.util import set_observer
 
 
 __author__ = "Patrick Hohenecker"
@@ -87,6 +90,30 @@ class OrderedSetTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             test_set.add_all([999, "1000"])
     
+    def test_bulk_update(self):
+        test_set = ordered_set.OrderedSet(str, lambda x: int(x))
+        test_set.add_all(["1", "2"])
+        obs = RecordingObserver()
+        test_set.add_observer(obs)
+        
+        with test_set.bulk_update():
+            test_set.add("3")
+            test_set.add("4")
+            test_set.remove("4")
+            test_set.remove("1")
+            
+            # CHECK: the set is modified immediately, but observers are not notified yet
+            self.assertEqual(["2", "3"], list(test_set))
+            self.assertEqual([], obs.events)
+        
+        # CHECK: observers are notified in batches, and changes that cancel each other out are coalesced
+        self.assertEqual([("removed", ["1"]), ("added", ["3"])], obs.events)
+        
+        # CHECK: add_all notifies observers in a single batch
+        obs.events.clear()
+        test_set.add_all(["5", "6"])
+        self.assertEqual([("added", ["5", "6"])], obs.events)
+    
     def test_contains(self):
         test_set = ordered_set.OrderedSet(str, lambda x: int(x))
         test_set.add_all(["1", "3", "5", "7"])
@@ -147,6 +174,37 @@ class OrderedSetTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             ordered_set.OrderedSet(str, lambda x: int(x), data=[1, 3, 5])
     
+    def test_names(self):
+        test_set = ordered_set.OrderedSet(str, lambda x: int(x), name_func=lambda x: "name-" + x)
+        test_set.add_all(["1", "3", "5", "7"])
+        
+        # CHECK: elements can be looked up by name
+        self.assertEqual("3", test_set.get_by_name("name-3"))
+        self.assertEqual(7, test_set.index_of("name-7"))
+        self.assertTrue(test_set.has_name("name-5"))
+        self.assertFalse(test_set.has_name("name-4"))
+        with self.assertRaises(KeyError):
+            test_set.get_by_name("name-4")
+        
+        # CHECK: names are translated into indices in bulk
+        self.assertEqual([7, 1, 3], test_set.indices_of(["name-7", "name-1", "name-3"]).tolist())
+        self.assertEqual(
+                [[1, -1], [5, 3]],
+                test_set.indices_of(np.array([["name-1", "name-0"], ["name-5", "name-3"]]), default=-1).tolist()
+        )
+        with self.assertRaises(KeyError):
+            test_set.indices_of(["name-1", "name-0"])
+        
+        # CHECK: the name index is updated when elements are added or removed
+        test_set.remove("3")
+        test_set.add("4")
+        self.assertFalse(test_set.has_name("name-3"))
+        self.assertEqual([4, -1], test_set.indices_of(["name-4", "name-3"], default=-1).tolist())
+        
+        # CHECK: sets without name_func do not support names
+        with self.assertRaises(ValueError):
+            ordered_set.OrderedSet(str, lambda x: int(x)).get_by_name("name-1")
+    
     def test_remove(self):
         test_set = ordered_set.OrderedSet(str, lambda x: int(x))
         test_set.add_all(["1", "3", "5", "7"])
@@ -174,5 +232,23 @@ class OrderedSetTest(unittest.TestCase):
             test_set.remove(["1", "2"])
 
 
+class RecordingObserver(set_observer.SetObserver):
+    
+    def __init__(self):
+        self.events = []
+    
+    def element_added(self, elem) -> None:
+        self.events.append(("added", [elem]))
+    
+    def element_removed(self, elem) -> None:
+        self.events.append(("removed", [elem]))
+    
+    def elements_added(self, elements) -> None:
+        self.events.append(("added", list(elements)))
+    
+    def elements_removed(self, elements) -> None:
+        self.events.append(("removed", list(elements)))
+
+
 if __name__ == "__main__":
     unittest.main()